@@ -0,0 +1,426 @@
+"""
+API HTTP de solo lectura sobre el último snapshot publicado.
+
+Sirve los mismos datos que muestra el dashboard sin correr Streamlit: el
+roster, los resultados del Buscador, sus conteos por Elemento, Arma y
+Región y la tabla cruzada de Combinaciones. Lee el almacén con el mismo
+SnapshotReader que load_data() en dash.py, así que siempre responde con el
+snapshot que ve la app.
+
+Cada respuesta lleva un ETag con la versión del snapshot: un cliente que
+consulta seguido manda If-None-Match y, mientras no se publique una versión
+nueva, recibe 304 sin cuerpo y sin que se calcule nada. Las respuestas se
+comprimen con gzip si el cliente lo acepta y quedan guardadas hasta que
+cambia el snapshot.
+
+Rutas (GET):
+    /roster          filas del roster (offset, limit)
+    /search          filas del Buscador: elemento, arma, region (repetibles
+                     o separados por comas), nombre, offset, limit
+    /counts          personajes por valor de column (Elemento, Arma o Región)
+                     entre los resultados de la búsqueda (mismos filtros)
+    /combinations    tabla cruzada Elemento-Arma
+    /export          las filas de /search como archivo (format=parquet|arrow|csv),
+                     enviado por bloques a medida que se escribe (ver export.py)
+Todas aceptan juego; las demás, format=json|arrow (o Accept: application/vnd.apache.arrow.stream).
+
+Uso:
+    python api.py --port 8502
+    curl 'localhost:8502/search?elemento=Pyro&region=Liyue'
+    curl -H 'Accept: application/vnd.apache.arrow.stream' localhost:8502/roster -o roster.arrows
+    curl 'localhost:8502/export?format=parquet&region=Inazuma' -o inazuma.parquet
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import threading
+import traceback
+import zlib
+from collections import OrderedDict
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from export import FORMATOS, export_chunks, file_name
+from metrics import PUERTO, get_metrics, start_http_server
+from refresh import SnapshotReader
+from snapshot_store import SNAPSHOT_PATH, SnapshotStore
+from stats import buscar, buscar_nombre, conteo_seleccion, tabla_cruzada
+
+# -------------------- CONFIGURACIÓN --------------------
+PUERTO_API = 8502
+
+# Memoria máxima de las respuestas ya serializadas (y comprimidas)
+MAX_BYTES = int(os.environ.get("GENSHIN_API_CACHE_MB", "32")) * 1024 * 1024
+
+# Por debajo de este tamaño gzip no ahorra lo que cuesta
+GZIP_MINIMO = 1024
+
+JSON = "application/json"
+ARROW = "application/vnd.apache.arrow.stream"
+
+# Parámetros del Buscador y la columna que filtra cada uno
+FILTROS = {"elemento": "Elemento", "arma": "Arma", "region": "Región"}
+
+# Cantidad de resultados de la búsqueda por nombre, como en la pestaña
+LIMITE_NOMBRE = 50
+
+
+class ApiError(Exception):
+    """
+    Pedido inválido: se responde con el estado y el mensaje en JSON
+    """
+
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+# -------------------- CONSULTAS --------------------
+def _valores(params, nombre):
+    """
+    Valores de un parámetro repetible, también separados por comas
+    """
+    return [v.strip() for valor in params.get(nombre, []) for v in valor.split(",") if v.strip()]
+
+
+def _entero(params, nombre, defecto=None):
+    valor = params.get(nombre, [None])[-1]
+    if valor is None:
+        return defecto
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{nombre} debe ser un entero") from None
+    if numero < 0:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{nombre} no puede ser negativo")
+    return numero
+
+
+def _recortar(filas, params):
+    offset = _entero(params, "offset", 0)
+    limit = _entero(params, "limit")
+    return filas[offset:None if limit is None else offset + limit]
+
+
+def _filas(snapshot, filas):
+    return snapshot.df.iloc[filas].reset_index(drop=True)
+
+
+def _busqueda(snapshot, params):
+    """
+    Filas (posiciones de df) y bitset de la búsqueda, como en la pestaña Buscador
+    """
+    indice = snapshot.index
+    seleccion = buscar(indice, *(_valores(params, nombre) for nombre in FILTROS))
+    nombre = params.get("nombre", [""])[-1].strip()
+    if nombre:
+        return buscar_nombre(snapshot.names, indice, seleccion, nombre, LIMITE_NOMBRE)
+    return indice.filas(seleccion), seleccion
+
+
+def consulta_roster(snapshot, params):
+    filas = np.arange(len(snapshot.df))
+    return {"total": len(filas)}, _filas(snapshot, _recortar(filas, params))
+
+
+def consulta_search(snapshot, params):
+    filas, _ = _busqueda(snapshot, params)
+    return {"total": len(filas)}, _filas(snapshot, _recortar(filas, params))
+
+
+def consulta_counts(snapshot, params):
+    columna = params.get("column", ["Elemento"])[-1]
+    if columna not in FILTROS.values():
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"column debe ser una de: {', '.join(FILTROS.values())}")
+    filas, seleccion = _busqueda(snapshot, params)
+    return {"total": len(filas)}, conteo_seleccion(snapshot.index, seleccion, columna)
+
+
+def consulta_combinations(snapshot, params):
+    tabla = tabla_cruzada(snapshot.cube)
+    tabla.columns = tabla.columns.astype(str)
+    return {"total": int(tabla.to_numpy().sum())}, tabla.reset_index()
+
+
+CONSULTAS = {
+    "/roster": consulta_roster,
+    "/search": consulta_search,
+    "/counts": consulta_counts,
+    "/combinations": consulta_combinations,
+}
+EXPORT = "/export"
+
+
+# -------------------- SERIALIZACIÓN --------------------
+def a_json(meta, tabla):
+    """
+    {meta..., "rows": [...]} con las filas en formato registros (nulos como null)
+    """
+    cabecera = json.dumps(meta, ensure_ascii=False)
+    filas = tabla.to_json(orient="records", force_ascii=False)
+    return f'{cabecera[:-1]}, "rows": {filas}}}'.encode("utf-8")
+
+
+def a_arrow(meta, tabla):
+    """
+    Stream IPC de Arrow con la tabla (las categóricas quedan como diccionario)
+    y meta en los metadatos del esquema. pyarrow llega como dependencia de streamlit.
+    """
+    import pyarrow as pa
+
+    tabla = pa.Table.from_pandas(tabla, preserve_index=False)
+    tabla = tabla.replace_schema_metadata({**(tabla.schema.metadata or {}), b"genshin": json.dumps(meta).encode()})
+    destino = pa.BufferOutputStream()
+    with pa.ipc.new_stream(destino, tabla.schema) as escritor:
+        escritor.write_table(tabla)
+    return destino.getvalue().to_pybytes()
+
+
+def formato(params, accept):
+    """
+    Formato pedido: el parámetro format o, si no está, la cabecera Accept
+    """
+    pedido = params.get("format", [None])[-1]
+    if pedido is None:
+        return "arrow" if ARROW in (accept or "") else "json"
+    if pedido not in ("json", "arrow"):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "format debe ser json o arrow")
+    return pedido
+
+
+def etag(snapshot, formato):
+    """
+    Validador de la respuesta: cambia con la versión de cualquier juego del
+    snapshot. Es débil porque el cuerpo puede ir comprimido o no.
+    """
+    versiones = ".".join(map(str, snapshot.versiones or (snapshot.version,)))
+    return f'W/"{snapshot.juego or "all"}-{versiones}-{formato}"'
+
+
+def coincide(if_none_match, valor):
+    """
+    Comparación débil de If-None-Match con el ETag (RFC 9110)
+    """
+    if not if_none_match:
+        return False
+    etiquetas = [e.strip().removeprefix("W/") for e in if_none_match.split(",")]
+    return "*" in etiquetas or valor.removeprefix("W/") in etiquetas
+
+
+def acepta_gzip(accept_encoding):
+    for codificacion in (accept_encoding or "").split(","):
+        nombre, _, parametros = codificacion.strip().partition(";")
+        if nombre.strip().lower() in ("gzip", "*"):
+            return parametros.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+class ResponseCache:
+    """
+    Cuerpos ya serializados (y comprimidos) con su Content-Encoding
+    (None si van sin comprimir), compartidos por todos los
+    clientes. La clave incluye el ETag, así que una versión nueva del
+    snapshot nunca reutiliza respuestas viejas; estas se van descartando
+    (las usadas hace más tiempo) cuando se supera max_bytes.
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._cuerpos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener(self, clave, construir):
+        with self._lock:
+            if clave in self._cuerpos:
+                self._cuerpos.move_to_end(clave)
+                return self._cuerpos[clave]
+
+        cuerpo = construir()
+
+        with self._lock:
+            if clave not in self._cuerpos:
+                self._cuerpos[clave] = cuerpo
+                self.bytes += len(cuerpo[0])
+            while self.bytes > self.max_bytes and len(self._cuerpos) > 1:
+                _, (descartado, _) = self._cuerpos.popitem(last=False)
+                self.bytes -= len(descartado)
+        return cuerpo
+
+
+# -------------------- EXPORTACIÓN --------------------
+def _gzip(bloques):
+    compresor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for bloque in bloques:
+        comprimido = compresor.compress(bloque)
+        if comprimido:
+            yield comprimido
+    yield compresor.flush()
+
+
+def _medido(bloques):
+    with get_metrics().medir("api", endpoint=EXPORT):
+        yield from bloques
+
+
+def exportar(snapshot, params, cabeceras):
+    """
+    (estado, cabeceras, bloques) de /export: las filas de /search (sin
+    offset ni limit) en el formato pedido. Los bloques se generan mientras
+    se envían, así que la memoria no depende de cuántas filas se exporten.
+    """
+    tipo = params.get("format", ["parquet"])[-1]
+    if tipo not in FORMATOS:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"format debe ser uno de: {', '.join(FORMATOS)}")
+    validador = etag(snapshot, tipo)
+    respuesta = {"ETag": validador, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if coincide(cabeceras.get("If-None-Match"), validador):
+        return HTTPStatus.NOT_MODIFIED, respuesta, b""
+
+    filas, _ = _busqueda(snapshot, params)
+    respuesta["Content-Type"] = FORMATOS[tipo].mime
+    respuesta["Content-Disposition"] = f'attachment; filename="{file_name(snapshot, "busqueda", tipo)}"'
+    bloques = export_chunks(snapshot.df, filas, tipo)
+    # Parquet ya va comprimido por columna
+    if tipo != "parquet" and acepta_gzip(cabeceras.get("Accept-Encoding")):
+        respuesta["Content-Encoding"] = "gzip"
+        bloques = _gzip(bloques)
+    return HTTPStatus.OK, respuesta, _medido(bloques)
+
+
+# -------------------- SERVIDOR --------------------
+def responder(reader, cache, url, cabeceras):
+    """
+    (estado, cabeceras, cuerpo) para un GET a url. cabeceras son las del
+    pedido; el cuerpo son bytes o, en /export, un iterable de bloques.
+    """
+    partes = urlsplit(url)
+    ruta = partes.path.rstrip("/") or partes.path
+    if ruta not in CONSULTAS and ruta != EXPORT:
+        raise ApiError(HTTPStatus.NOT_FOUND,
+                       f"Ruta desconocida: {partes.path} (rutas: {', '.join([*CONSULTAS, EXPORT])})")
+    params = parse_qs(partes.query)
+
+    snapshot = reader.current()
+    if snapshot is None:
+        raise ApiError(HTTPStatus.SERVICE_UNAVAILABLE, "Todavía no hay datos publicados")
+    juego = params.get("juego", [None])[-1]
+    if juego is not None and juego not in snapshot.juegos:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"Juego sin datos: {juego} (publicados: {', '.join(snapshot.juegos)})")
+    snapshot = snapshot.partition(juego)
+    if ruta == EXPORT:
+        return exportar(snapshot, params, cabeceras)
+    consulta = CONSULTAS[ruta]
+
+    tipo = formato(params, cabeceras.get("Accept"))
+    validador = etag(snapshot, tipo)
+    respuesta = {"ETag": validador, "Cache-Control": "no-cache", "Vary": "Accept, Accept-Encoding"}
+    if coincide(cabeceras.get("If-None-Match"), validador):
+        return HTTPStatus.NOT_MODIFIED, respuesta, b""
+
+    comprimir = acepta_gzip(cabeceras.get("Accept-Encoding"))
+    clave = (validador, ruta, tuple(sorted((k, tuple(v)) for k, v in params.items())), comprimir)
+
+    def construir():
+        with get_metrics().medir("api", endpoint=ruta):
+            meta, tabla = consulta(snapshot, params)
+            meta = {"game": snapshot.juego, "version": snapshot.version, "versions": list(snapshot.versiones), **meta}
+            cuerpo = a_arrow(meta, tabla) if tipo == "arrow" else a_json(meta, tabla)
+        if comprimir and len(cuerpo) >= GZIP_MINIMO:
+            return gzip.compress(cuerpo, compresslevel=6, mtime=0), "gzip"
+        return cuerpo, None
+
+    cuerpo, codificacion = cache.obtener(clave, construir)
+    respuesta["Content-Type"] = ARROW if tipo == "arrow" else f"{JSON}; charset=utf-8"
+    if codificacion:
+        respuesta["Content-Encoding"] = codificacion
+    return HTTPStatus.OK, respuesta, cuerpo
+
+
+def make_server(reader, port=PUERTO_API, host="127.0.0.1", cache=None):
+    """
+    Servidor HTTP (un hilo por pedido) de la API sobre el snapshot de reader
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    cache = cache or ResponseCache()
+
+    class ApiHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            try:
+                estado, cabeceras, cuerpo = responder(reader, cache, self.path, self.headers)
+            except ApiError as e:
+                self._enviar_error(e.estado, str(e))
+                return
+            except Exception:
+                print(f"Error en GET {self.path}:", file=sys.stderr)
+                traceback.print_exc()
+                self._enviar_error(HTTPStatus.INTERNAL_SERVER_ERROR, "Error interno del servidor")
+                return
+            self.send_response(estado)
+            for nombre, valor in cabeceras.items():
+                self.send_header(nombre, valor)
+            if not isinstance(cuerpo, bytes):
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for bloque in cuerpo:
+                        if bloque:
+                            self.wfile.write(b"%X\r\n%s\r\n" % (len(bloque), bloque))
+                except Exception:
+                    # Ya se envió el 200: se corta la conexión sin el bloque
+                    # final para que el cliente vea la respuesta incompleta
+                    print(f"Error en GET {self.path} durante la respuesta:", file=sys.stderr)
+                    traceback.print_exc()
+                    self.close_connection = True
+                    return
+                self.wfile.write(b"0\r\n\r\n")
+                return
+            if estado != HTTPStatus.NOT_MODIFIED:
+                self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def _enviar_error(self, estado, mensaje):
+            cuerpo = json.dumps({"error": mensaje}, ensure_ascii=False).encode("utf-8")
+            self.send_response(estado)
+            self.send_header("Content-Type", f"{JSON}; charset=utf-8")
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer((host, port), ApiHandler)
+    httpd.daemon_threads = True
+    return httpd
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API HTTP de solo lectura sobre el último snapshot publicado")
+    parser.add_argument("--store", default=SNAPSHOT_PATH,
+                        help="Archivo SQLite de snapshots (por defecto GENSHIN_SNAPSHOT_PATH o data/roster.sqlite)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PUERTO_API)
+    args = parser.parse_args(argv)
+
+    if PUERTO:
+        start_http_server(get_metrics(), int(PUERTO))
+    httpd = make_server(SnapshotReader(SnapshotStore(args.store)), args.port, args.host)
+    print(f"API en http://{args.host}:{args.port} ({', '.join(CONSULTAS)})")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Entrada ASGI de la app: la misma que `streamlit run dash.py`, más cabeceras
+de caché de un año para las imágenes de static/img. Sus nombres llevan el
+hash del contenido (ver assets.py), así que el navegador no necesita volver
+a pedirlas nunca; Streamlit por sí solo las sirve sin Cache-Control.
+
+Uso (requiere una versión de Streamlit con st.App):
+    uvicorn app:app --host 0.0.0.0 --port 8501
+"""
+import os
+
+import streamlit as st
+from starlette.middleware import Middleware
+
+from assets import CACHE_INMUTABLE, STATIC_URL
+
+
+class CacheInmutable:
+    """
+    Middleware ASGI que agrega Cache-Control inmutable a las respuestas 200
+    de static/img, salvo manifest.json (que sí cambia)
+    """
+
+    def __init__(self, app, prefijo="/" + STATIC_URL + "/"):
+        self.app = app
+        self.prefijo = prefijo
+
+    async def __call__(self, scope, receive, send):
+        ruta = scope.get("path", "")
+        if scope["type"] != "http" or not ruta.startswith(self.prefijo) or ruta.endswith("manifest.json"):
+            await self.app(scope, receive, send)
+            return
+
+        async def enviar(mensaje):
+            if mensaje["type"] == "http.response.start" and mensaje["status"] == 200:
+                cabeceras = [(k, v) for k, v in mensaje.get("headers", []) if k.lower() != b"cache-control"]
+                mensaje = {**mensaje, "headers": cabeceras + [(b"cache-control", CACHE_INMUTABLE.encode())]}
+            await send(mensaje)
+
+        await self.app(scope, receive, enviar)
+
+
+app = st.App(os.path.join(os.path.dirname(os.path.abspath(__file__)), "dash.py"),
+             middleware=[Middleware(CacheInmutable)])
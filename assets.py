@@ -0,0 +1,357 @@
+"""
+Imágenes de la app servidas desde static/img en vez de enlazadas a otros sitios.
+
+`python assets.py` trae cada imagen de ASSETS una sola vez (de su URL o del
+repo), guarda una copia con el hash del contenido en el nombre y genera
+variantes WebP para los anchos en que se muestra y, para el mapa, una
+pirámide de mosaicos para el visor con zoom. Todo queda en static/img
+junto con manifest.json, que la app lee para armar el <img srcset>: la app
+nunca sale a internet por una imagen y funciona sin conexión. Como cada
+archivo lleva el hash de su contenido en el nombre, nunca cambia y se puede
+cachear para siempre (ver app.py).
+
+Uso:
+    python assets.py            # solo procesa lo que cambió o falta
+    python assets.py --force    # vuelve a descargar y regenerar todo
+"""
+import argparse
+import hashlib
+import html
+import json
+import math
+import os
+import shutil
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
+
+# -------------------- CONFIGURACIÓN --------------------
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(RAIZ, "static", "img")
+MANIFEST = os.path.join(ASSETS_DIR, "manifest.json")
+
+# Ruta con la que Streamlit sirve static/ (server.enableStaticServing)
+STATIC_URL = "app/static/img"
+
+CALIDAD_WEBP = 80
+
+# Cabecera para los archivos con hash: su contenido no cambia nunca
+CACHE_INMUTABLE = "public, max-age=31536000, immutable"
+
+
+@dataclass(frozen=True)
+class Asset:
+    """
+    Una imagen de la app: de dónde sale (URL o archivo del repo), los anchos
+    en píxeles de sus variantes, el texto alternativo y, si se muestra con
+    zoom, el lado en píxeles de los mosaicos de su pirámide (ver build_tiles)
+    """
+    source: str
+    widths: tuple
+    alt: str
+    tile_size: int = 0
+
+
+# Anchos: la columna ancha de Inicio ocupa ~2/3 de la página y la angosta ~1/3,
+# en pantallas comunes y de doble densidad
+ASSETS = {
+    "naciones": Asset(
+        "https://pbs.twimg.com/media/G15OmALbAAA5jJk?format=jpg&name=medium",
+        (640, 960, 1280), "Naciones en Teyvat"),
+    "reacciones": Asset(
+        "https://theartofgaming.es/wp-content/uploads/2020/10/genshin-impact-reacciones-elementales.jpg",
+        (640, 960, 1280), "Reacciones elementales"),
+    "heroes": Asset(
+        "https://preview.redd.it/if-a-picture-can-help-people-traverse-through-time-v0-0kpiw2vftmrf1.jpeg"
+        "?width=1080&crop=smart&auto=webp&s=de2e0bb1671503eb326b22ff53445ac072194afe",
+        (640, 960, 1280), "Personajes de Genshin Impact"),
+    "version_6": Asset(
+        "https://oyster.ignimgs.com/mediawiki/apis.ign.com/genshin-impact/9/97/6.0_Header.jpg",
+        (640, 960, 1280), "Versión 6.0"),
+    "mapa_teyvat": Asset("teyvat_map.png", (480, 960), "Mapa de Teyvat", tile_size=256),
+}
+
+
+# -------------------- LECTURA (APP) --------------------
+@lru_cache(maxsize=4)
+def _leer_manifest(modificado):
+    with open(MANIFEST, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def manifest():
+    """
+    Contenido de manifest.json ({} si todavía no se generaron los assets).
+    Se relee solo si el archivo cambió.
+    """
+    try:
+        return _leer_manifest(os.path.getmtime(MANIFEST))
+    except FileNotFoundError:
+        return {}
+
+
+def missing():
+    """
+    Assets sin generar o con alguna variante que falta en static/img
+    """
+    entradas = manifest()
+    return [
+        nombre for nombre in ASSETS
+        if nombre not in entradas
+        or not all(os.path.exists(os.path.join(ASSETS_DIR, v["file"])) for v in entradas[nombre]["variants"])
+    ]
+
+
+def _figura(src, alt, caption, atributos=""):
+    pie = (f'<figcaption style="text-align: center; font-size: 14px; opacity: 0.6;">'
+           f'{html.escape(caption)}</figcaption>') if caption else ""
+    return (
+        f'<figure style="margin: 0 0 1rem 0;">'
+        f'<img src="{html.escape(src)}" {atributos}loading="lazy" decoding="async" '
+        f'alt="{html.escape(alt)}" style="width: 100%; height: auto;">'
+        f'{pie}</figure>'
+    )
+
+
+def _avisar_faltante(nombre):
+    # Una vez por asset y proceso, no en cada rerun
+    if nombre not in _avisados:
+        _avisados.add(nombre)
+        print(f"assets: {nombre} no está generado en static/img; "
+              f"corre `python assets.py` o `python publish.py`", file=sys.stderr)
+
+
+_avisados = set()
+
+
+def image_html(nombre, caption=None, sizes="100vw"):
+    """
+    <figure> con un <img srcset> de las variantes del asset (el navegador
+    elige la que corresponde a su ancho), o None si no se generaron. Nunca
+    enlaza la URL de origen: la app no sale a internet por una imagen.
+    """
+    if nombre in missing():
+        _avisar_faltante(nombre)
+        return None
+    entrada = manifest()[nombre]
+    variantes = entrada["variants"]
+    srcset = ", ".join(f"{STATIC_URL}/{v['file']} {v['width']}w" for v in variantes)
+    menor = variantes[0]
+    return _figura(f"{STATIC_URL}/{menor['file']}", entrada["alt"], caption,
+                   f'srcset="{srcset}" sizes="{sizes}" width="{menor["width"]}" height="{menor["height"]}" ')
+
+
+def source_file(nombre):
+    """
+    Ruta del original del asset cuando es un archivo del repo (None si es una URL o no existe)
+    """
+    asset = ASSETS.get(nombre)
+    if asset is None or _es_url(asset.source):
+        return None
+    ruta = os.path.join(RAIZ, asset.source)
+    return ruta if os.path.exists(ruta) else None
+
+
+def tiles(nombre):
+    """
+    Pirámide de mosaicos del asset (tamaño, niveles y dimensiones de la
+    original) con la URL de su carpeta, o None si no se generó
+    """
+    piramide = manifest().get(nombre, {}).get("tiles")
+    if not piramide:
+        return None
+    return {**piramide, "url": f"{STATIC_URL}/{piramide['dir']}"}
+
+
+# -------------------- GENERACIÓN --------------------
+def _es_url(origen):
+    return origen.startswith(("http://", "https://"))
+
+
+def _hash(datos):
+    return hashlib.sha256(datos).hexdigest()
+
+
+def _leer_origen(asset, anterior, force, client):
+    """
+    Bytes del original: del repo, de la copia guardada en una corrida
+    anterior (si la fuente no cambió) o descargados de la URL
+    """
+    if not _es_url(asset.source):
+        with open(os.path.join(RAIZ, asset.source), "rb") as f:
+            return f.read()
+    if anterior and anterior["source"] == asset.source and anterior.get("original") and not force:
+        copia = os.path.join(ASSETS_DIR, anterior["original"])
+        if os.path.exists(copia):
+            with open(copia, "rb") as f:
+                return f.read()
+
+    from http_client import default_client
+    response = (client or default_client()).get(asset.source)
+    response.raise_for_status()
+    return response.content
+
+
+def build_tiles(nombre, imagen, digest, tamano):
+    """
+    Pirámide de mosaicos WebP de tamano x tamano px: el último nivel es la
+    imagen original y cada uno de los anteriores mide la mitad, hasta el
+    nivel 0, que entra en un solo mosaico. Se guardan en
+    {nombre}-tiles.{hash}/{nivel}/{x}-{y}.webp; el hash (del original y del
+    tamaño) va en la carpeta para que los mosaicos se puedan cachear para siempre.
+    """
+    from PIL import Image
+
+    niveles = max(0, math.ceil(math.log2(max(imagen.size) / tamano))) + 1
+    carpeta = f"{nombre}-tiles.{_hash(f'{digest}:{tamano}:{CALIDAD_WEBP}'.encode())[:12]}"
+    destino = os.path.join(ASSETS_DIR, carpeta)
+    shutil.rmtree(destino, ignore_errors=True)
+
+    cantidad = total = 0
+    for nivel in range(niveles):
+        escala = 2 ** (niveles - 1 - nivel)
+        ancho, alto = math.ceil(imagen.width / escala), math.ceil(imagen.height / escala)
+        capa = imagen if escala == 1 else imagen.resize((ancho, alto), Image.LANCZOS)
+        os.makedirs(os.path.join(destino, str(nivel)))
+        for x in range(math.ceil(ancho / tamano)):
+            for y in range(math.ceil(alto / tamano)):
+                mosaico = capa.crop((x * tamano, y * tamano, min(ancho, (x + 1) * tamano), min(alto, (y + 1) * tamano)))
+                ruta = os.path.join(destino, str(nivel), f"{x}-{y}.webp")
+                mosaico.save(ruta, "WEBP", quality=CALIDAD_WEBP, method=6)
+                cantidad += 1
+                total += os.path.getsize(ruta)
+
+    return {
+        "dir": carpeta,
+        "tile_size": tamano,
+        "levels": niveles,
+        "width": imagen.width,
+        "height": imagen.height,
+        "count": cantidad,
+        "bytes": total,
+    }
+
+
+def build_asset(nombre, asset, anterior=None, force=False, client=None):
+    """
+    Genera las variantes WebP de un asset y devuelve su entrada del
+    manifest. Si el original y los anchos no cambiaron, reutiliza la anterior.
+    """
+    from PIL import Image
+
+    datos = _leer_origen(asset, anterior, force, client)
+    digest = _hash(datos)
+    if (anterior and not force and anterior["sha256"] == digest
+            and anterior["source"] == asset.source and anterior["alt"] == asset.alt
+            and anterior["widths"] == list(asset.widths)
+            and all(os.path.exists(os.path.join(ASSETS_DIR, v["file"])) for v in anterior["variants"])
+            and (anterior.get("tiles") or {}).get("tile_size", 0) == asset.tile_size
+            and (not asset.tile_size or os.path.isdir(os.path.join(ASSETS_DIR, anterior["tiles"]["dir"])))):
+        return anterior
+
+    imagen = Image.open(BytesIO(datos))
+    formato = (imagen.format or "bin").lower().replace("jpeg", "jpg")
+    imagen.load()
+    alfa = imagen.mode in ("RGBA", "LA", "PA") or "transparency" in imagen.info
+    imagen = imagen.convert("RGBA" if alfa else "RGB")
+
+    original = None
+    if _es_url(asset.source):
+        # Copia del original para regenerar las variantes sin volver a descargarlo
+        original = f"{nombre}.{digest[:12]}.{formato}"
+        with open(os.path.join(ASSETS_DIR, original), "wb") as f:
+            f.write(datos)
+
+    variantes = []
+    # Nunca se agranda: los anchos mayores que el original se quedan en el original
+    for ancho in sorted({min(ancho, imagen.width) for ancho in asset.widths}):
+        alto = round(imagen.height * ancho / imagen.width)
+        buffer = BytesIO()
+        imagen.resize((ancho, alto), Image.LANCZOS).save(buffer, "WEBP", quality=CALIDAD_WEBP, method=6)
+        contenido = buffer.getvalue()
+        archivo = f"{nombre}-{ancho}.{_hash(contenido)[:12]}.webp"
+        with open(os.path.join(ASSETS_DIR, archivo), "wb") as f:
+            f.write(contenido)
+        variantes.append({"width": ancho, "height": alto, "file": archivo, "bytes": len(contenido)})
+
+    entrada = {
+        "source": asset.source,
+        "alt": asset.alt,
+        "sha256": digest,
+        "original": original,
+        "bytes": len(datos),
+        "widths": list(asset.widths),
+        "variants": variantes,
+    }
+    if asset.tile_size:
+        entrada["tiles"] = build_tiles(nombre, imagen, digest, asset.tile_size)
+    return entrada
+
+
+def build_assets(nombres=None, force=False, client=None):
+    """
+    Genera los assets pedidos (por defecto todos), actualiza manifest.json
+    y borra de static/img los archivos (y carpetas de mosaicos) que ya no
+    usa ninguna entrada.
+    Devuelve (manifest, {nombre: error}) con los assets que fallaron;
+    de esos se conserva la entrada anterior si la había.
+    """
+    os.makedirs(ASSETS_DIR, exist_ok=True)
+    anteriores = manifest()
+    nuevo = {nombre: entrada for nombre, entrada in anteriores.items() if nombre in ASSETS}
+    errores = {}
+    for nombre in nombres or ASSETS:
+        try:
+            nuevo[nombre] = build_asset(nombre, ASSETS[nombre], anteriores.get(nombre), force, client)
+        except Exception as e:
+            errores[nombre] = e
+
+    usados = {"manifest.json"}
+    for entrada in nuevo.values():
+        usados.update(v["file"] for v in entrada["variants"])
+        if entrada.get("original"):
+            usados.add(entrada["original"])
+        if entrada.get("tiles"):
+            usados.add(entrada["tiles"]["dir"])
+    for archivo in os.listdir(ASSETS_DIR):
+        if archivo not in usados:
+            ruta = os.path.join(ASSETS_DIR, archivo)
+            if os.path.isdir(ruta):
+                shutil.rmtree(ruta)
+            else:
+                os.remove(ruta)
+
+    temporal = MANIFEST + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(nuevo, f, indent=2, ensure_ascii=False)
+    os.replace(temporal, MANIFEST)
+    return nuevo, errores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera las imágenes locales de la app en static/img")
+    parser.add_argument("nombres", nargs="*", metavar="ASSET",
+                        help=f"Assets a generar (por defecto todos: {', '.join(ASSETS)})")
+    parser.add_argument("--force", action="store_true",
+                        help="Volver a descargar y regenerar aunque nada haya cambiado")
+    args = parser.parse_args(argv)
+    desconocidos = [nombre for nombre in args.nombres if nombre not in ASSETS]
+    if desconocidos:
+        parser.error(f"assets desconocidos: {', '.join(desconocidos)}")
+
+    generado, errores = build_assets(args.nombres or None, args.force)
+    for nombre, entrada in generado.items():
+        pesos = ", ".join(f"{v['width']} px {v['bytes'] / 1024:.0f} KiB" for v in entrada["variants"])
+        print(f"{nombre}: original {entrada['bytes'] / 1024:.0f} KiB → {pesos}")
+        if entrada.get("tiles"):
+            piramide = entrada["tiles"]
+            print(f"{nombre}: {piramide['count']} mosaicos de {piramide['tile_size']} px en "
+                  f"{piramide['levels']} niveles, {piramide['bytes'] / 1024:.0f} KiB")
+    for nombre, error in errores.items():
+        print(f"{nombre}: no se pudo generar ({error})", file=sys.stderr)
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
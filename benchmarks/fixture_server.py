@@ -0,0 +1,213 @@
+import gzip
+import os
+import threading
+import time
+from bisect import bisect_right
+from datetime import date
+from email.utils import formatdate
+from hashlib import sha1
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import urlsplit
+
+from lxml import html as lxml_html
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# Rutas servidas -> archivo de fixture: la lista de cada juego en la misma
+# ruta que en su wiki (ver sources.py)
+RUTAS = {
+    "/wiki/Characters/List": "characters_list.html",
+    "/wiki/Character/List": "starrail_character_list.html",
+    "/wiki/Agent/List": "zenless_agent_list.html",
+}
+
+# Fecha de salida de cada versión del juego, para la página de cada personaje
+VERSIONES = [
+    ("2020-09-28", "1.0"), ("2020-11-11", "1.1"), ("2020-12-23", "1.2"), ("2021-02-03", "1.3"),
+    ("2021-03-17", "1.4"), ("2021-04-28", "1.5"), ("2021-06-09", "1.6"), ("2021-07-21", "2.0"),
+    ("2021-09-01", "2.1"), ("2021-10-13", "2.2"), ("2021-11-24", "2.3"), ("2022-01-05", "2.4"),
+    ("2022-02-16", "2.5"), ("2022-03-30", "2.6"), ("2022-05-31", "2.7"), ("2022-07-13", "2.8"),
+    ("2022-08-24", "3.0"), ("2022-09-28", "3.1"), ("2022-11-02", "3.2"), ("2022-12-07", "3.3"),
+    ("2023-01-18", "3.4"), ("2023-03-01", "3.5"), ("2023-04-12", "3.6"), ("2023-05-24", "3.7"),
+    ("2023-07-05", "3.8"), ("2023-08-16", "4.0"), ("2023-09-27", "4.1"), ("2023-11-08", "4.2"),
+    ("2023-12-20", "4.3"), ("2024-01-31", "4.4"), ("2024-03-13", "4.5"), ("2024-04-24", "4.6"),
+    ("2024-06-05", "4.7"), ("2024-07-17", "4.8"), ("2024-08-28", "5.0"), ("2024-10-09", "5.1"),
+    ("2024-11-20", "5.2"), ("2025-01-01", "5.3"), ("2025-02-12", "5.4"), ("2025-03-26", "5.5"),
+    ("2025-05-07", "5.6"), ("2025-06-18", "5.7"), ("2025-07-30", "5.8"), ("2025-09-10", "6.0"),
+]
+
+
+def character_pages():
+    """
+    Página de cada personaje de la lista grabada (ruta -> HTML), armada con
+    los datos de su fila y una constelación y un perfil sintéticos
+    """
+    with open(os.path.join(FIXTURES, "character_page.html"), encoding="utf-8") as f:
+        plantilla = Template(f.read())
+    arbol = lxml_html.parse(os.path.join(FIXTURES, RUTAS["/wiki/Characters/List"]))
+
+    paginas = {}
+    for fila in arbol.iter("tr"):
+        celdas = fila.findall("td")
+        if len(celdas) < 8:
+            continue
+        enlace = celdas[1].find("a")
+        nombre = enlace.text_content().strip()
+        calidad = celdas[2].find("img").get("alt")
+        salida = date.fromisoformat(celdas[7].text_content().strip())
+        version = VERSIONES[max(0, bisect_right([v[0] for v in VERSIONES], salida.isoformat()) - 1)][1]
+        paginas[enlace.get("href")] = plantilla.substitute(
+            nombre=nombre,
+            pagina=enlace.get("href").rsplit("/", 1)[-1],
+            calidad=calidad,
+            estrellas=calidad.split()[0],
+            elemento=celdas[3].text_content().strip(),
+            arma=celdas[4].text_content().strip(),
+            region=celdas[5].text_content().strip(),
+            constelacion=f"Stella {nombre}",
+            lanzamiento=f"{salida:%B} {salida.day}, {salida.year}",
+            version=version,
+            perfil=f"{nombre} es un personaje de Teyvat. " * 400,
+        ).encode("utf-8")
+    return paginas
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """
+    Reproduce las páginas grabadas de la wiki con ETag y Last-Modified,
+    respondiendo 304 a las peticiones condicionales como lo hace fandom.com.
+    Mantiene la conexión abierta (HTTP/1.1), comprime con gzip si el cliente
+    lo acepta y puede simular latencia y errores (ver FixtureServer).
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Cabeceras y cuerpo van en escrituras separadas: sin esto, Nagle y el ACK
+    # retrasado agregan ~40 ms a cada respuesta sobre una conexión reutilizada
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.conexiones += 1
+
+    def do_GET(self):
+        httpd = self.server
+        with httpd.lock:
+            httpd.peticiones += 1
+            httpd.en_curso += 1
+            httpd.max_en_curso = max(httpd.max_en_curso, httpd.en_curso)
+            falla = httpd.fallas.pop(0) if httpd.fallas else None
+        try:
+            if httpd.latencia:
+                time.sleep(httpd.latencia)
+            if falla is not None:
+                self.send_response(falla)
+                if falla == 429:
+                    self.send_header("Retry-After", "1")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self._servir()
+        finally:
+            with httpd.lock:
+                httpd.en_curso -= 1
+
+    def _servir(self):
+        if self.path in RUTAS:
+            with open(os.path.join(FIXTURES, RUTAS[self.path]), "rb") as f:
+                cuerpo = f.read()
+        elif self.path in self.server.paginas:
+            cuerpo = self.server.paginas[self.path]
+        else:
+            self.send_error(404)
+            return
+
+        etag = '"%s"' % sha1(cuerpo).hexdigest()
+        last_modified = formatdate(self.server.fixture_mtime, usegmt=True)
+
+        if self.server.validadores and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            cuerpo = gzip.compress(cuerpo)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        if self.server.validadores:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """
+    Servidor HTTP local en un hilo; se usa como context manager.
+    latencia son los segundos de espera antes de cada respuesta y fallas los
+    códigos de estado (p. ej. [503, 429]) con que responden las próximas
+    peticiones antes de volver a servir la página. paginas (ruta -> bytes)
+    son las páginas de personaje y se pueden editar con el servidor andando;
+    con validadores=False se responde sin ETag ni Last-Modified.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, handler=FixtureHandler, latencia=0.0, fallas=(),
+                 validadores=True):
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.httpd.fixture_mtime = os.path.getmtime(os.path.join(FIXTURES, RUTAS["/wiki/Characters/List"]))
+        self.httpd.latencia = latencia
+        self.httpd.fallas = list(fallas)
+        self.httpd.lock = threading.Lock()
+        self.httpd.peticiones = 0
+        self.httpd.conexiones = 0
+        self.httpd.en_curso = 0
+        self.httpd.max_en_curso = 0
+        self.httpd.paginas = character_pages()
+        self.httpd.validadores = validadores
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def paginas(self):
+        return self.httpd.paginas
+
+    @property
+    def peticiones(self):
+        return self.httpd.peticiones
+
+    @property
+    def conexiones(self):
+        return self.httpd.conexiones
+
+    @property
+    def max_en_curso(self):
+        return self.httpd.max_en_curso
+
+    def url(self, ruta="/wiki/Characters/List"):
+        return self.base_url + ruta
+
+    def url_fuente(self, fuente):
+        """
+        La página de la fuente servida por este servidor
+        """
+        return self.url(urlsplit(fuente.url).path)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,277 @@
+"""
+Prueba de carga del dashboard con muchas sesiones a la vez.
+
+Publica la página grabada de la wiki (o un roster sintético con --size) en
+un almacén temporal, arranca `streamlit run dash.py` y abre N sesiones por
+el websocket de Streamlit (ver benchmarks/sessions.py). Cada sesión sigue
+uno de los GUIONES: recorre las pestañas y cambia filtros, páginas y la
+búsqueda por nombre como lo haría un usuario, todas al mismo tiempo.
+
+Reporta por pestaña la latencia de los reruns vista desde el cliente
+(p50/p95/p99), el tiempo en el servidor y cuánto creció la memoria
+residente mientras se dibujaba (del /metrics.json de la app), más el
+throughput total y el RSS del servidor. Con --compare termina con código 1
+si el p95 de alguna pestaña empeoró más que el umbral, para correrlo antes
+de desplegar.
+
+Uso:
+    python -m benchmarks.load
+    python -m benchmarks.load --sessions 50 --iterations 5 --output carga.json
+    python -m benchmarks.load --size 100000 --compare carga.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import defaultdict
+
+import numpy as np
+
+from benchmarks.fixture_server import FixtureServer
+from benchmarks.sessions import Sesion, arrancar_servidor, puerto_libre, rss_proceso
+from benchmarks.synthetic import synthetic_roster
+from pipeline import refresh_snapshot
+from snapshot_store import SnapshotStore
+
+SESIONES = 20
+ITERACIONES = 3
+
+# Cada paso es una pestaña (str) o un cambio de widgets ({key: valor})
+GUIONES = {
+    "recorrido": [
+        "Resumen", "Elementos", "Regiones", "Combinaciones", "Mapa", "Buscador", "Historial", "Equipos", "Inicio",
+    ],
+    "buscador": [
+        "Buscador",
+        {"search_elem": ["Pyro"]},
+        {"search_region": ["Liyue", "Mondstadt"]},
+        {"search_nombre": "ka"},
+        {"tabla_buscador_orden": "Nombre", "tabla_buscador_desc": True},
+        {"search_nombre": ""},
+        {"search_elem": ["Hydro", "Cryo"], "search_arma": ["Sword"]},
+        {"tabla_buscador_pagina": 2},
+        {"search_elem": [], "search_arma": [], "search_region": []},
+    ],
+    "filtros": [
+        "Elementos",
+        {"elem_filter": "Electro"},
+        {"tabla_elementos_orden": "Región"},
+        "Regiones",
+        {"region_filter": "Inazuma"},
+        {"tabla_regiones_pagina": 2},
+        "Combinaciones",
+        "Resumen",
+    ],
+}
+
+
+# -------------------- DATOS --------------------
+def publicar(store_path, tamano=None):
+    """
+    Publica en el almacén la página grabada de la wiki (el scrape real
+    contra el servidor de fixtures, sin páginas de personaje) o, con
+    tamano, un roster sintético de esas filas
+    """
+    store = SnapshotStore(store_path)
+    if tamano:
+        return store.save(synthetic_roster(tamano), etag=None, last_modified=None)
+    with FixtureServer() as servidor:
+        return refresh_snapshot(store, url=servidor.url(), detalles=False)
+
+
+# -------------------- CARGA --------------------
+async def _usuario(url, guion, iteraciones, pausa, muestras, rng):
+    sesion = Sesion(url)
+    muestras.append((sesion.pestana, await sesion.abrir()))
+    for _ in range(iteraciones):
+        for paso in guion:
+            if pausa:
+                await asyncio.sleep(rng.uniform(0, 2 * pausa))
+            if isinstance(paso, str):
+                segundos = await sesion.correr(paso)
+            else:
+                # Los widgets de otra pestaña no están: el paso se salta
+                if any(clave not in sesion.ids for clave in paso):
+                    continue
+                segundos = await sesion.correr(valores=paso)
+            muestras.append((sesion.pestana, segundos))
+    await sesion.ws.close()
+    return sesion.errores
+
+
+async def _vigilar_rss(pid, picos, intervalo=0.2):
+    while True:
+        picos.append(rss_proceso(pid))
+        await asyncio.sleep(intervalo)
+
+
+def _metricas_servidor(puerto):
+    with urllib.request.urlopen(f"http://127.0.0.1:{puerto}/metrics.json", timeout=10) as respuesta:
+        return {e["labels"]["tab"]: e for e in json.load(respuesta)["stages"] if e["stage"] == "tab"}
+
+
+async def _cargar(puerto, puerto_metricas, pid, sesiones, iteraciones, pausa, semilla):
+    url = f"ws://127.0.0.1:{puerto}/_stcore/stream"
+
+    # Una pasada previa carga el snapshot, los índices y las figuras compartidas
+    # (y levanta /metrics.json); lo que corre en ella no cuenta
+    for guion in GUIONES.values():
+        await _usuario(url, guion, 1, 0, [], random.Random(semilla))
+    previas = await asyncio.to_thread(_metricas_servidor, puerto_metricas)
+    rss_inicial = rss_proceso(pid)
+
+    muestras, picos = [], []
+    vigia = asyncio.create_task(_vigilar_rss(pid, picos))
+    nombres = list(GUIONES)
+    inicio = time.perf_counter()
+    errores = await asyncio.gather(*(
+        _usuario(url, GUIONES[nombres[i % len(nombres)]], iteraciones, pausa, muestras, random.Random(semilla + i))
+        for i in range(sesiones)
+    ))
+    duracion = time.perf_counter() - inicio
+    vigia.cancel()
+    return {
+        "previas": previas,
+        "servidor": await asyncio.to_thread(_metricas_servidor, puerto_metricas),
+        "muestras": muestras,
+        "segundos": duracion,
+        "errores": sum(errores),
+        "rss_inicial": rss_inicial,
+        "rss_pico": max(picos, default=rss_inicial),
+        "rss_final": rss_proceso(pid),
+    }
+
+
+def load_test(sesiones=SESIONES, iteraciones=ITERACIONES, pausa=0.0, tamano=None, semilla=0):
+    """
+    Corre la prueba de carga y devuelve el reporte (ver main)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = os.path.join(tmp, "roster.sqlite")
+        snapshot = publicar(store_path, tamano)
+
+        puerto, puerto_metricas = puerto_libre(), puerto_libre()
+        servidor = arrancar_servidor(store_path, puerto, env={"GENSHIN_METRICS_PORT": str(puerto_metricas)})
+        try:
+            carga = asyncio.run(_cargar(puerto, puerto_metricas, servidor.pid, sesiones, iteraciones, pausa, semilla))
+        finally:
+            servidor.terminate()
+            servidor.wait(timeout=10)
+
+    por_pestana = defaultdict(list)
+    for pestana, segundos in carga["muestras"]:
+        por_pestana[pestana].append(segundos)
+
+    resultados = []
+    for pestana, tiempos in sorted(por_pestana.items()):
+        tiempos = np.array(tiempos)
+        actual, previa = carga["servidor"].get(pestana, {}), carga["previas"].get(pestana, {})
+        reruns = actual.get("count", 0) - previa.get("count", 0)
+        resultados.append({
+            "tab": pestana,
+            "reruns": len(tiempos),
+            "seconds_p50": float(np.percentile(tiempos, 50)),
+            "seconds_p95": float(np.percentile(tiempos, 95)),
+            "seconds_p99": float(np.percentile(tiempos, 99)),
+            "server_seconds_mean": (actual.get("seconds_sum", 0) - previa.get("seconds_sum", 0)) / reruns
+            if reruns else None,
+            "rss_growth_bytes_per_rerun": (actual.get("rss_growth_bytes", 0) - previa.get("rss_growth_bytes", 0))
+            / reruns if reruns else None,
+        })
+
+    reruns = len(carga["muestras"])
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "sessions": sesiones,
+            "iterations": iteraciones,
+            "think_seconds": pausa,
+            "rows": len(snapshot.df),
+            "scripts": list(GUIONES),
+        },
+        "total": {
+            "reruns": reruns,
+            "seconds": carga["segundos"],
+            "reruns_per_second": reruns / carga["segundos"],
+            "errors": carga["errores"],
+            "rss_start_bytes": carga["rss_inicial"],
+            "rss_peak_bytes": carga["rss_pico"],
+            "rss_end_bytes": carga["rss_final"],
+        },
+        "results": resultados,
+    }
+
+
+# -------------------- REPORTE --------------------
+def imprimir(reporte):
+    meta, total = reporte["meta"], reporte["total"]
+    print(f"{meta['sessions']} sesiones x {meta['iterations']} iteraciones, roster de {meta['rows']} filas")
+    print(f"{'Pestaña':<14} {'Reruns':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'Servidor ms':>11} {'RSS KiB/rerun':>13}")
+    for r in reporte["results"]:
+        servidor = f"{r['server_seconds_mean'] * 1000:.1f}" if r["server_seconds_mean"] is not None else "-"
+        memoria = f"{r['rss_growth_bytes_per_rerun'] / 1024:.0f}" if r["rss_growth_bytes_per_rerun"] is not None else "-"
+        print(f"{r['tab']:<14} {r['reruns']:>6} {r['seconds_p50'] * 1000:>8.1f} {r['seconds_p95'] * 1000:>8.1f} "
+              f"{r['seconds_p99'] * 1000:>8.1f} {servidor:>11} {memoria:>13}")
+    print(f"{total['reruns']} reruns en {total['seconds']:.1f} s ({total['reruns_per_second']:.1f}/s), "
+          f"{total['errors']} errores; RSS {total['rss_start_bytes'] / 2**20:.0f} → "
+          f"pico {total['rss_peak_bytes'] / 2**20:.0f} → {total['rss_end_bytes'] / 2**20:.0f} MiB")
+
+
+def comparar(base, actual, threshold):
+    """
+    Imprime la razón actual/base del p95 de cada pestaña y devuelve las regresiones
+    """
+    previos = {r["tab"]: r for r in base["results"]}
+    regresiones = []
+    for r in actual["results"]:
+        previo = previos.get(r["tab"])
+        if previo is None:
+            continue
+        razon = r["seconds_p95"] / previo["seconds_p95"] if previo["seconds_p95"] else float("inf")
+        marca = ""
+        if razon > threshold:
+            marca = "  <-- regresión"
+            regresiones.append((r["tab"], razon))
+        print(f"{r['tab']:<14} p95 x{razon:6.2f}{marca}", file=sys.stderr)
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=SESIONES, help="Sesiones simultáneas")
+    parser.add_argument("--iterations", type=int, default=ITERACIONES, help="Veces que cada sesión repite su guion")
+    parser.add_argument("--think", type=float, default=0.0,
+                        help="Pausa media en segundos entre pasos (0: sin pausa, máxima carga)")
+    parser.add_argument("--size", type=int, help="Usar un roster sintético de estas filas en vez de la página grabada")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Guardar el reporte en JSON")
+    parser.add_argument("--compare", help="JSON de una corrida anterior para detectar regresiones")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="Razón del p95 a partir de la cual una pestaña cuenta como regresión")
+    args = parser.parse_args(argv)
+
+    reporte = load_test(args.sessions, args.iterations, args.think, args.size, args.seed)
+    imprimir(reporte)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(reporte, f, indent=2, ensure_ascii=False)
+
+    if reporte["total"]["errors"]:
+        print(f"{reporte['total']['errors']} reruns terminaron con una excepción", file=sys.stderr)
+        return 1
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            base = json.load(f)
+        if comparar(base, reporte, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
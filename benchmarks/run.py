@@ -0,0 +1,453 @@
+"""
+Benchmarks offline del dashboard.
+
+Reproduce las páginas grabadas de cada juego desde un servidor local y
+genera rosters sintéticos para medir tiempo y memoria pico de cada etapa:
+arranque, scrape, parseo, limpieza, carga del snapshot y la agregación de
+cada pestaña.
+La memoria pico se mide con tracemalloc (asignaciones de Python y NumPy).
+
+Uso:
+    python -m benchmarks.run --output resultados.json
+    python -m benchmarks.run --sizes 1000 100000 --compare base.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fixture_server import FIXTURES, FixtureServer
+from benchmarks.synthetic import synthetic_raw_roster, synthetic_roster, synthetic_versions
+from bitmap_index import BitmapIndex
+from crawler import crawl_details
+from cube import RosterCube
+from http_client import HttpClient
+from name_index import NameIndex
+from pipeline import refresh_snapshot, refresh_sources
+from refresh import SnapshotReader
+from roster import clean_roster
+from scraper import (
+    fetch_characters_page, parse_characters_html, parse_characters_html_lxml, scrape_genshin_characters,
+)
+from snapshot_store import Snapshot, SnapshotStore
+from sources import SOURCES
+from stats import (
+    buscar, conteo, conteo_por_region, conteo_seleccion, filas_filtro, mejores_equipos, opciones_filtro,
+    resumen_dataset, resumen_general, tabla_cruzada, top_combinaciones, valores_observados,
+)
+from teams import TeamIndex
+
+SIZES = [1_000, 100_000, 1_000_000]
+# Lo que dash.py importa al arrancar, antes de elegir una pestaña
+MODULOS_ARRANQUE = "refresh, snapshot_store, stats, tabs"
+# Dependencias que solo deberían cargarse al usarse (pestañas con gráficos, scrape)
+DIFERIDOS = ("plotly.express", "requests", "bs4", "lxml")
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Segundos de latencia por página de personaje, para simular la wiki real
+LATENCIA_CRAWL = 0.05
+# Historial: versiones guardadas, cada cuántas hay checkpoint y tamaño máximo medido
+HISTORIAL_VERSIONES = 20
+HISTORIAL_CHECKPOINT = 10
+HISTORIAL_MAX = 100_000
+# Lo que puede crecer names.query entre el menor y el mayor roster medidos:
+# buscar recorriendo los nombres crecería como las filas (x1000 de 1k a 1M)
+ESCALA_MAXIMA_NOMBRES = 10
+REGIONES_MAPA = [
+    "Mondstadt", "Liyue", "Inazuma", "Sumeru", "Fontaine",
+    "Natlan", "Snezhnaya", "Nod-Krai", "Desconocida",
+]
+
+
+# -------------------- AGREGACIONES POR PESTAÑA --------------------
+# Cada función reproduce lo que calcula dash.py al renderizar la pestaña
+def tab_sidebar(snapshot):
+    resumen_dataset(snapshot.cube)
+
+
+def tab_resumen(snapshot):
+    resumen_general(snapshot.cube)
+    snapshot.df.head(10)
+
+
+def tab_elementos(snapshot):
+    cube, indice, pager = snapshot.cube, snapshot.index, snapshot.pager
+    opciones_filtro(cube, 'Elemento')
+    pager.pagina(filas_filtro(indice, 'Elemento', None))
+    pager.pagina(filas_filtro(indice, 'Elemento', "Pyro"), orden='Nombre')
+    conteo(cube, 'Elemento')
+
+
+def tab_regiones(snapshot):
+    cube, indice, pager = snapshot.cube, snapshot.index, snapshot.pager
+    opciones_filtro(cube, 'Región')
+    pager.pagina(filas_filtro(indice, 'Región', "Liyue"))
+    conteo(cube, 'Región')
+    conteo(cube, 'Elemento', {'Región': ["Liyue"]})
+
+
+def tab_combinaciones(snapshot):
+    cube = snapshot.cube
+    tabla_cruzada(cube)
+    conteo(cube, 'Arma')
+    conteo(cube, 'Elemento')
+    top_combinaciones(cube, 10)
+
+
+def tab_mapa(snapshot):
+    conteo_por_region(snapshot.cube, REGIONES_MAPA)
+
+
+def tab_buscador(snapshot):
+    cube, indice = snapshot.cube, snapshot.index
+    for columna in ('Elemento', 'Arma', 'Región'):
+        valores_observados(cube, columna)
+    seleccion = buscar(indice, ["Pyro", "Hydro"], ["Sword", "Catalyst"], ["Liyue", "Fontaine", "Natlan"])
+    indice.contar(seleccion)
+    for columna in ('Elemento', 'Arma', 'Región'):
+        conteo_seleccion(indice, seleccion, columna)
+    snapshot.pager.pagina(indice.filas(seleccion))
+
+
+def tab_equipos(snapshot):
+    mejores_equipos(snapshot.teams)
+    mejores_equipos(snapshot.teams, excluir_regiones=["Liyue", "Mondstadt"])
+
+
+TABS = {
+    "sidebar": tab_sidebar,
+    "tab.Resumen": tab_resumen,
+    "tab.Elementos": tab_elementos,
+    "tab.Regiones": tab_regiones,
+    "tab.Combinaciones": tab_combinaciones,
+    "tab.Mapa": tab_mapa,
+    "tab.Buscador": tab_buscador,
+    "tab.Equipos": tab_equipos,
+}
+
+
+# -------------------- MEDICIÓN --------------------
+def medir(stage, size, func, repeat, setup=None):
+    """
+    Ejecuta func una vez con tracemalloc para la memoria pico y luego
+    repeat veces sin él para los tiempos. setup() prepara cada corrida.
+    """
+    args = setup() if setup else ()
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tiempos = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        inicio = time.perf_counter()
+        func(*args)
+        tiempos.append(time.perf_counter() - inicio)
+
+    resultado = {
+        "stage": stage,
+        "size": size,
+        "repeat": repeat,
+        "seconds_min": min(tiempos),
+        "seconds_median": statistics.median(tiempos),
+        "peak_bytes": peak,
+    }
+    print(f"{stage:<24} {str(size):>9}  {resultado['seconds_median'] * 1000:10.2f} ms  "
+          f"{peak / 2**20:9.2f} MiB", file=sys.stderr)
+    return resultado
+
+
+def bench_startup(repeat):
+    """
+    Arranque en frío: un intérprete nuevo que importa los módulos de dash.py.
+    Devuelve también las dependencias diferidas que se cargaron igual.
+    """
+    comando = [sys.executable, "-c", f"import {MODULOS_ARRANQUE}"]
+    resultado = medir("startup.imports", "app",
+                      lambda: subprocess.run(comando, cwd=RAIZ, check=True), repeat)
+
+    codigo = f"import sys, {MODULOS_ARRANQUE}; print(' '.join(m for m in {DIFERIDOS!r} if m in sys.modules))"
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, check=True, capture_output=True, text=True)
+    return resultado, salida.stdout.split()
+
+
+def bench_fixture(repeat):
+    """
+    Etapas que dependen de la wiki, contra la página grabada
+    """
+    with open(os.path.join(FIXTURES, "characters_list.html"), encoding="utf-8") as f:
+        html = f.read()
+
+    resultados = [
+        medir("parse.bs4", "fixture", lambda: parse_characters_html(html), repeat),
+        medir("parse.lxml", "fixture", lambda: parse_characters_html_lxml(html), repeat),
+    ]
+    iguales = parse_characters_html(html).equals(parse_characters_html_lxml(html))
+
+    with FixtureServer() as server, tempfile.TemporaryDirectory() as carpeta:
+        url = server.url()
+        resultados.append(medir("scrape_genshin_characters", "fixture",
+                                lambda: scrape_genshin_characters(url), repeat))
+
+        # load_data en frío: descarga, parseo, limpieza y escritura del snapshot
+        # (sin las páginas de personaje, que se miden en crawl.*)
+        contador = iter(range(10**6))
+
+        def store_vacio():
+            return (SnapshotStore(os.path.join(carpeta, f"frio{next(contador)}.sqlite")),)
+
+        resultados.append(medir("load_data.cold", "fixture",
+                                lambda store: refresh_snapshot(store, url=url, detalles=False), repeat,
+                                setup=store_vacio))
+
+        store = SnapshotStore(os.path.join(carpeta, "caliente.sqlite"))
+        snapshot = refresh_snapshot(store, url=url, detalles=False)
+        resultados.append(medir("load_data.revalidate_304", "fixture",
+                                lambda: refresh_snapshot(store, snapshot, url=url), repeat))
+        resultados.append(medir("load_data.disk", "fixture", store.latest, repeat))
+        # Lo que paga cada rerun de la app: ver si hay una versión publicada más nueva
+        lector = SnapshotReader(store, poll_interval=0)
+        resultados.append(medir("load_data.poll", "fixture", lector.current, repeat))
+
+        # Cliente compartido: conexión reutilizada frente a una nueva por petición
+        cliente = HttpClient()
+        resultados.append(medir("fetch.pooled", "fixture", lambda: cliente.get(url), repeat))
+        resultados.append(medir("fetch.unpooled", "fixture", lambda: HttpClient().get(url), repeat))
+
+        # Dos errores 5xx antes de la página (reintentos sin espera para medir solo el costo)
+        sin_espera = HttpClient(backoff=0, jitter=0)
+
+        def con_fallas():
+            server.httpd.fallas = [503, 502]
+            return ()
+
+        resultados.append(medir("fetch.retry_5xx", "fixture",
+                                lambda: fetch_characters_page(url=url, client=sin_espera), repeat, setup=con_fallas))
+
+    # Páginas de personaje: recorrido completo en paralelo y uno a uno, y la
+    # revalidación (todas responden 304) contra un caché ya lleno
+    enlaces = parse_characters_html_lxml(html)['Enlace']
+    with FixtureServer(latencia=LATENCIA_CRAWL) as server, tempfile.TemporaryDirectory() as carpeta:
+        url = server.url()
+        contador = iter(range(10**6))
+
+        def cache_vacio():
+            return (SnapshotStore(os.path.join(carpeta, f"paginas{next(contador)}.sqlite")),)
+
+        resultados.append(medir("crawl.cold", len(enlaces),
+                                lambda store: crawl_details(enlaces, url, store), repeat, setup=cache_vacio))
+        resultados.append(medir("crawl.sequential", len(enlaces),
+                                lambda store: crawl_details(enlaces, url, store, concurrencia=1), 1,
+                                setup=cache_vacio))
+
+        store = SnapshotStore(os.path.join(carpeta, "paginas.sqlite"))
+        crawl_details(enlaces, url, store)
+        resultados.append(medir("crawl.revalidate", len(enlaces),
+                                lambda: crawl_details(enlaces, url, store), repeat))
+
+    return resultados, iguales
+
+
+def bench_games(repeat):
+    """
+    Varios juegos: publicar las listas grabadas de todos contra un almacén
+    vacío en paralelo y uno a uno (con la latencia de la wiki real), leer
+    el snapshot con todos juntos y separar cada juego la primera vez
+    """
+    fuentes = list(SOURCES.values())
+    with FixtureServer(latencia=LATENCIA_CRAWL) as server, tempfile.TemporaryDirectory() as carpeta:
+        urls = {fuente.game: server.url_fuente(fuente) for fuente in fuentes}
+        contador = iter(range(10**6))
+
+        def store_vacio():
+            return (SnapshotStore(os.path.join(carpeta, f"juegos{next(contador)}.sqlite")),)
+
+        resultados = [
+            medir("ingest.parallel", len(fuentes),
+                  lambda store: refresh_sources(store, fuentes, urls=urls, detalles=False), repeat,
+                  setup=store_vacio),
+            medir("ingest.sequential", len(fuentes),
+                  lambda store: refresh_sources(store, fuentes, urls=urls, detalles=False, concurrencia=1),
+                  repeat, setup=store_vacio),
+        ]
+
+        store = SnapshotStore(os.path.join(carpeta, "juegos.sqlite"))
+        refresh_sources(store, fuentes, urls=urls, detalles=False)
+        resultados.append(medir("load_data.games", len(fuentes), store.latest, repeat))
+        resultados.append(medir("snapshot.partition", len(fuentes),
+                                lambda snapshot: [snapshot.partition(juego) for juego in snapshot.juegos], repeat,
+                                setup=lambda: (store.latest(),)))
+    return resultados
+
+
+def _bench_clean(size, repeat):
+    """
+    Limpieza de un roster crudo, que se libera al volver (antes de las etapas siguientes)
+    """
+    crudo = synthetic_raw_roster(size)
+    return medir("clean_roster", size, lambda: clean_roster(crudo), repeat)
+
+
+def bench_synthetic(size, repeat):
+    """
+    Limpieza y agregaciones de cada pestaña sobre un roster sintético
+    """
+    resultados = [_bench_clean(size, repeat)]
+
+    df = synthetic_roster(size)
+    resultados.append(medir("cube.build", size, lambda: RosterCube(df), repeat))
+    resultados.append(medir("index.build", size, lambda: BitmapIndex(df), repeat))
+    resultados.append(medir("teams.build", size, lambda: TeamIndex(df), repeat))
+    snapshot = Snapshot(version=0, df=df, etag=None, last_modified=None, fetched_at=0.0, checked_at=0.0)
+    snapshot.cube, snapshot.index, snapshot.teams
+    for stage, func in TABS.items():
+        resultados.append(medir(stage, size, lambda: func(snapshot), repeat))
+
+    # El índice de nombres es caro de construir: pocas repeticiones.
+    # names.query debería costar lo mismo en todos los tamaños (ver escala).
+    resultados.append(medir("names.build", size, lambda: NameIndex(df['Nombre']), min(repeat, 2)))
+    nombres = NameIndex(df['Nombre'])
+    consultas = _consultas_nombre(df)
+    resultados.append(medir("names.query", size, lambda: [nombres.buscar(c) for c in consultas], repeat))
+    return resultados
+
+
+def bench_history(size, repeat):
+    """
+    Historial de HISTORIAL_VERSIONES versiones con un 0,1 % de filas cambiadas
+    en cada una: guardar una versión más (diff y log), reconstruir la versión
+    más lejana de su checkpoint y el crecimiento por elemento.
+    Devuelve también las filas guardadas frente a copias completas.
+    """
+    with tempfile.TemporaryDirectory() as carpeta:
+        store = SnapshotStore(os.path.join(carpeta, "historial.sqlite"), checkpoint_every=HISTORIAL_CHECKPOINT)
+        *versiones, ultima = synthetic_versions(size, HISTORIAL_VERSIONES + 1)
+        guardados = [store.save(df) for df in versiones]
+        completas = sum(len(s.df) for s in guardados)
+
+        lejana = guardados[HISTORIAL_CHECKPOINT - 1].fetched_at
+        resultados = [
+            medir("history.save", size, lambda: store.save(ultima), repeat),
+            medir("history.at", size, lambda: store.at(lejana), repeat),
+            medir("history.growth", size, lambda: store.growth("Elemento"), repeat),
+        ]
+        with store._connect() as conn:
+            deltas = conn.execute("SELECT COUNT(*) FROM deltas").fetchone()[0]
+            checkpoints = conn.execute("SELECT COUNT(*) FROM roster").fetchone()[0]
+    filas = {"deltas": deltas, "checkpoints": checkpoints, "full_copies": completas}
+    return resultados, filas
+
+
+def _consultas_nombre(df):
+    """
+    Mezcla de consultas del Buscador: prefijos, un nombre exacto y el mismo con un error
+    """
+    exacto = df['Nombre'].iloc[len(df) // 2]
+    return ["ka", "kaze", "shiven lu", exacto, exacto[:2] + exacto[3:]]
+
+
+# -------------------- COMPARACIÓN --------------------
+def escala(resultados, stage):
+    """
+    Razón entre el tiempo mínimo de la etapa en el mayor y en el menor
+    roster medidos, o None si se midió en menos de dos tamaños
+    """
+    por_tamano = {r["size"]: r["seconds_min"] for r in resultados if r["stage"] == stage}
+    if len(por_tamano) < 2:
+        return None
+    return por_tamano[max(por_tamano)] / por_tamano[min(por_tamano)]
+
+
+def comparar(base, actual, threshold):
+    """
+    Imprime la razón actual/base de cada etapa y devuelve las regresiones
+    """
+    previos = {(r["stage"], str(r["size"])): r for r in base["results"]}
+    regresiones = []
+    for r in actual["results"]:
+        previo = previos.get((r["stage"], str(r["size"])))
+        if previo is None:
+            continue
+        razon = r["seconds_median"] / previo["seconds_median"] if previo["seconds_median"] else float("inf")
+        marca = ""
+        if razon > threshold:
+            marca = "  <-- regresión"
+            regresiones.append((r["stage"], r["size"], razon))
+        print(f"{r['stage']:<24} {str(r['size']):>9}  x{razon:6.2f}{marca}", file=sys.stderr)
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=SIZES,
+                        help="Tamaños de los rosters sintéticos")
+    parser.add_argument("--repeat", type=int, default=5, help="Corridas cronometradas por etapa")
+    parser.add_argument("--output", help="Archivo JSON de salida (por defecto stdout)")
+    parser.add_argument("--compare", help="JSON de una corrida anterior para detectar regresiones")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Razón de tiempo a partir de la cual una etapa cuenta como regresión")
+    args = parser.parse_args(argv)
+
+    arranque, cargados = bench_startup(args.repeat)
+    resultados, parsers_iguales = bench_fixture(args.repeat)
+    resultados.insert(0, arranque)
+    resultados.extend(bench_games(args.repeat))
+    historial = {}
+    for size in args.sizes:
+        resultados.extend(bench_synthetic(size, args.repeat))
+        if size <= HISTORIAL_MAX:
+            medidos, historial[size] = bench_history(size, args.repeat)
+            resultados.extend(medidos)
+
+    reporte = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "parsers_equal": parsers_iguales,
+            "startup_loaded": cargados,
+            "history_rows": historial,
+            "names_query_scaling": escala(resultados, "names.query"),
+        },
+        "results": resultados,
+    }
+
+    texto = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(texto)
+    else:
+        print(texto)
+
+    if not parsers_iguales:
+        print("Los parsers bs4 y lxml no devuelven el mismo DataFrame", file=sys.stderr)
+        return 1
+
+    razon = reporte["meta"]["names_query_scaling"]
+    if razon is not None and razon > ESCALA_MAXIMA_NOMBRES:
+        print(f"names.query crece x{razon:.1f} de {min(args.sizes)} a {max(args.sizes)} filas "
+              f"(máximo x{ESCALA_MAXIMA_NOMBRES}): la búsqueda por nombre ya no usa el índice",
+              file=sys.stderr)
+        return 1
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            base = json.load(f)
+        if comparar(base, reporte, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Memoria residente del servidor con muchas sesiones abiertas a la vez.
+
+Publica un roster sintético en un almacén temporal, arranca `streamlit run
+dash.py` y abre sesiones por el websocket de Streamlit como lo haría el
+navegador: cada una corre la app, pasa por las pestañas con tablas y queda
+conectada. Con cada cantidad de sesiones se mide el RSS del proceso del
+servidor; lo que crece por sesión es lo que cada usuario cuesta en memoria.
+
+Uso:
+    python -m benchmarks.sessions
+    python -m benchmarks.sessions --sessions 1 50 200 --size 100000 --output sesiones.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from benchmarks.synthetic import synthetic_roster
+from snapshot_store import SnapshotStore
+
+SESIONES = [1, 50, 200]
+TAMANO = 100_000
+# Pestañas que recorre cada sesión después de Inicio
+PESTANAS = ["Resumen", "Elementos", "Regiones", "Buscador", "Historial"]
+# Sesiones que se conectan a la vez
+EN_PARALELO = 10
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_proceso(pid):
+    """
+    RSS actual de otro proceso en bytes (Linux)
+    """
+    with open(f"/proc/{pid}/status") as f:
+        for linea in f:
+            if linea.startswith("VmRSS:"):
+                return int(linea.split()[1]) * 1024
+    return 0
+
+
+def puerto_libre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def arrancar_servidor(store_path, puerto, timeout=60, env=None):
+    """
+    Lanza `streamlit run dash.py` contra el almacén (con las variables de
+    entorno extra de env) y espera a que responda
+    """
+    env = dict(os.environ, **(env or {}), GENSHIN_SNAPSHOT_PATH=store_path)
+    proceso = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.join(RAIZ, "dash.py"),
+         "--server.headless", "true", "--server.port", str(puerto),
+         "--browser.gatherUsageStats", "false"],
+        cwd=RAIZ, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{puerto}/_stcore/health", timeout=1):
+                return proceso
+        except OSError:
+            time.sleep(0.2)
+    proceso.kill()
+    raise RuntimeError("El servidor de Streamlit no arrancó")
+
+
+def _ack_inmediato(ws):
+    """
+    Pide al kernel (Linux) que confirme enseguida lo recibido. Con el ACK
+    retrasado del cliente, el servidor retiene sus mensajes chicos hasta
+    40 ms y todos los reruns parecen tardar al menos eso.
+    """
+    conexion = ws.transport.get_extra_info("socket")
+    if conexion is not None and hasattr(socket, "TCP_QUICKACK"):
+        conexion.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+
+def _estado_widget(widget_id, valor):
+    """
+    WidgetState con el valor como lo manda el navegador según su tipo
+    """
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    estado = WidgetState(id=widget_id)
+    if isinstance(valor, bool):
+        estado.bool_value = valor
+    elif isinstance(valor, int):
+        estado.int_value = valor
+    elif isinstance(valor, float):
+        estado.double_value = valor
+    elif isinstance(valor, str):
+        estado.string_value = valor
+    else:
+        estado.string_array_value.data.extend(valor)
+    return estado
+
+
+class Sesion:
+    """
+    Una pestaña del navegador: un websocket que corre la app, navega con los
+    botones de la barra lateral y cambia widgets por su key. Como el
+    navegador, en cada rerun reenvía el valor de los widgets que se tocaron
+    y siguen en pantalla, y si todos los widgets cambiados están en el mismo
+    fragmento (st.fragment) pide correr solo ese fragmento.
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.ws = None
+        self.ids = {}
+        self.fragmentos = {}
+        self.valores = {}
+        self.pestana = "Inicio"
+        self.errores = 0
+
+    async def abrir(self):
+        import websockets
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return await self.correr()
+
+    async def correr(self, pestana=None, valores=None):
+        """
+        Pide un rerun (apretando el botón de la pestaña si se pasa, con los
+        valores {key: valor} nuevos de los widgets), espera a que termine y
+        devuelve cuántos segundos tardó
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        self.valores.update(valores or {})
+        mensaje = BackMsg()
+        estado = mensaje.rerun_script
+        estado.query_string = ""
+        estado.page_script_hash = ""
+        fragmentos = {self.fragmentos.get(clave, "") for clave in valores or {}}
+        fragmento = fragmentos.pop() if pestana is None and len(fragmentos) == 1 else ""
+        estado.fragment_id = fragmento
+        for clave, valor in self.valores.items():
+            if clave in self.ids:
+                estado.widget_states.widgets.append(_estado_widget(self.ids[clave], valor))
+        if pestana is not None:
+            widget = estado.widget_states.widgets.add()
+            widget.id = self.ids[f"nav_{pestana}"]
+            widget.trigger_value = True
+            self.pestana = pestana
+
+        inicio = time.perf_counter()
+        _ack_inmediato(self.ws)
+        await self.ws.send(mensaje.SerializeToString())
+        vistos, fragmentos = {}, {}
+        while True:
+            recibido = ForwardMsg()
+            recibido.ParseFromString(await self.ws.recv())
+            _ack_inmediato(self.ws)
+            tipo = recibido.WhichOneof("type")
+            if tipo == "delta" and recibido.delta.WhichOneof("type") == "new_element":
+                elemento = recibido.delta.new_element
+                clase = elemento.WhichOneof("type")
+                if clase == "exception":
+                    self.errores += 1
+                widget_id = getattr(getattr(elemento, clase), "id", "")
+                if widget_id.startswith("$$ID"):
+                    clave = widget_id.rsplit("-", 1)[-1]
+                    vistos[clave] = widget_id
+                    fragmentos[clave] = recibido.delta.fragment_id
+            elif tipo == "script_finished":
+                segundos = time.perf_counter() - inicio
+                break
+
+        if fragmento:
+            # Solo llegó el fragmento: el resto de la página sigue igual
+            self.ids.update(vistos)
+            self.fragmentos.update(fragmentos)
+            return segundos
+        # Los widgets que ya no se muestran vuelven a su valor inicial
+        self.ids, self.fragmentos = vistos, fragmentos
+        self.valores = {clave: valor for clave, valor in self.valores.items() if clave in vistos}
+        return segundos
+
+    async def recorrer(self, pestanas):
+        for pestana in pestanas:
+            await self.correr(pestana)
+
+    async def cerrar(self):
+        await self.ws.close()
+
+
+async def _medir(puerto, pid, cantidades, pestanas):
+    url = f"ws://127.0.0.1:{puerto}/_stcore/stream"
+    abiertas = []
+    resultados = []
+
+    # Una sesión de calentamiento carga el snapshot, los índices y las figuras
+    # compartidas; después se cierra y se toma el RSS base
+    calentamiento = Sesion(url)
+    await calentamiento.abrir()
+    await calentamiento.recorrer(pestanas)
+    await calentamiento.cerrar()
+    await asyncio.sleep(1)
+    base = rss_proceso(pid)
+
+    for cantidad in sorted(cantidades):
+        while len(abiertas) < cantidad:
+            tanda = [Sesion(url) for _ in range(min(EN_PARALELO, cantidad - len(abiertas)))]
+            await asyncio.gather(*(sesion.abrir() for sesion in tanda))
+            await asyncio.gather(*(sesion.recorrer(pestanas) for sesion in tanda))
+            abiertas.extend(tanda)
+        await asyncio.sleep(1)
+        rss = rss_proceso(pid)
+        resultados.append({
+            "sessions": cantidad,
+            "rss_mib": rss / 2**20,
+            "per_session_kib": (rss - base) / cantidad / 1024,
+        })
+
+    await asyncio.gather(*(sesion.cerrar() for sesion in abiertas))
+    return base, resultados
+
+
+def bench_sessions(cantidades, tamano, pestanas=PESTANAS):
+    """
+    RSS del servidor con cada cantidad de sesiones abiertas sobre un roster
+    sintético de tamano filas
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = os.path.join(tmp, "roster.sqlite")
+        SnapshotStore(store_path).save(synthetic_roster(tamano), etag=None, last_modified=None)
+
+        puerto = puerto_libre()
+        servidor = arrancar_servidor(store_path, puerto)
+        try:
+            base, resultados = asyncio.run(_medir(puerto, servidor.pid, cantidades, pestanas))
+        finally:
+            servidor.terminate()
+            servidor.wait(timeout=10)
+    return {"size": tamano, "tabs": pestanas, "base_rss_mib": base / 2**20, "results": resultados}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RSS del servidor de Streamlit con N sesiones abiertas")
+    parser.add_argument("--sessions", type=int, nargs="+", default=SESIONES,
+                        help="Cantidades de sesiones a medir")
+    parser.add_argument("--size", type=int, default=TAMANO, help="Filas del roster sintético")
+    parser.add_argument("--output", help="Guardar el reporte en JSON")
+    args = parser.parse_args(argv)
+
+    reporte = bench_sessions(args.sessions, args.size)
+    print(f"{'Sesiones':>9} {'RSS':>11} {'Por sesión':>12}   (roster de {reporte['size']} filas, "
+          f"base {reporte['base_rss_mib']:.1f} MiB)")
+    for r in reporte["results"]:
+        print(f"{r['sessions']:>9} {r['rss_mib']:>7.1f} MiB {r['per_session_kib']:>8.0f} KiB")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(reporte, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
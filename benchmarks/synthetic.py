@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from roster import encode_roster
+
+ELEMENTOS = ["Pyro", "Hydro", "Electro", "Cryo", "Anemo", "Geo", "Dendro", "Desconocido"]
+ARMAS = ["Sword", "Claymore", "Polearm", "Bow", "Catalyst"]
+REGIONES = [
+    "Mondstadt", "Liyue", "Inazuma", "Sumeru", "Fontaine",
+    "Natlan", "Snezhnaya", "Nod-Krai", "Desconocida",
+]
+
+SILABAS = [
+    "ka", "ze", "ri", "mo", "lu", "ya", "no", "shi", "ta", "ra", "ven", "el",
+    "qi", "xia", "lin", "hu", "fu", "na", "to", "mi", "sa", "ko", "ha", "ru",
+    "dil", "ae", "ber", "cla", "di", "ne", "va", "li", "so", "gan", "yu", "zhi",
+]
+
+# Proporciones aproximadas del roster real (las armas se reparten uniforme)
+PESOS_ELEMENTO = [0.15, 0.14, 0.16, 0.15, 0.15, 0.12, 0.12, 0.01]
+PESOS_REGION = [0.18, 0.2, 0.14, 0.12, 0.12, 0.1, 0.03, 0.03, 0.08]
+
+
+def _nombres(rng, n):
+    """
+    Nombres de dos palabras armados con sílabas al azar
+    """
+    silabas = np.array(SILABAS)
+    nombre = silabas[rng.integers(len(silabas), size=n)]
+    for _ in range(2):
+        nombre = np.char.add(nombre, silabas[rng.integers(len(silabas), size=n)])
+    apellido = np.char.add(silabas[rng.integers(len(silabas), size=n)], silabas[rng.integers(len(silabas), size=n)])
+    return np.char.title(np.char.add(np.char.add(nombre, " "), apellido)).tolist()
+
+
+def _roster_texto(n, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Nombre": _nombres(rng, n),
+        "Elemento": rng.choice(ELEMENTOS, size=n, p=PESOS_ELEMENTO),
+        "Arma": rng.choice(ARMAS, size=n),
+        "Región": rng.choice(REGIONES, size=n, p=PESOS_REGION),
+    })
+
+
+def synthetic_roster(n, seed=0):
+    """
+    Roster limpio de n filas con el mismo esquema que load_data()
+    """
+    return encode_roster(_roster_texto(n, seed))
+
+
+def synthetic_raw_roster(n, seed=0):
+    """
+    Roster como lo devuelve el scraper, con vacíos y "None" sin limpiar
+    """
+    df = _roster_texto(n, seed)
+    df["Elemento"] = df["Elemento"].replace("Desconocido", "")
+    df["Región"] = df["Región"].replace("Desconocida", "None")
+    return df
+
+
+def synthetic_versions(n, versiones, cambios=0.001, seed=0):
+    """
+    Versiones sucesivas de un roster de n filas: en cada una cambia el
+    elemento de una fracción cambios de las filas y se suma la mitad de
+    esa cantidad de personajes nuevos
+    """
+    rng = np.random.default_rng(seed)
+    df = _roster_texto(n, seed)
+    for version in range(versiones):
+        yield encode_roster(df)
+        k = max(1, int(len(df) * cambios))
+        filas = rng.choice(len(df), size=k, replace=False)
+        df = df.copy()
+        df.loc[filas, "Elemento"] = rng.choice(ELEMENTOS, size=k, p=PESOS_ELEMENTO)
+        df = pd.concat([df, _roster_texto(max(1, k // 2), seed + version + 1)], ignore_index=True)
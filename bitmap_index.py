@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+# Cantidad de bits en 1 de cada byte posible (para NumPy < 2.0)
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(bits, axis=None):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits).sum(axis=axis, dtype=np.int64)
+    return _POPCOUNT[bits].sum(axis=axis, dtype=np.int64)
+
+
+class BitmapIndex:
+    """
+    Índice invertido del snapshot: para cada valor de Elemento, Arma y Región
+    guarda un bitset empaquetado (1 bit por fila) con las filas que lo tienen.
+    Una búsqueda combina bitsets con OR dentro de cada filtro y AND entre
+    filtros, sin crear DataFrames intermedios.
+    """
+
+    DIMENSIONES = ("Elemento", "Arma", "Región")
+
+    def __init__(self, df):
+        self.filas_totales = len(df)
+        self.categorias = {}
+        self.bitsets = {}
+        for col in self.DIMENSIONES:
+            codigos = df[col].cat.codes.to_numpy()
+            self.categorias[col] = list(df[col].cat.categories)
+            self.bitsets[col] = np.stack([
+                np.packbits(codigos == i) for i in range(len(self.categorias[col]))
+            ])
+
+        self._todas = np.packbits(np.ones(self.filas_totales, dtype=bool))
+
+    def buscar(self, filtros):
+        """
+        Bitset de las filas que cumplen todos los filtros ({columna: [valores]}).
+        Una lista vacía o None no filtra esa columna.
+        """
+        seleccion = self._todas.copy()
+        for col, valores in filtros.items():
+            if not valores:
+                continue
+            posiciones = [self.categorias[col].index(v) for v in valores if v in self.categorias[col]]
+            if not posiciones:
+                return np.zeros_like(seleccion)
+            seleccion &= np.bitwise_or.reduce(self.bitsets[col][posiciones], axis=0)
+        return seleccion
+
+    def contar(self, seleccion):
+        """
+        Cantidad de filas en la selección
+        """
+        return int(_popcount(seleccion))
+
+    def conteo(self, seleccion, columna):
+        """
+        Cantidad de filas seleccionadas por categoría de la columna (incluye ceros)
+        """
+        cruces = self.bitsets[columna] & seleccion
+        return pd.Series(
+            _popcount(cruces, axis=1),
+            index=pd.Index(self.categorias[columna], name=columna),
+        )
+
+    def desde_filas(self, filas):
+        """
+        Bitset con las posiciones dadas (p. ej. los resultados de NameIndex)
+        """
+        bits = np.zeros(self.filas_totales, dtype=bool)
+        bits[filas] = True
+        return np.packbits(bits)
+
+    def filas(self, seleccion):
+        """
+        Posiciones (para df.iloc) de las filas seleccionadas
+        """
+        return np.flatnonzero(np.unpackbits(seleccion, count=self.filas_totales))
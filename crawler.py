@@ -0,0 +1,131 @@
+import hashlib
+import json
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urljoin
+
+import pandas as pd
+from lxml import html as lxml_html
+
+from http_client import POR_HOST, default_client
+from roster import DETALLES
+
+# -------------------- CONFIGURACIÓN --------------------
+# Páginas de personaje descargadas a la vez (no más que el tope por host del cliente)
+CONCURRENCIA = POR_HOST
+
+
+# -------------------- PARSEO --------------------
+def parse_character_page(html):
+    """
+    Extrae del infobox de la página de un personaje la rareza, la constelación
+    y la fecha y versión de salida. Lo que no esté en la página queda en None.
+    """
+    arbol = lxml_html.fromstring(html)
+    campos = {}
+    for item in arbol.xpath('//aside[contains(@class, "portable-infobox")]//*[@data-source]'):
+        valor = item.find_class("pi-data-value")
+        if valor:
+            campos[item.get("data-source")] = valor[0]
+
+    rareza = None
+    if "quality" in campos:
+        # La rareza es una imagen de estrellas: el número está en el alt
+        img = campos["quality"].find(".//img")
+        texto = img.get("alt", "") if img is not None else campos["quality"].text_content()
+        numero = re.search(r"\d", texto)
+        rareza = int(numero.group()) if numero else None
+
+    constelacion = None
+    if "constellation" in campos:
+        constelacion = campos["constellation"].text_content().strip() or None
+
+    lanzamiento = version = None
+    if "releaseDate" in campos:
+        texto = campos["releaseDate"].text_content()
+        numero = re.search(r"Version\s+(\d+(?:\.\d+)+)", texto)
+        version = numero.group(1) if numero else None
+        fecha = texto.split("(")[0].strip()
+        try:
+            lanzamiento = datetime.strptime(fecha, "%B %d, %Y").date().isoformat()
+        except ValueError:
+            lanzamiento = fecha or None
+
+    return {"Rareza": rareza, "Constelación": constelacion, "Versión": version, "Lanzamiento": lanzamiento}
+
+
+# -------------------- DESCARGA --------------------
+def _visitar(client, url, guardada):
+    """
+    Descarga una página (condicional si ya se había descargado) y devuelve
+    (estado, fila para la tabla paginas o None)
+    """
+    headers = {}
+    if guardada is not None:
+        if guardada["etag"]:
+            headers["If-None-Match"] = guardada["etag"]
+        if guardada["last_modified"]:
+            headers["If-Modified-Since"] = guardada["last_modified"]
+
+    try:
+        response = client.get(url, headers=headers)
+    except Exception:
+        return "error", guardada
+
+    ahora = time.time()
+    if response.status_code == 304 and guardada is not None:
+        return "304", dict(guardada, checked_at=ahora)
+    if response.status_code != 200:
+        return "error", guardada
+
+    # Sin validadores (o si la wiki los cambió sin cambiar la página)
+    # el hash evita volver a parsear un contenido que ya se conoce
+    huella = hashlib.sha256(response.content).hexdigest()
+    fila = {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "hash": huella,
+        "checked_at": ahora,
+    }
+    if guardada is not None and guardada["hash"] == huella:
+        return "igual", dict(fila, datos=guardada["datos"])
+    try:
+        datos = parse_character_page(response.content)
+    except Exception:
+        return "error", guardada
+    return "nueva", dict(fila, datos=json.dumps(datos, ensure_ascii=False))
+
+
+def crawl_details(enlaces, base_url, store, client=None, concurrencia=CONCURRENCIA):
+    """
+    Recorre en paralelo la página de cada personaje (enlaces relativos a
+    base_url) y devuelve un DataFrame con las columnas de DETALLES, una fila
+    por enlace y en el mismo orden.
+
+    Lo descargado se guarda en store por url: las páginas se piden con los
+    validadores de la última descarga y un 304, o un contenido con el mismo
+    hash, reutiliza los datos guardados sin parsear. Si una página falla se
+    usan sus datos anteriores (o quedan nulos). En detalles.attrs["paginas"]
+    queda cuántas páginas terminaron en cada estado (nueva, 304, igual, error).
+    """
+    urls = [urljoin(base_url, enlace) if isinstance(enlace, str) and enlace else None for enlace in enlaces]
+    unicas = list(dict.fromkeys(url for url in urls if url))
+    guardadas = store.cached_pages(unicas)
+    client = client or default_client()
+
+    with ThreadPoolExecutor(max_workers=concurrencia) as pool:
+        resultados = dict(zip(unicas, pool.map(lambda url: _visitar(client, url, guardadas.get(url)), unicas)))
+
+    store.save_pages([fila for estado, fila in resultados.values() if estado != "error"])
+
+    datos = {}
+    for url, (_, fila) in resultados.items():
+        if fila is not None:
+            datos[url] = json.loads(fila["datos"])
+    detalles = pd.DataFrame([datos.get(url, {}) for url in urls], columns=DETALLES)
+    detalles.attrs["paginas"] = dict(Counter(estado for estado, _ in resultados.values()))
+    return detalles
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+
+class RosterCube:
+    """
+    Conteos de personajes por (Elemento, Arma, Región) de un snapshot.
+    Se calcula una sola vez al cargar los datos; los KPIs, tablas y gráficos
+    de cada pestaña son cortes o sumas de este arreglo de pocas celdas.
+    """
+
+    DIMENSIONES = ("Elemento", "Arma", "Región")
+
+    def __init__(self, df):
+        self.categorias = {col: list(df[col].cat.categories) for col in self.DIMENSIONES}
+        forma = tuple(len(self.categorias[col]) for col in self.DIMENSIONES)
+        codigos = [df[col].cat.codes.to_numpy(np.int64) for col in self.DIMENSIONES]
+        celdas = np.ravel_multi_index(codigos, forma)
+        self.conteos = np.bincount(celdas, minlength=int(np.prod(forma))).reshape(forma)
+
+    @property
+    def total(self):
+        return int(self.conteos.sum())
+
+    def contar(self, columnas, filtros=None):
+        """
+        Suma del cubo sobre las dimensiones que no están en columnas.
+        filtros es {columna: [valores]} y restringe cada dimensión a esos valores.
+        """
+        conteos = self.conteos
+        for col, valores in (filtros or {}).items():
+            eje = self.DIMENSIONES.index(col)
+            posiciones = [self.categorias[col].index(v) for v in valores if v in self.categorias[col]]
+            mascara = np.zeros(conteos.shape[eje], dtype=bool)
+            mascara[posiciones] = True
+            forma = [1] * conteos.ndim
+            forma[eje] = -1
+            conteos = conteos * mascara.reshape(forma)
+
+        ejes = tuple(i for i, col in enumerate(self.DIMENSIONES) if col not in columnas)
+        conteos = conteos.sum(axis=ejes)
+
+        # Reordenar según el orden pedido en columnas
+        restantes = [col for col in self.DIMENSIONES if col in columnas]
+        return np.transpose(conteos, [restantes.index(col) for col in columnas])
+
+    def serie(self, columna, filtros=None):
+        """
+        Cantidad de personajes por categoría de la columna (incluye ceros)
+        """
+        return pd.Series(
+            self.contar([columna], filtros),
+            index=pd.Index(self.categorias[columna], name=columna),
+        )
+
+    def tabla(self, filas, columnas, filtros=None):
+        """
+        Tabla de conteos de dos dimensiones (incluye ceros)
+        """
+        return pd.DataFrame(
+            self.contar([filas, columnas], filtros),
+            index=pd.Index(self.categorias[filas], name=filas),
+            columns=pd.Index(self.categorias[columnas], name=columnas),
+        )
@@ -0,0 +1,115 @@
+"""
+Exportación de una selección de filas del roster a Parquet, Arrow IPC o CSV.
+
+Las filas llegan como posiciones de df (las que dan BitmapIndex.filas o la
+búsqueda por nombre) y se escriben por bloques de FILAS_POR_BLOQUE: nunca se
+arma una copia completa del resultado, ni como DataFrame ni como tabla de
+Arrow. export_chunks va entregando los bytes de cada bloque apenas se
+escriben, así que quien los envía (api.py) usa la misma memoria exporte
+cien filas o un millón.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+# Filas que se convierten y escriben por vez (un row group de Parquet)
+FILAS_POR_BLOQUE = 65_536
+
+
+@dataclass(frozen=True)
+class Formato:
+    """
+    Formato de exportación: extensión del archivo y tipo MIME
+    """
+    extension: str
+    mime: str
+    nombre: str
+
+
+FORMATOS = {
+    "parquet": Formato("parquet", "application/vnd.apache.parquet", "Parquet"),
+    "arrow": Formato("arrows", "application/vnd.apache.arrow.stream", "Arrow IPC"),
+    "csv": Formato("csv", "text/csv", "CSV"),
+}
+
+
+class _Salida:
+    """
+    Archivo en memoria que entrega lo escrito desde la última vez y lo olvida
+    """
+    closed = False
+
+    def __init__(self):
+        self._partes = []
+
+    def write(self, datos):
+        self._partes.append(bytes(datos))
+        return len(datos)
+
+    def flush(self):
+        pass
+
+    def tomar(self):
+        datos = b"".join(self._partes)
+        self._partes.clear()
+        return datos
+
+
+def _bloques(df, filas, filas_por_bloque):
+    if filas is None:
+        filas = np.arange(len(df))
+    for inicio in range(0, len(filas), filas_por_bloque):
+        yield df.iloc[filas[inicio:inicio + filas_por_bloque]]
+
+
+def export_chunks(df, filas, formato, filas_por_bloque=FILAS_POR_BLOQUE):
+    """
+    Bytes del archivo con las filas (posiciones de df, None = todas) en el
+    formato pedido, bloque por bloque
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido: {formato} (formatos: {', '.join(FORMATOS)})")
+
+    if formato == "csv":
+        encabezado = True
+        for bloque in _bloques(df, filas, filas_por_bloque):
+            yield bloque.to_csv(index=False, header=encabezado, lineterminator="\n").encode("utf-8")
+            encabezado = False
+        if encabezado:
+            yield df.iloc[:0].to_csv(index=False, lineterminator="\n").encode("utf-8")
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # El esquema sale de las columnas, no de los datos: es el mismo en todos
+    # los bloques aunque alguno tenga una columna de detalle toda vacía
+    esquema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    salida = _Salida()
+    if formato == "parquet":
+        escritor = pq.ParquetWriter(salida, esquema, compression="zstd")
+    else:
+        escritor = pa.ipc.new_stream(salida, esquema)
+    with escritor:
+        for bloque in _bloques(df, filas, filas_por_bloque):
+            lote = pa.RecordBatch.from_pandas(bloque, schema=esquema, preserve_index=False)
+            if formato == "parquet":
+                escritor.write_batch(lote, row_group_size=filas_por_bloque)
+            else:
+                escritor.write_batch(lote)
+            yield salida.tomar()
+    yield salida.tomar()
+
+
+def export_bytes(df, filas, formato):
+    """
+    El archivo completo (para st.download_button, que lo guarda entero en memoria)
+    """
+    return b"".join(export_chunks(df, filas, formato))
+
+
+def file_name(snapshot, nombre, formato):
+    """
+    Nombre del archivo: tabla, juego y versión del snapshot
+    """
+    return f"{nombre}_{snapshot.juego or 'todos'}_v{snapshot.version}.{FORMATOS[formato].extension}"
@@ -0,0 +1,51 @@
+import os
+import threading
+from collections import OrderedDict
+
+# Memoria máxima (JSON serializado de las figuras) del caché compartido
+MAX_BYTES = int(os.environ.get("GENSHIN_FIGURE_CACHE_MB", "64")) * 1024 * 1024
+
+
+class FigureCache:
+    """
+    Figuras de Plotly ya construidas, compartidas por todas las sesiones.
+    La clave es (versión y juego del snapshot, pestaña, figura, filtros), así que una
+    figura solo se vuelve a construir cuando cambia alguno de sus datos.
+    Cuando el tamaño en JSON de las figuras guardadas supera max_bytes se
+    descartan las usadas hace más tiempo.
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._figuras = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._figuras)
+
+    def obtener(self, clave, construir):
+        """
+        Figura guardada para la clave o, si no está, construir() (fuera del lock)
+        """
+        with self._lock:
+            if clave in self._figuras:
+                self._figuras.move_to_end(clave)
+                self.hits += 1
+                return self._figuras[clave][0]
+            self.misses += 1
+
+        figura = construir()
+        tamano = len(figura.to_json())
+
+        with self._lock:
+            if clave not in self._figuras:
+                self._figuras[clave] = (figura, tamano)
+                self.bytes += tamano
+            # Siempre queda al menos la última figura, aunque sola supere el límite
+            while self.bytes > self.max_bytes and len(self._figuras) > 1:
+                _, (_, descartada) = self._figuras.popitem(last=False)
+                self.bytes -= descartada
+        return figura
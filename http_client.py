@@ -0,0 +1,95 @@
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+# -------------------- CONFIGURACIÓN --------------------
+# Segundos para conectar y para esperar cada lectura de la respuesta
+TIMEOUT = (5, 30)
+
+# Reintentos ante 429/5xx y errores de conexión. El primero es inmediato y
+# los siguientes esperan BACKOFF * 2**(n-1) s más hasta JITTER s al azar,
+# nunca más de BACKOFF_MAX (tampoco si el servidor pide más con Retry-After).
+REINTENTOS = 3
+BACKOFF = 0.5
+BACKOFF_MAX = 10
+JITTER = 0.5
+ESTADOS_REINTENTO = (429, 500, 502, 503, 504)
+
+# Peticiones simultáneas como máximo contra un mismo host
+POR_HOST = 8
+
+
+class _Retry(Retry):
+    """
+    Retry de urllib3 con Retry-After acotado a backoff_max
+    """
+
+    def get_retry_after(self, response):
+        espera = super().get_retry_after(response)
+        return None if espera is None else min(espera, self.backoff_max)
+
+
+class HttpClient:
+    """
+    Sesión HTTP compartida por los scrapes: conexiones keep-alive reutilizadas,
+    timeouts, reintentos con backoff exponencial y jitter, compresión
+    (gzip, y brotli si está instalado) y un tope de peticiones simultáneas por host.
+    """
+
+    def __init__(self, timeout=TIMEOUT, reintentos=REINTENTOS, backoff=BACKOFF,
+                 backoff_max=BACKOFF_MAX, jitter=JITTER, por_host=POR_HOST):
+        self.timeout = timeout
+        self.por_host = por_host
+        self._limites = {}
+        self._lock = threading.Lock()
+
+        retry = _Retry(
+            total=reintentos,
+            backoff_factor=backoff,
+            backoff_max=backoff_max,
+            backoff_jitter=jitter,
+            status_forcelist=ESTADOS_REINTENTO,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            # Agotados los reintentos se devuelve la última respuesta (p. ej. 503)
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=por_host)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+
+    def _limite(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._limites:
+                self._limites[host] = threading.BoundedSemaphore(self.por_host)
+            return self._limites[host]
+
+    def get(self, url, **kwargs):
+        """
+        requests.get con los timeouts y reintentos del cliente
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        with self._limite(url):
+            return self.session.get(url, **kwargs)
+
+
+_cliente = None
+_cliente_lock = threading.Lock()
+
+
+def default_client():
+    """
+    Cliente único por proceso, creado en el primer uso
+    """
+    global _cliente
+    with _cliente_lock:
+        if _cliente is None:
+            _cliente = HttpClient()
+        return _cliente
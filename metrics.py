@@ -0,0 +1,290 @@
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# -------------------- CONFIGURACIÓN --------------------
+# Límites en segundos de los buckets de los histogramas: los de Prometheus
+# más tres por debajo de 5 ms (cargar datos o paginar una tabla cuesta menos)
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Puerto del endpoint /metrics y /metrics.json (sin definir no se abre ninguno)
+PUERTO = os.environ.get("GENSHIN_METRICS_PORT")
+
+
+# -------------------- MEMORIA --------------------
+def rss_bytes():
+    """
+    Memoria residente actual del proceso (0 si el sistema no la expone)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def peak_rss_bytes():
+    """
+    Memoria residente máxima que alcanzó el proceso
+    """
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux la informa en KiB y macOS en bytes
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+# -------------------- REGISTRO --------------------
+def _cuantil(conteos, buckets, q, minimo, maximo):
+    """
+    Cuantil q estimado de un histograma, interpolando dentro del bucket
+    (como histogram_quantile de Prometheus) y acotado a lo observado
+    """
+    return min(max(_interpolar(conteos, buckets, q), minimo), maximo)
+
+
+def _interpolar(conteos, buckets, q):
+    objetivo = q * sum(conteos)
+    acumulado = 0
+    for i, conteo in enumerate(conteos):
+        if conteo and acumulado + conteo >= objetivo:
+            # El último bucket (+Inf) no tiene límite: queda acotado por el máximo
+            if i == len(buckets):
+                return float("inf")
+            inferior = buckets[i - 1] if i else 0.0
+            return inferior + (buckets[i] - inferior) * (objetivo - acumulado) / conteo
+        acumulado += conteo
+    return float("inf")
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _etiquetas(etiquetas):
+    """
+    {k="v",...} en el formato de Prometheus (vacío si no hay etiquetas)
+    """
+    if not etiquetas:
+        return ""
+    return "{" + ",".join(f'{k}="{_escapar(v)}"' for k, v in etiquetas) + "}"
+
+
+class Metrics:
+    """
+    Tiempos por etapa (scrape, carga del snapshot, cada pestaña, figuras,
+    tablas) en histogramas con etiquetas, compartidos por todas las sesiones
+    del proceso. Cada etapa suma también cuánto creció la memoria residente
+    mientras corría. Los colectores registrados agregan al exportar otras
+    métricas que ya se llevan en otro lado (caché de figuras, scrapes).
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._etapas = {}
+        self._colectores = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def medir(self, etapa, **etiquetas):
+        """
+        Registra la duración del bloque en el histograma de la etapa
+        """
+        rss = rss_bytes()
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observar(etapa, time.perf_counter() - inicio, rss_bytes() - rss, **etiquetas)
+
+    def observar(self, etapa, segundos, rss=0, **etiquetas):
+        """
+        Agrega una medición ya tomada (segundos y crecimiento de memoria en bytes)
+        """
+        clave = (etapa, tuple(sorted(etiquetas.items())))
+        with self._lock:
+            datos = self._etapas.get(clave)
+            if datos is None:
+                datos = self._etapas[clave] = {
+                    "conteos": [0] * (len(self.buckets) + 1), "suma": 0.0, "rss": 0,
+                    "min": segundos, "max": segundos,
+                }
+            datos["conteos"][bisect_left(self.buckets, segundos)] += 1
+            datos["suma"] += segundos
+            datos["min"] = min(datos["min"], segundos)
+            datos["max"] = max(datos["max"], segundos)
+            datos["rss"] += max(rss, 0)
+
+    def registrar(self, colector):
+        """
+        colector() devuelve familias (nombre, tipo, ayuda, [(etiquetas, valor), ...])
+        que se exportan junto con los histogramas
+        """
+        with self._lock:
+            self._colectores.append(colector)
+
+    def etapas(self):
+        """
+        Resumen de cada etapa: cantidad, media, p50 y p95 estimados, memoria
+        """
+        with self._lock:
+            copia = [(clave, dict(datos, conteos=list(datos["conteos"]))) for clave, datos in self._etapas.items()]
+        resumen = []
+        for (etapa, etiquetas), datos in sorted(copia):
+            total = sum(datos["conteos"])
+            resumen.append({
+                "stage": etapa,
+                "labels": dict(etiquetas),
+                "count": total,
+                "seconds_sum": datos["suma"],
+                "seconds_mean": datos["suma"] / total,
+                "seconds_max": datos["max"],
+                "seconds_p50": _cuantil(datos["conteos"], self.buckets, 0.5, datos["min"], datos["max"]),
+                "seconds_p95": _cuantil(datos["conteos"], self.buckets, 0.95, datos["min"], datos["max"]),
+                "rss_growth_bytes": datos["rss"],
+                "buckets": dict(zip([*map(str, self.buckets), "+Inf"], datos["conteos"])),
+            })
+        return resumen
+
+    def _familias(self):
+        familias = [
+            ("process_resident_memory_bytes", "gauge", "Memoria residente del proceso", [((), rss_bytes())]),
+            ("genshin_peak_resident_memory_bytes", "gauge", "Memoria residente máxima del proceso",
+             [((), peak_rss_bytes())]),
+        ]
+        with self._lock:
+            colectores = list(self._colectores)
+        for colector in colectores:
+            familias.extend(colector())
+        return familias
+
+    def prometheus(self):
+        """
+        Todas las métricas en el formato de texto de Prometheus
+        """
+        lineas = [
+            "# HELP genshin_stage_seconds Duración de cada etapa de un rerun o de un scrape",
+            "# TYPE genshin_stage_seconds histogram",
+        ]
+        crecimiento = []
+        for etapa in self.etapas():
+            etiquetas = (("stage", etapa["stage"]), *sorted(etapa["labels"].items()))
+            acumulado = 0
+            for limite, conteo in etapa["buckets"].items():
+                acumulado += conteo
+                lineas.append(f"genshin_stage_seconds_bucket{_etiquetas((*etiquetas, ('le', limite)))} {acumulado}")
+            lineas.append(f"genshin_stage_seconds_sum{_etiquetas(etiquetas)} {etapa['seconds_sum']:.6f}")
+            lineas.append(f"genshin_stage_seconds_count{_etiquetas(etiquetas)} {etapa['count']}")
+            crecimiento.append((etiquetas, etapa["rss_growth_bytes"]))
+
+        familias = [("genshin_stage_rss_growth_bytes_total", "counter",
+                     "Crecimiento de la memoria residente durante cada etapa", crecimiento)]
+        for nombre, tipo, ayuda, muestras in familias + self._familias():
+            lineas.append(f"# HELP {nombre} {ayuda}")
+            lineas.append(f"# TYPE {nombre} {tipo}")
+            for etiquetas, valor in muestras:
+                lineas.append(f"{nombre}{_etiquetas(etiquetas)} {valor}")
+        return "\n".join(lineas) + "\n"
+
+    def json(self):
+        """
+        Las mismas métricas en JSON (etapas con su resumen y el resto por nombre)
+        """
+        otras = {
+            nombre: [dict(etiquetas, value=valor) for etiquetas, valor in muestras]
+            for nombre, _, _, muestras in self._familias()
+        }
+        return json.dumps({"timestamp": time.time(), "stages": self.etapas(), "metrics": otras},
+                          indent=2, ensure_ascii=False)
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """
+    Registro único por proceso, creado en el primer uso
+    """
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = Metrics()
+        return _metrics
+
+
+# -------------------- MÉTRICAS DE LA APP --------------------
+def figure_cache_metrics(cache):
+    """
+    Aciertos, fallos y tamaño del caché de figuras
+    """
+    return [
+        ("genshin_figure_cache_hits_total", "counter", "Figuras servidas desde el caché", [((), cache.hits)]),
+        ("genshin_figure_cache_misses_total", "counter", "Figuras que hubo que construir", [((), cache.misses)]),
+        ("genshin_figure_cache_bytes", "gauge", "Tamaño en JSON de las figuras guardadas", [((), cache.bytes)]),
+        ("genshin_figure_cache_entries", "gauge", "Figuras guardadas", [((), len(cache))]),
+    ]
+
+
+def scrape_metrics(store, snapshot):
+    """
+    Versión servida y scrapes registrados por publish.py en el almacén, por juego
+    """
+    familias = [
+        ("genshin_snapshot_version", "gauge", "Versión del snapshot que sirve la app",
+         [((), snapshot.version if snapshot is not None else 0)]),
+        ("genshin_scrapes_total", "counter", "Scrapes registrados por juego y resultado",
+         [((("game", juego), ("result", resultado)), cantidad)
+          for (juego, resultado), cantidad in store.scrape_counts().items()]),
+    ]
+    ultimos = store.last_scrapes()
+    if len(ultimos):
+        juegos = [(("game", juego),) for juego in ultimos['Juego']]
+        etapas = [
+            ((("game", ultimo.Juego), ("stage", etapa)), segundos)
+            for ultimo in ultimos.itertuples() for etapa, segundos in json.loads(ultimo.Etapas).items()
+        ]
+        familias += [
+            ("genshin_last_scrape_seconds", "gauge", "Duración del último scrape de cada juego",
+             list(zip(juegos, ultimos['Segundos']))),
+            ("genshin_last_scrape_timestamp_seconds", "gauge", "Inicio del último scrape de cada juego",
+             list(zip(juegos, ultimos['Inicio']))),
+            ("genshin_last_scrape_stage_seconds", "gauge", "Duración de cada etapa del último scrape", etapas),
+        ]
+    return familias
+
+
+# -------------------- ENDPOINT HTTP --------------------
+def start_http_server(metrics, port, host="0.0.0.0"):
+    """
+    Sirve /metrics (Prometheus) y /metrics.json en un hilo aparte
+    """
+    # http.server solo se carga si se pide el endpoint (suma ~30 ms al arranque)
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                cuerpo, tipo = metrics.prometheus(), "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path == "/metrics.json":
+                cuerpo, tipo = metrics.json(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            cuerpo = cuerpo.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", tipo)
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer((host, port), MetricsHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, name="metrics-http", daemon=True).start()
+    return httpd
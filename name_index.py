@@ -0,0 +1,146 @@
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+# Listas de filas más largas que esto no se usan para juntar candidatas:
+# aportan poca información y harían crecer la latencia con el tamaño del roster
+MAX_POSTINGS = 1024
+
+# Candidatas (las más votadas) que se puntúan contra todos los trigramas
+MAX_CANDIDATAS = 512
+
+# Fracción mínima de trigramas de la consulta que debe tener un nombre
+MIN_PUNTAJE = 0.4
+
+
+_ACENTOS = re.compile("[\u0300-\u036f]")
+_SEPARADORES = re.compile(r"[^\w]+")
+
+
+def normalizar(texto):
+    """
+    Minúsculas, sin acentos y solo letras, dígitos y espacios
+    """
+    texto = unicodedata.normalize("NFKD", str(texto))
+    return _SEPARADORES.sub(" ", _ACENTOS.sub("", texto).lower()).strip()
+
+
+def _claves(palabras, cierre=" "):
+    """
+    Trigramas de cada palabra con dos espacios al inicio y `cierre` al final
+    (como pg_trgm), codificados como enteros de 63 bits.
+    Devuelve (claves, posición de la palabra).
+    """
+    rellenas = np.char.add(np.char.add("  ", np.asarray(palabras, dtype=str)), cierre)
+    largos = np.char.str_len(rellenas)
+    if len(rellenas) == 0 or largos.max() < 3:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # Cada carácter como su código Unicode (21 bits)
+    puntos = rellenas.view(np.uint32).reshape(len(rellenas), -1).astype(np.int64)
+    claves = (puntos[:, :-2] << 42) | (puntos[:, 1:-1] << 21) | puntos[:, 2:]
+    validas = np.arange(claves.shape[1]) < (largos - 2)[:, None]
+    return claves[validas], np.nonzero(validas)[0]
+
+
+class NameIndex:
+    """
+    Índice sobre Nombre para búsquedas tolerantes a errores mientras se escribe:
+    listas de filas por trigrama y las palabras de cada nombre ordenadas
+    alfabéticamente para encontrar prefijos por búsqueda binaria.
+    """
+
+    def __init__(self, nombres):
+        self.normalizados = [normalizar(nombre) for nombre in nombres]
+        palabras = pd.Series(self.normalizados, dtype=object).str.split().explode().dropna()
+        filas_palabra = palabras.index.to_numpy(np.int64)
+        palabras = palabras.to_numpy(dtype=str)
+
+        # Trigramas: (clave, fila) sin repetir, ordenados por clave
+        claves, posicion = _claves(palabras)
+        filas = filas_palabra[posicion]
+        orden = np.lexsort((filas, claves))
+        claves, filas = claves[orden], filas[orden]
+        nuevas = np.ones(len(claves), dtype=bool)
+        nuevas[1:] = (claves[1:] != claves[:-1]) | (filas[1:] != filas[:-1])
+        claves, filas = claves[nuevas], filas[nuevas]
+
+        self._claves, self._inicio = np.unique(claves, return_index=True)
+        self._inicio = np.append(self._inicio, len(claves))
+        self._filas = filas
+        self._por_fila = np.bincount(self._filas, minlength=len(self.normalizados))
+
+        # Prefijos: palabras ordenadas con la fila a la que pertenecen
+        orden = np.argsort(palabras, kind="stable")
+        self._palabras = palabras[orden]
+        self._filas_palabra = filas_palabra[orden]
+
+    def _postings(self, clave):
+        i = np.searchsorted(self._claves, clave)
+        if i == len(self._claves) or self._claves[i] != clave:
+            return None
+        return self._filas[self._inicio[i]:self._inicio[i + 1]]
+
+    def _con_prefijo(self, prefijo):
+        inicio = np.searchsorted(self._palabras, prefijo, side="left")
+        fin = np.searchsorted(self._palabras, prefijo + "\U0010ffff", side="left")
+        return self._filas_palabra[inicio:min(fin, inicio + MAX_POSTINGS)]
+
+    def buscar(self, consulta, limite=20, seleccion=None):
+        """
+        Filas cuyo nombre se parece a la consulta, de mejor a peor.
+        seleccion es un bitset empaquetado (BitmapIndex) que restringe las filas.
+        Devuelve (filas, puntajes).
+        """
+        vacio = (np.empty(0, dtype=np.int64), np.empty(0))
+        consulta = normalizar(consulta)
+        palabras = consulta.split()
+        if not palabras:
+            return vacio
+
+        # La última palabra no se cierra: "kaz" ya encuentra "Kazuha"
+        claves = np.concatenate([_claves(palabras[:-1])[0], _claves(palabras[-1:], cierre="")[0]])
+        claves = np.unique(claves)
+        postings = sorted((p for p in map(self._postings, claves) if p is not None), key=len)
+
+        # Candidatas: trigramas poco frecuentes y palabras con prefijo de la consulta
+        fuentes = [p for p in postings if len(p) <= MAX_POSTINGS]
+        fuentes += [self._con_prefijo(palabra) for palabra in palabras]
+        if postings and not any(len(f) for f in fuentes):
+            fuentes.append(postings[0][:MAX_POSTINGS])
+        candidatas, votos = np.unique(np.concatenate(fuentes), return_counts=True)
+
+        if seleccion is not None:
+            dentro = (seleccion[candidatas >> 3] >> (7 - (candidatas & 7))) & 1
+            candidatas, votos = candidatas[dentro == 1], votos[dentro == 1]
+        if len(candidatas) == 0:
+            return vacio
+        if len(candidatas) > MAX_CANDIDATAS:
+            candidatas = np.sort(candidatas[np.argpartition(-votos, MAX_CANDIDATAS)[:MAX_CANDIDATAS]])
+
+        # Trigramas de la consulta presentes en cada candidata
+        coincidencias = np.zeros(len(candidatas), dtype=np.int64)
+        for p in postings:
+            posicion = np.searchsorted(p, candidatas)
+            posicion[posicion == len(p)] = 0
+            coincidencias += p[posicion] == candidatas
+
+        # Cobertura de la consulta y, para desempatar, similitud de Jaccard
+        cobertura = coincidencias / len(claves)
+        jaccard = coincidencias / (len(claves) + self._por_fila[candidatas] - coincidencias)
+        puntajes = cobertura + 0.1 * jaccard
+
+        # Coincidencia exacta primero; luego nombres con una palabra que empieza por la consulta
+        mejores = np.argsort(-puntajes, kind="stable")[:limite * 5]
+        for i in mejores:
+            nombre = self.normalizados[candidatas[i]]
+            if nombre == consulta:
+                puntajes[i] += 2
+            elif (" " + consulta) in (" " + nombre):
+                puntajes[i] += 1
+
+        mejores = mejores[puntajes[mejores] >= MIN_PUNTAJE]
+        mejores = mejores[np.argsort(-puntajes[mejores], kind="stable")][:limite]
+        return candidatas[mejores], puntajes[mejores]
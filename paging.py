@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+# Opciones de filas por página de las tablas (la primera es la predeterminada)
+TAMANOS_PAGINA = [50, 25, 100, 250]
+
+
+def paginas(total, tamano):
+    """
+    Cantidad de páginas para total filas (al menos una)
+    """
+    return max(1, -(-total // tamano))
+
+
+class TablePager:
+    """
+    Ordena y recorta en el servidor las filas de un resultado para que al
+    navegador solo llegue la página visible. Cada columna se ordena por una
+    clave entera (códigos de las categóricas, rango de los textos) que se
+    calcula una sola vez por snapshot.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.columnas = list(df.columns)
+        self._claves = {}
+
+    def _clave(self, columna):
+        if columna not in self._claves:
+            serie = self.df[columna]
+            if isinstance(serie.dtype, pd.CategoricalDtype):
+                # Las categorías ya están en orden alfabético
+                clave = serie.cat.codes.to_numpy(np.int64)
+            else:
+                orden = serie.argsort(kind="stable").to_numpy()
+                clave = np.empty(len(orden), dtype=np.int64)
+                clave[orden] = np.arange(len(orden))
+            # Se comparte entre sesiones como el resto del snapshot
+            clave.flags.writeable = False
+            self._claves[columna] = clave
+        return self._claves[columna]
+
+    def pagina(self, filas=None, numero=1, tamano=TAMANOS_PAGINA[0], orden=None, descendente=False):
+        """
+        Filas de la página numero (desde 1) del resultado.
+        filas son posiciones de df (None = todo el roster); con orden None se
+        respeta su orden (p. ej. el de relevancia de la búsqueda por nombre).
+        """
+        if filas is None:
+            filas = np.arange(len(self.df))
+        inicio = (numero - 1) * tamano
+        fin = min(inicio + tamano, len(filas))
+        if inicio >= fin:
+            return self.df.iloc[:0]
+
+        if orden is None:
+            return self.df.iloc[filas[inicio:fin]]
+
+        # Clave única (valor, fila) para que los empates queden en orden de fila;
+        # argpartition deja la ventana en su lugar sin ordenar todo el resultado
+        clave = self._clave(orden)[filas]
+        if descendente:
+            clave = clave.max() - clave
+        clave = clave * len(self.df) + filas
+        ventana = np.argpartition(clave, [inicio, fin - 1])[inicio:fin]
+        ventana = ventana[np.argsort(clave[ventana])]
+        return self.df.iloc[filas[ventana]]
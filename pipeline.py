@@ -0,0 +1,123 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from metrics import get_metrics
+from roster import add_details, clean_roster
+from snapshot_store import Snapshot
+from sources import GENSHIN, Source
+
+# Edad máxima de un snapshot antes de revalidarlo contra la wiki
+MAX_AGE = 86400
+
+# Recorrer también la página de cada personaje (rareza, constelación, versión)
+DETALLES = os.environ.get("GENSHIN_CRAWL_DETAILS", "1") != "0"
+
+
+def is_fresh(snapshot, max_age=MAX_AGE):
+    """
+    Indica si el snapshot se revalidó hace menos de max_age segundos
+    """
+    return snapshot is not None and time.time() - snapshot.checked_at < max_age
+
+
+def refresh_snapshot(store, snapshot=None, url=None, detalles=DETALLES, fuente=GENSHIN):
+    """
+    Revalida el roster de un juego contra su wiki (url por defecto: la de
+    la fuente) y devuelve el snapshot vigente de ese juego. Con un 304 no se
+    parsea nada: solo se marca el snapshot como revisado. Si la lista cambió,
+    detalles es True y la fuente lo admite, se recorren además las páginas
+    de los personajes (ver crawler.py).
+    """
+    # El scraper (requests, bs4, lxml) solo se carga cuando hay que ir a la wiki
+    from scraper import fetch_characters_page, parse_table
+
+    url = url or fuente.url
+    metrics = get_metrics()
+    if snapshot is None:
+        snapshot = store.latest(fuente.game)
+
+    with metrics.medir("scrape.fetch", game=fuente.game):
+        if snapshot is not None:
+            response = fetch_characters_page(snapshot.etag, snapshot.last_modified, url=url)
+        else:
+            response = fetch_characters_page(url=url)
+
+    if response.status_code == 304 and snapshot is not None:
+        store.touch(snapshot.version)
+        return replace(snapshot, checked_at=time.time())
+
+    with metrics.medir("scrape.parse", game=fuente.game):
+        crudo = parse_table(response.text, fuente)
+    with metrics.medir("scrape.clean", game=fuente.game):
+        df = clean_roster(crudo, fuente.vocabulary)
+    if df.empty:
+        raise ValueError(f"La tabla de personajes de {fuente.name} está vacía")
+
+    if detalles and fuente.details:
+        from crawler import crawl_details
+        with metrics.medir("scrape.crawl", game=fuente.game):
+            df = add_details(df, crawl_details(crudo['Enlace'], url, store))
+
+    with metrics.medir("scrape.save", game=fuente.game):
+        return store.save(
+            df,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            juego=fuente.game,
+        )
+
+
+# -------------------- VARIOS JUEGOS --------------------
+@dataclass
+class Ingestion:
+    """
+    Resultado de revalidar un juego: el snapshot que había, el vigente
+    (None si falló), cuándo empezó, cuánto tardó y el error si lo hubo
+    """
+    source: Source
+    previous: Optional[Snapshot]
+    snapshot: Optional[Snapshot]
+    started: float
+    seconds: float
+    error: Optional[Exception] = None
+
+    @property
+    def result(self):
+        """
+        "error", "nueva" (se publicó una versión) o "304" (sin cambios)
+        """
+        if self.error is not None:
+            return "error"
+        if self.previous is None or self.snapshot.version != self.previous.version:
+            return "nueva"
+        return "304"
+
+
+def _ingerir(store, fuente, anteriores, url, detalles):
+    anterior = anteriores[fuente.game] if anteriores is not None else store.latest(fuente.game)
+    comienzo, inicio = time.time(), time.perf_counter()
+    try:
+        snapshot = refresh_snapshot(store, anterior, url=url, detalles=detalles, fuente=fuente)
+    except Exception as e:
+        return Ingestion(fuente, anterior, None, comienzo, time.perf_counter() - inicio, e)
+    return Ingestion(fuente, anterior, snapshot, comienzo, time.perf_counter() - inicio)
+
+
+def refresh_sources(store, fuentes, anteriores=None, urls=None, detalles=DETALLES, concurrencia=None):
+    """
+    refresh_snapshot de varios juegos a la vez, un hilo por juego: cada wiki
+    es otro host, así que el total tarda lo que el juego más lento y no la
+    suma. anteriores ({juego: snapshot}) evita volver a leerlos del almacén
+    y urls ({juego: url}) reemplaza la página de cada fuente. Un juego que
+    falla no frena a los demás. Devuelve {juego: Ingestion} en el orden de fuentes.
+    """
+    urls = urls or {}
+    with ThreadPoolExecutor(max_workers=concurrencia or max(1, len(fuentes))) as pool:
+        futuros = {
+            fuente.game: pool.submit(_ingerir, store, fuente, anteriores, urls.get(fuente.game), detalles)
+            for fuente in fuentes
+        }
+        return {juego: futuro.result() for juego, futuro in futuros.items()}
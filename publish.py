@@ -0,0 +1,128 @@
+"""
+Publica un snapshot del roster de cada juego sin pasar por la app.
+
+Revalida la página de personajes de cada juego contra su wiki (petición
+condicional si ya hay un snapshot), limpia el roster, recorre las páginas
+de personaje (solo Genshin) y guarda la versión nueva en el almacén. Los
+juegos se scrapean en paralelo. Termina con código 0 si los snapshots
+publicados están al día y 1 si falló el scrape de algún juego (de ese
+sigue publicado el anterior), para correrlo desde cron o un hook de
+despliegue. La app solo lee lo que se publica acá.
+
+También genera las imágenes de static/img que falten (ver assets.py), así
+un checkout nuevo las tiene después del primer despliegue; mientras tanto
+la app muestra las originales del repo o, si no hay, el pie de la imagen.
+
+Uso:
+    python publish.py
+    python publish.py --game genshin --max-age 3600 --store /srv/genshin/roster.sqlite
+"""
+import argparse
+import sys
+import time
+
+import assets
+from metrics import get_metrics
+from pipeline import DETALLES, is_fresh, refresh_sources
+from snapshot_store import SNAPSHOT_PATH, SnapshotStore
+from sources import SOURCES
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrapea las wikis y publica un snapshot del roster de cada juego")
+    parser.add_argument("--store", default=SNAPSHOT_PATH,
+                        help="Archivo SQLite de snapshots (por defecto GENSHIN_SNAPSHOT_PATH o data/roster.sqlite)")
+    parser.add_argument("--game", dest="juegos", action="append", choices=list(SOURCES),
+                        help="Juego a publicar (se puede repetir; por defecto todos)")
+    parser.add_argument("--url", help="Página con la lista de personajes (solo con un único --game; "
+                                      "por defecto la de la wiki del juego)")
+    parser.add_argument("--max-age", type=float, default=0,
+                        help="No scrapear los juegos cuyo último snapshot se revisó hace menos de estos segundos")
+    parser.add_argument("--no-details", dest="detalles", action="store_false", default=DETALLES,
+                        help="No recorrer las páginas de personaje")
+    parser.add_argument("--no-assets", dest="assets", action="store_false",
+                        help="No generar las imágenes que falten en static/img")
+    args = parser.parse_args(argv)
+    juegos = list(dict.fromkeys(args.juegos or SOURCES))
+    if args.url and len(juegos) > 1:
+        parser.error("--url necesita un único --game")
+
+    if args.assets:
+        _generar_assets()
+
+    store = SnapshotStore(args.store)
+    anteriores = {juego: store.latest(juego) for juego in juegos}
+    pendientes = []
+    for juego in juegos:
+        anterior = anteriores[juego]
+        if args.max_age and is_fresh(anterior, args.max_age):
+            print(f"{SOURCES[juego].name}: snapshot v{anterior.version} al día "
+                  f"(revisado hace {time.time() - anterior.checked_at:.0f} s)")
+        else:
+            pendientes.append(SOURCES[juego])
+    if not pendientes:
+        return 0
+
+    previas = {fuente.game: _etapas(fuente.game) for fuente in pendientes}
+    inicio = time.perf_counter()
+    urls = {pendientes[0].game: args.url} if args.url else None
+    ingestas = refresh_sources(store, pendientes, anteriores, urls=urls, detalles=args.detalles)
+
+    fallas = 0
+    for juego, ingesta in ingestas.items():
+        nombre, anterior, snapshot = ingesta.source.name, ingesta.previous, ingesta.snapshot
+        etapas = _etapas(juego, previas[juego])
+        store.log_scrape(ingesta.started, ingesta.seconds, ingesta.result,
+                         snapshot.version if snapshot is not None else None, etapas,
+                         str(ingesta.error) if ingesta.error is not None else None, juego=juego)
+        if ingesta.result == "error":
+            fallas += 1
+            print(f"{nombre}: error al actualizar el roster: {ingesta.error}", file=sys.stderr)
+            if anterior is not None:
+                print(f"{nombre}: sigue publicado el snapshot v{anterior.version}", file=sys.stderr)
+            continue
+        if ingesta.result == "nueva":
+            print(f"{nombre}: publicado el snapshot v{snapshot.version}: "
+                  f"{len(snapshot.df)} personajes en {ingesta.seconds:.1f} s")
+        else:
+            print(f"{nombre}: sin cambios en la wiki, snapshot v{snapshot.version} "
+                  f"revalidado en {ingesta.seconds:.1f} s")
+        print("  " + ", ".join(f"{etapa} {s * 1000:.0f} ms" for etapa, s in etapas.items()))
+
+    if len(ingestas) > 1:
+        print(f"{len(ingestas)} juegos en {time.perf_counter() - inicio:.1f} s")
+    return 1 if fallas else 0
+
+
+def _generar_assets():
+    """
+    Genera los assets que faltan. Si alguno falla la app sigue mostrando su
+    original: se avisa pero no cambia el código de salida.
+    """
+    faltantes = assets.missing()
+    if not faltantes:
+        return
+    _, errores = assets.build_assets(faltantes)
+    for nombre in faltantes:
+        if nombre in errores:
+            print(f"{nombre}: no se pudo generar la imagen ({errores[nombre]})", file=sys.stderr)
+        else:
+            print(f"{nombre}: imagen generada en static/img")
+
+
+def _etapas(juego, previas=None):
+    """
+    Segundos acumulados en cada etapa del scrape del juego (ver
+    pipeline.py), menos los de previas si se pasan
+    """
+    previas = previas or {}
+    return {
+        e["stage"]: e["seconds_sum"] - previas.get(e["stage"], 0.0)
+        for e in get_metrics().etapas()
+        if e["stage"].startswith("scrape.") and e["labels"] == {"game": juego}
+        and e["seconds_sum"] > previas.get(e["stage"], 0.0)
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
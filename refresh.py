@@ -0,0 +1,51 @@
+import threading
+import time
+
+from metrics import get_metrics
+
+# Segundos entre dos consultas al almacén por una versión nueva
+POLL_INTERVAL = 30
+
+
+class SnapshotReader:
+    """
+    Sirve el último snapshot publicado (ver publish.py) sin scrapear nunca.
+    Cada poll_interval segundos consulta el número de la última versión en el
+    almacén y solo la carga si cambió; todas las sesiones comparten el snapshot.
+    """
+
+    def __init__(self, store, poll_interval=POLL_INTERVAL):
+        self.store = store
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        with get_metrics().medir("snapshot.load"):
+            self._snapshot = store.latest()
+        self._last_poll = time.monotonic()
+
+    def current(self):
+        """
+        Devuelve el snapshot vigente, buscando uno nuevo si ya toca
+        """
+        if time.monotonic() - self._last_poll >= self.poll_interval:
+            self._poll(forzar=False)
+        return self._snapshot
+
+    def reload(self):
+        """
+        Busca ya mismo una versión publicada más nueva. Devuelve True si la cargó.
+        """
+        return self._poll(forzar=True)
+
+    def _poll(self, forzar):
+        with self._lock:
+            # Otra sesión pudo haber consultado mientras se esperaba el lock
+            if not forzar and time.monotonic() - self._last_poll < self.poll_interval:
+                return False
+            self._last_poll = time.monotonic()
+            version = self.store.latest_version()
+            actual = self._snapshot
+            if version is None or (actual is not None and actual.version == version):
+                return False
+            with get_metrics().medir("snapshot.load"):
+                self._snapshot = self.store.latest()
+            return True
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+# -------------------- VOCABULARIO --------------------
+ELEMENTOS = ["Anemo", "Cryo", "Dendro", "Electro", "Geo", "Hydro", "Pyro"]
+ARMAS = ["Bow", "Catalyst", "Claymore", "Polearm", "Sword"]
+REGIONES = ["Fontaine", "Inazuma", "Liyue", "Mondstadt", "Natlan", "Nod-Krai", "Snezhnaya", "Sumeru"]
+
+# Vocabulario de Genshin Impact; cada juego declara el suyo en sources.py
+VOCABULARIO = {
+    "Elemento": ELEMENTOS,
+    "Arma": ARMAS,
+    "Región": REGIONES,
+}
+
+# Categoría usada para los datos faltantes de cada columna
+CENTINELA = {
+    "Elemento": "Desconocido",
+    "Arma": "Desconocido",
+    "Región": "Desconocida",
+}
+
+# Columnas opcionales que vienen de la página de cada personaje (crawler.py)
+DETALLES = ["Rareza", "Constelación", "Versión", "Lanzamiento"]
+
+# Valores crudos del scraper que se convierten en el centinela
+VACIOS = {
+    "Elemento": {""},
+    "Arma": {""},
+    "Región": {"", "None"},
+}
+
+
+def _codificar(valores, columna, vacios=(), vocabulario=VOCABULARIO):
+    """
+    Convierte una columna de texto en categórica. La limpieza se hace sobre
+    los valores únicos (unas pocas decenas) y no sobre cada fila.
+    Las categorías son el vocabulario fijo del juego, el centinela y
+    cualquier valor nuevo que traiga la wiki, en orden alfabético.
+    """
+    codigos, unicos = pd.factorize(valores, use_na_sentinel=False)
+    limpios = [str(valor) for valor in unicos]
+    limpios = [CENTINELA[columna] if valor in vacios else valor for valor in limpios]
+
+    categorias = sorted(set(vocabulario.get(columna, ())) | {CENTINELA[columna]} | set(limpios))
+    posicion = {categoria: i for i, categoria in enumerate(categorias)}
+    recodificar = np.array([posicion[valor] for valor in limpios], dtype=np.int32)
+    return pd.Categorical.from_codes(recodificar[codigos], categories=categorias)
+
+
+# -------------------- LIMPIEZA --------------------
+def clean_roster(df, vocabulario=VOCABULARIO):
+    """
+    Normaliza tipos y rellena valores vacíos del roster scrapeado.
+    Elemento, Arma y Región quedan como categóricas con el vocabulario fijo
+    del juego.
+    """
+    return pd.DataFrame({
+        "Nombre": df['Nombre'].astype(str),
+        "Elemento": _codificar(df['Elemento'], "Elemento", VACIOS["Elemento"], vocabulario),
+        "Arma": _codificar(df['Arma'], "Arma", VACIOS["Arma"], vocabulario),
+        "Región": _codificar(df['Región'], "Región", VACIOS["Región"], vocabulario),
+    }, index=df.index)
+
+
+def encode_roster(df, vocabulario=VOCABULARIO):
+    """
+    Codifica como categóricas las columnas de un roster ya limpio
+    (por ejemplo, el leído de un snapshot). Los detalles, si están, se conservan.
+    """
+    encoded = pd.DataFrame({
+        "Nombre": df['Nombre'].astype(str),
+        "Elemento": _codificar(df['Elemento'], "Elemento", vocabulario=vocabulario),
+        "Arma": _codificar(df['Arma'], "Arma", vocabulario=vocabulario),
+        "Región": _codificar(df['Región'], "Región", vocabulario=vocabulario),
+    }, index=df.index)
+    if all(col in df for col in DETALLES):
+        encoded = add_details(encoded, df[DETALLES])
+    return encoded
+
+
+# -------------------- DETALLES --------------------
+def add_details(df, detalles):
+    """
+    Agrega al roster las columnas de DETALLES (mismas filas, mismo orden).
+    Si ningún personaje tiene detalles, el roster queda como estaba.
+    """
+    if detalles[DETALLES].isna().all().all():
+        return df
+    return df.assign(
+        Rareza=pd.array(detalles['Rareza'], dtype="Int8"),
+        **{col: pd.array(detalles[col], dtype="str") for col in DETALLES[1:]},
+    )
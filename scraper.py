@@ -0,0 +1,216 @@
+from io import BytesIO
+
+import pandas as pd
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from http_client import default_client
+from sources import GENSHIN, Href, Icon
+
+# -------------------- CONFIGURACIÓN --------------------
+WIKI_URL = GENSHIN.url
+
+# Columnas crudas que devuelve el parseo de cualquier fuente
+CRUDAS = ["Nombre", "Elemento", "Arma", "Región", "Enlace"]
+
+
+# -------------------- DESCARGA --------------------
+def fetch_characters_page(etag=None, last_modified=None, url=WIKI_URL, client=None):
+    """
+    Descarga la página de personajes de la wiki con el cliente HTTP compartido.
+    Si se pasan los validadores de la última descarga, la petición es
+    condicional y la wiki puede responder 304 sin reenviar el HTML.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    response = (client or default_client()).get(url, headers=headers)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+# -------------------- PARSEO --------------------
+def parse_characters_html(html):
+    """
+    Extrae Nombre, Elemento, Arma, Región y el enlace a la página de cada
+    personaje de la tabla de personajes.
+    Implementación de referencia con BeautifulSoup (construye el árbol completo).
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    # Buscamos la tabla principal
+    tabla = soup.find("table", {"class": "article-table"})
+
+    if not tabla:
+        raise ValueError("No se pudo encontrar la tabla de personajes")
+
+    filas = tabla.find_all("tr")[1:]  # saltamos encabezado
+
+    # Listas para guardar datos
+    nombres, elementos, regiones, armas, enlaces = [], [], [], [], []
+
+    for fila in filas:
+        celdas = fila.find_all("td")
+        if len(celdas) >= 6:
+            # Nombre
+            nombre_tag = celdas[1].find("a")
+            nombre = nombre_tag.text.strip() if nombre_tag else celdas[1].text.strip()
+            enlace = nombre_tag.get("href", "") if nombre_tag else ""
+
+            # Elemento
+            elemento_img = celdas[3].find("img")
+            elemento = ""
+            if elemento_img:
+                elemento = elemento_img.get("alt", "").replace("Icon", "").replace("Element ", "").strip()
+            if not elemento:
+                elemento = celdas[3].text.strip()
+
+            # Arma
+            arma_img = celdas[4].find("img")
+            arma = ""
+            if arma_img:
+                arma = arma_img.get("alt", "").replace("Icon", "").replace("Weapon ", "").strip()
+            if not arma:
+                arma = celdas[4].text.strip()
+
+            # Región
+            region_img = celdas[5].find("img")
+            region = ""
+            if region_img:
+                region = region_img.get("alt", "").replace("Icon", "").strip()
+            if not region:
+                region = celdas[5].text.strip()
+
+            nombres.append(nombre)
+            elementos.append(elemento)
+            armas.append(arma)
+            regiones.append(region)
+            enlaces.append(enlace)
+
+    # Creamos DataFrame limpio
+    return pd.DataFrame({
+        "Nombre": nombres,
+        "Elemento": elementos,
+        "Arma": armas,
+        "Región": regiones,
+        "Enlace": enlaces
+    })
+
+
+def _es_tabla_objetivo(elem, clase):
+    return elem.tag == "table" and clase in (elem.get("class") or "").split()
+
+
+def _texto(elem):
+    return "".join(elem.itertext()).strip()
+
+
+def _limpiar_alt(alts, textos, prefijo=None):
+    """
+    Limpia de una vez los alt de los iconos y usa el texto de la celda
+    cuando el icono no aporta nada
+    """
+    valores = pd.Series(alts, dtype=object).fillna("").str.replace("Icon", "", regex=False)
+    if prefijo:
+        valores = valores.str.replace(prefijo, "", regex=False)
+    valores = valores.str.strip()
+    return valores.where(valores != "", pd.Series(textos, dtype=object)).tolist()
+
+
+def _buscar_tabla(html, clase):
+    """
+    Recorre el HTML en streaming con lxml hasta la primera tabla con la
+    clase: solo se conserva en memoria esa tabla, el resto se descarta al vuelo
+    """
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+
+    dentro = 0
+    for evento, elem in etree.iterparse(BytesIO(html), events=("start", "end"), html=True, encoding="utf-8"):
+        if evento == "start":
+            if dentro or _es_tabla_objetivo(elem, clase):
+                dentro += 1
+            continue
+
+        if dentro:
+            dentro -= 1
+            if dentro == 0:
+                return elem
+        elif len(elem):
+            # Fuera de la tabla: liberar los hijos ya procesados
+            elem.clear(keep_tail=True)
+    return None
+
+
+def _extraer(celda, extractor):
+    """
+    Valor crudo de la celda: texto, href o (alt del icono, texto)
+    """
+    if isinstance(extractor, Icon):
+        img = next(celda.iter("img"), None)
+        return (img.get("alt", "") if img is not None else ""), _texto(celda)
+    if isinstance(extractor, Href):
+        enlace = next(celda.iter("a"), None)
+        return enlace.get("href", "") if enlace is not None else ""
+    enlace = next(celda.iter("a"), None) if extractor.link else None
+    return _texto(enlace if enlace is not None else celda)
+
+
+def parse_table(html, fuente):
+    """
+    Extrae las columnas que declara la fuente (ver sources.py) de su tabla
+    de personajes. Devuelve las columnas de CRUDAS; las que la fuente no
+    declara quedan vacías.
+    """
+    tabla = _buscar_tabla(html, fuente.table_class)
+    if tabla is None:
+        raise ValueError(f"No se pudo encontrar la tabla de personajes de {fuente.name}")
+
+    # Columnas crudas: una lista por columna, limpiadas al final de una vez
+    crudas = {columna: [] for columna in fuente.columns}
+    for fila in list(tabla.iter("tr"))[1:]:  # saltamos encabezado
+        celdas = list(fila.iter("td"))
+        if len(celdas) < fuente.min_cells:
+            continue
+        for columna, extractor in fuente.columns.items():
+            crudas[columna].append(_extraer(celdas[extractor.cell], extractor))
+
+    filas = len(next(iter(crudas.values()), []))
+    datos = {}
+    for columna in CRUDAS:
+        extractor = fuente.columns.get(columna)
+        if extractor is None:
+            datos[columna] = [""] * filas
+        elif isinstance(extractor, Icon):
+            alts, textos = zip(*crudas[columna]) if filas else ((), ())
+            datos[columna] = _limpiar_alt(alts, textos, extractor.prefix)
+        else:
+            datos[columna] = crudas[columna]
+    return pd.DataFrame(datos)
+
+
+def parse_characters_html_lxml(html):
+    """
+    Igual que parse_characters_html pero recorriendo el HTML en streaming con lxml:
+    solo se conserva en memoria la tabla de personajes, el resto se descarta al vuelo.
+    """
+    return parse_table(html, GENSHIN)
+
+
+def scrape_characters(fuente, url=None):
+    """
+    Scrapea la lista de personajes de un juego (url por defecto: la de la fuente)
+    """
+    response = fetch_characters_page(url=url or fuente.url)
+    return parse_table(response.text, fuente)
+
+
+def scrape_genshin_characters(url=WIKI_URL):
+    """
+    Scrapea datos de personajes de Genshin Impact de la wiki
+    """
+    return scrape_characters(GENSHIN, url)
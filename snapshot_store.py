@@ -0,0 +1,635 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from bitmap_index import BitmapIndex
+from cube import RosterCube
+from name_index import NameIndex
+from paging import TablePager
+from roster import DETALLES, add_details, encode_roster
+from sources import GENSHIN, SOURCES, game_vocabulary
+from teams import TeamIndex
+
+# -------------------- CONFIGURACIÓN --------------------
+SNAPSHOT_PATH = os.environ.get("GENSHIN_SNAPSHOT_PATH", os.path.join("data", "roster.sqlite"))
+COLUMNAS = ["Nombre", "Elemento", "Arma", "Región"]
+
+# Columnas de detalle en la tabla roster (nulas si no se recorrieron las páginas)
+TIPOS_DETALLE = {"Rareza": "INTEGER", "Constelación": "TEXT", "Versión": "TEXT", "Lanzamiento": "TEXT"}
+TODAS = COLUMNAS + DETALLES
+
+# Cada cuántas versiones se guarda una copia completa del roster
+CHECKPOINT_EVERY = 30
+
+# El snapshot es uno solo por proceso y lo leen todas las sesiones: con
+# Copy-on-Write (siempre activo desde pandas 3) ninguna pestaña puede
+# modificarlo sin hacerse su propia copia
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+@dataclass
+class Snapshot:
+    """
+    Una versión del roster limpio junto con los validadores HTTP de la página.
+    La columna Juego indica de qué juego es cada fila; juego es None si el
+    snapshot junta la última versión de todos los juegos (ver partition) y
+    versiones tiene la versión de cada juego, en el orden de juegos.
+    Se comparte entre sesiones: el roster y sus índices son de solo lectura.
+    """
+    version: int
+    df: pd.DataFrame
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    checked_at: float
+    juego: Optional[str] = None
+    versiones: tuple = ()
+    _partes: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def juegos(self):
+        """
+        Juegos del snapshot, en el orden de sus filas
+        """
+        return list(self.df['Juego'].cat.categories)
+
+    def partition(self, juego):
+        """
+        Snapshot con solo las filas del juego y sus propios cubo, índices y
+        paginador. Las filas de cada juego son contiguas: el corte se arma en
+        el primer uso y queda guardado, así que filtrar por juego en cada
+        rerun no cuesta nada. Con juego None (o si es el único) es el mismo.
+        """
+        if juego is None or self.juegos == [juego]:
+            return self
+        if juego not in self._partes:
+            codigo = self.juegos.index(juego)
+            inicio, fin = np.searchsorted(self.df['Juego'].cat.codes.to_numpy(), [codigo, codigo + 1])
+            parte = encode_roster(self.df.iloc[inicio:fin].reset_index(drop=True), game_vocabulary(juego))
+            self._partes[juego] = replace(self, df=_con_juego(parte, juego), juego=juego,
+                                          versiones=self.versiones[codigo:codigo + 1])
+        return self._partes[juego]
+
+    @cached_property
+    def cube(self):
+        """
+        Cubo de conteos del snapshot, calculado en el primer uso
+        """
+        return _solo_lectura(RosterCube(self.df))
+
+    @cached_property
+    def index(self):
+        """
+        Índice invertido (bitsets) del snapshot para el Buscador
+        """
+        return _solo_lectura(BitmapIndex(self.df))
+
+    @cached_property
+    def names(self):
+        """
+        Índice de trigramas sobre Nombre para la búsqueda por nombre
+        """
+        return _solo_lectura(NameIndex(self.df['Nombre']))
+
+    @cached_property
+    def pager(self):
+        """
+        Orden y paginación de las tablas en el servidor
+        """
+        return _solo_lectura(TablePager(self.df))
+
+    @cached_property
+    def teams(self):
+        """
+        Códigos enteros del roster para el armador de equipos
+        """
+        return _solo_lectura(TeamIndex(self.df))
+
+
+def _solo_lectura(estructura):
+    """
+    Marca como de solo lectura los arrays de NumPy de una estructura que
+    comparten todas las sesiones (atributos directos o dentro de dicts):
+    escribirlos por error falla en vez de cambiar los datos de todos
+    """
+    for valor in vars(estructura).values():
+        for array in (valor.values() if isinstance(valor, dict) else (valor,)):
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+    return estructura
+
+
+# -------------------- JUEGOS --------------------
+def _con_juego(df, juego):
+    """
+    Agrega (o reemplaza) la columna Juego, categórica con un solo valor
+    """
+    return df.assign(Juego=pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), categories=[juego]))
+
+
+def _orden(juego):
+    """
+    Los juegos registrados van en el orden de SOURCES y el resto al final
+    """
+    return (list(SOURCES).index(juego), "") if juego in SOURCES else (len(SOURCES), juego)
+
+
+def _combinar(partes):
+    """
+    Un solo roster con los de cada juego uno detrás de otro. Las categóricas
+    quedan con las categorías de todos los juegos juntas.
+    """
+    if len(partes) == 1:
+        return partes[0]
+    # Columna por columna: concatenar categóricas distintas pasaría por object
+    columnas = {col: pd.concat([parte[col] for parte in partes], ignore_index=True) for col in ("Nombre",)}
+    for col in ("Elemento", "Arma", "Región"):
+        columnas[col] = union_categoricals([parte[col] for parte in partes], sort_categories=True)
+    df = pd.DataFrame(columnas)
+    if any(col in parte for parte in partes for col in DETALLES):
+        detalles = pd.concat([parte.reindex(columns=DETALLES) for parte in partes], ignore_index=True)
+        df = add_details(df, detalles)
+    return df.assign(Juego=union_categoricals([parte['Juego'] for parte in partes]))
+
+
+# -------------------- HISTORIAL --------------------
+def _claves(df):
+    """
+    Identificador de cada fila entre versiones: el nombre, con #n si se repite
+    """
+    nombres = df['Nombre'].astype(str)
+    if not nombres.duplicated().any():
+        return nombres.to_numpy()
+    repeticion = df.groupby('Nombre', sort=False, observed=True).cumcount()
+    return nombres.where(repeticion == 0, nombres + "#" + repeticion.astype(str)).to_numpy()
+
+
+def _hashes(df):
+    """
+    Hash de cada fila con todos sus valores. Las categóricas se hashean por
+    valor, así que da lo mismo que el roster venga del scraper o del almacén.
+    """
+    return pd.util.hash_pandas_object(df.reindex(columns=TODAS), index=False).to_numpy()
+
+
+def _diff(anterior, nuevo):
+    """
+    Filas de nuevo que no estaban en anterior y filas de anterior que ya no
+    están, comparando (clave, hash). Una fila modificada aparece en las dos.
+    """
+    claves_anterior, claves_nuevo = _claves(anterior), _claves(nuevo)
+    filas_anterior = pd.MultiIndex.from_arrays([claves_anterior, _hashes(anterior)])
+    filas_nuevo = pd.MultiIndex.from_arrays([claves_nuevo, _hashes(nuevo)])
+    altas = ~filas_nuevo.isin(filas_anterior)
+    bajas = ~filas_anterior.isin(filas_nuevo)
+    return (nuevo[altas].assign(clave=claves_nuevo[altas]),
+            anterior[bajas].assign(clave=claves_anterior[bajas]))
+
+
+def _filas(df, columnas=TODAS):
+    """
+    Tuplas con los valores de columnas para SQLite, con None en lugar de NaN/NA
+    """
+    valores = df.reindex(columns=columnas).astype(object)
+    return list(valores.where(valores.notna(), None).itertuples(index=False, name=None))
+
+
+# -------------------- ALMACÉN EN DISCO --------------------
+_SCRAPES = (
+    'SELECT juego AS Juego, inicio AS Inicio, segundos AS Segundos, resultado AS Resultado, '
+    'version AS "Versión", etapas AS Etapas, error AS Error FROM scrapes'
+)
+
+
+class SnapshotStore:
+    """
+    Guarda versiones del roster en SQLite para que un arranque en frío
+    no tenga que volver a scrapear la wiki.
+
+    Cada versión se compara con la anterior y solo se agregan al log de
+    cambios (tabla deltas, nunca se reescribe) las filas nuevas, las que ya
+    no están y, para las modificadas, la fila vieja como baja y la nueva como
+    alta. Cada checkpoint_every versiones se guarda además una copia completa
+    (tabla roster), desde la que se reconstruye cualquier versión posterior.
+
+    Cada juego es una partición (columna juego de snapshots): sus versiones
+    se comparan solo entre sí y tienen su propio log y checkpoints, así que
+    publicar un juego no toca a los demás.
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH, checkpoint_every=CHECKPOINT_EVERY):
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        # Los hilos de este proceso que publican (un juego cada uno) esperan su
+        # turno acá y no en el busy handler de SQLite, que duerme a intervalos
+        # crecientes aunque el lock ya se haya liberado
+        self._escritura = threading.Lock()
+        carpeta = os.path.dirname(path)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    version INTEGER PRIMARY KEY AUTOINCREMENT,
+                    juego TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    checked_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS roster (
+                    version INTEGER NOT NULL,
+                    fila INTEGER NOT NULL,
+                    Nombre TEXT,
+                    Elemento TEXT,
+                    Arma TEXT,
+                    "Región" TEXT,
+                    PRIMARY KEY (version, fila)
+                )
+            """)
+            # Los archivos de antes de tener varios juegos son todos de Genshin
+            if "juego" not in {fila[1] for fila in conn.execute("PRAGMA table_info(snapshots)")}:
+                conn.execute(f"ALTER TABLE snapshots ADD COLUMN juego TEXT NOT NULL DEFAULT '{GENSHIN.game}'")
+            conn.execute("CREATE INDEX IF NOT EXISTS snapshots_juego ON snapshots (juego, version)")
+            # Los archivos creados antes de los detalles no tienen esas columnas
+            existentes = {fila[1] for fila in conn.execute("PRAGMA table_info(roster)")}
+            for columna in DETALLES:
+                if columna not in existentes:
+                    conn.execute(f'ALTER TABLE roster ADD COLUMN "{columna}" {TIPOS_DETALLE[columna]}')
+            detalles = ", ".join(f'"{col}" {TIPOS_DETALLE[col]}' for col in DETALLES)
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS deltas (
+                    version INTEGER NOT NULL,
+                    signo INTEGER NOT NULL,
+                    clave TEXT NOT NULL,
+                    Nombre TEXT,
+                    Elemento TEXT,
+                    Arma TEXT,
+                    "Región" TEXT,
+                    {detalles}
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS deltas_version ON deltas (version, clave)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS paginas (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    hash TEXT NOT NULL,
+                    datos TEXT NOT NULL,
+                    checked_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS scrapes (
+                    juego TEXT NOT NULL,
+                    inicio REAL NOT NULL,
+                    segundos REAL NOT NULL,
+                    resultado TEXT NOT NULL,
+                    version INTEGER,
+                    etapas TEXT NOT NULL,
+                    error TEXT
+                )
+            """)
+            if "juego" not in {fila[1] for fila in conn.execute("PRAGMA table_info(scrapes)")}:
+                conn.execute(f"ALTER TABLE scrapes ADD COLUMN juego TEXT NOT NULL DEFAULT '{GENSHIN.game}'")
+            self._migrar_deltas(conn)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _migrar_deltas(self, conn):
+        """
+        Los archivos anteriores al log guardaban copias completas de las
+        últimas versiones: se conservan como checkpoints y se arma su log
+        """
+        if conn.execute("SELECT 1 FROM deltas LIMIT 1").fetchone() is not None:
+            return
+        anterior = pd.DataFrame(columns=TODAS)
+        for (version,) in conn.execute("SELECT DISTINCT version FROM roster ORDER BY version").fetchall():
+            actual = self._reconstruir(conn, version, GENSHIN.game)
+            self._escribir_deltas(conn, version, *_diff(anterior, actual))
+            anterior = actual
+
+    def _escribir_deltas(self, conn, version, altas, bajas):
+        columnas = ["version", "signo", "clave"] + TODAS
+        nombres = ", ".join(f'"{col}"' for col in columnas)
+        marcas = ", ".join("?" for _ in columnas)
+        for cambios, signo in ((bajas, -1), (altas, 1)):
+            conn.executemany(
+                f"INSERT INTO deltas ({nombres}) VALUES ({marcas})",
+                _filas(cambios.assign(version=version, signo=signo), columnas),
+            )
+
+    def _checkpoint(self, conn, juego, version=None):
+        """
+        Última versión del juego con copia completa (hasta version, si se pasa)
+        """
+        return conn.execute(
+            "SELECT MAX(version) FROM snapshots s WHERE juego = ? AND version <= ? "
+            "AND EXISTS (SELECT 1 FROM roster r WHERE r.version = s.version)",
+            (juego, version if version is not None else float("inf")),
+        ).fetchone()[0]
+
+    def _reconstruir(self, conn, version, juego):
+        """
+        Roster de una versión del juego: su último checkpoint hasta ella más
+        los cambios posteriores del log de ese juego, ordenado por clave. De
+        cada clave cuenta solo el último cambio: si es un alta la fila queda
+        con esos valores, si es una baja desaparece; las claves sin cambios
+        quedan como en el checkpoint.
+        """
+        columnas = ", ".join(f'"{col}"' for col in TODAS)
+        checkpoint = self._checkpoint(conn, juego, version)
+        if checkpoint is None:
+            checkpoint = 0
+            estado = pd.DataFrame(columns=TODAS)
+        else:
+            estado = pd.read_sql_query(
+                f"SELECT {columnas} FROM roster WHERE version = ? ORDER BY fila", conn, params=(checkpoint,)
+            )
+        estado.index = _claves(estado)
+
+        # Dentro de una versión la baja de una fila modificada va antes que su alta
+        deltas = pd.read_sql_query(
+            f"SELECT signo, clave, {columnas} FROM deltas WHERE version > ? AND version <= ? "
+            "AND version IN (SELECT version FROM snapshots WHERE juego = ?) ORDER BY version, signo",
+            conn,
+            params=(checkpoint, version, juego),
+        )
+        if len(deltas):
+            ultimos = deltas.drop_duplicates("clave", keep="last")
+            altas = ultimos[ultimos['signo'] > 0].set_index("clave")[TODAS]
+            estado = pd.concat([estado[~estado.index.isin(deltas['clave'])], altas])
+        estado = estado.sort_index(kind="stable").reset_index(drop=True)
+        return _con_juego(encode_roster(estado, game_vocabulary(juego)), juego)
+
+    def _vigentes(self, conn, momento=None, juego=None):
+        """
+        Metadatos de la última versión de cada juego (o solo del juego)
+        scrapeada hasta momento
+        """
+        condiciones, params = ["fetched_at <= ?"], [momento if momento is not None else float("inf")]
+        if juego is not None:
+            condiciones.append("juego = ?")
+            params.append(juego)
+        return conn.execute(
+            "SELECT version, juego, etag, last_modified, fetched_at, checked_at FROM snapshots "
+            f"WHERE version IN (SELECT MAX(version) FROM snapshots WHERE {' AND '.join(condiciones)} "
+            "GROUP BY juego)",
+            params,
+        ).fetchall()
+
+    def _snapshot(self, conn, metas, juego):
+        """
+        Snapshot de un juego o, con juego None, el de todos: la versión de
+        cada uno con sus filas una detrás de otra (la versión es la mayor)
+        """
+        if not metas:
+            return None
+        metas = sorted(metas, key=lambda meta: _orden(meta[1]))
+        partes = [self._reconstruir(conn, version, de) for version, de, *_ in metas]
+        if len(metas) == 1:
+            version, _, etag, last_modified, fetched_at, checked_at = metas[0]
+            return Snapshot(version, partes[0], etag, last_modified, fetched_at, checked_at, juego, (version,))
+        return Snapshot(
+            max(meta[0] for meta in metas), _combinar(partes), None, None,
+            max(meta[4] for meta in metas), min(meta[5] for meta in metas),
+            versiones=tuple(meta[0] for meta in metas),
+        )
+
+    def latest(self, juego=None):
+        """
+        Devuelve el snapshot más reciente del juego (con juego None, el de
+        todos los juegos juntos) o None si el almacén está vacío
+        """
+        with self._connect() as conn:
+            return self._snapshot(conn, self._vigentes(conn, juego=juego), juego)
+
+    def at(self, momento, juego=None):
+        """
+        Snapshot vigente en el instante momento (timestamp): el último
+        scrapeado hasta entonces de cada juego (o solo del juego). None si
+        todavía no había ninguno.
+        """
+        with self._connect() as conn:
+            return self._snapshot(conn, self._vigentes(conn, momento, juego), juego)
+
+    def versions_at(self, momento=None, juego=None):
+        """
+        Versiones (una por juego, en el orden de los juegos) que forman el
+        snapshot vigente en momento (por defecto, ahora), sin leer el roster
+        """
+        with self._connect() as conn:
+            metas = self._vigentes(conn, momento, juego)
+        return tuple(meta[0] for meta in sorted(metas, key=lambda meta: _orden(meta[1])))
+
+    def by_versions(self, versiones, juego=None):
+        """
+        Snapshot formado por esas versiones (ver versions_at). Su contenido
+        no cambia nunca, así que se puede compartir con la versión como clave.
+        """
+        marcas = ", ".join("?" for _ in versiones)
+        with self._connect() as conn:
+            metas = conn.execute(
+                "SELECT version, juego, etag, last_modified, fetched_at, checked_at FROM snapshots "
+                f"WHERE version IN ({marcas})",
+                list(versiones),
+            ).fetchall()
+            return self._snapshot(conn, metas, juego)
+
+    def latest_version(self):
+        """
+        Número del snapshot más reciente de cualquier juego (None si no hay),
+        sin leer el roster
+        """
+        with self._connect() as conn:
+            return conn.execute("SELECT MAX(version) FROM snapshots").fetchone()[0]
+
+    def save(self, df, etag=None, last_modified=None, juego=GENSHIN.game):
+        """
+        Escribe una nueva versión del roster del juego (ordenada por nombre):
+        sus cambios respecto de la anterior del mismo juego y, si toca, un
+        checkpoint
+        """
+        ahora = time.time()
+        df = df.set_axis(_claves(df)).sort_index(kind="stable").reset_index(drop=True)
+        df = _con_juego(df, juego)
+        with self._escritura, self._connect() as conn:
+            # Nadie más puede publicar entre leer la versión anterior y escribir la nueva
+            conn.execute("BEGIN IMMEDIATE")
+            previa = conn.execute("SELECT MAX(version) FROM snapshots WHERE juego = ?", (juego,)).fetchone()[0]
+            anterior = self._reconstruir(conn, previa, juego) if previa is not None else df.iloc[:0]
+
+            cursor = conn.execute(
+                "INSERT INTO snapshots (juego, etag, last_modified, fetched_at, checked_at) VALUES (?, ?, ?, ?, ?)",
+                (juego, etag, last_modified, ahora, ahora),
+            )
+            version = cursor.lastrowid
+            self._escribir_deltas(conn, version, *_diff(anterior, df))
+
+            # Los números de versión son de todos los juegos: se cuentan las de este
+            checkpoint = self._checkpoint(conn, juego)
+            desde = conn.execute(
+                "SELECT COUNT(*) FROM snapshots WHERE juego = ? AND version > ?", (juego, checkpoint or 0)
+            ).fetchone()[0]
+            if checkpoint is None or desde >= self.checkpoint_every:
+                columnas = ", ".join(f'"{col}"' for col in TODAS)
+                marcas = ", ".join("?" for _ in TODAS)
+                conn.executemany(
+                    f"INSERT INTO roster (version, fila, {columnas}) VALUES ({version}, ?, {marcas})",
+                    [(i, *fila) for i, fila in enumerate(_filas(df))],
+                )
+        return Snapshot(version, df, etag, last_modified, ahora, ahora, juego, (version,))
+
+    def touch(self, version):
+        """
+        Marca un snapshot como revalidado (la wiki respondió 304)
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE snapshots SET checked_at = ? WHERE version = ?",
+                (time.time(), version),
+            )
+
+    # -------------------- CRECIMIENTO --------------------
+    def growth(self, columna, juego=None):
+        """
+        Personajes por valor de columna (p. ej. Elemento o Región) después de
+        cada versión, acumulando las altas y bajas del log sin reconstruir
+        ningún snapshot. Con juego None suma los de todos los juegos.
+        Columnas: version, Fecha, columna, Cantidad.
+        """
+        filtro, params = ("WHERE s.juego = ?", (juego,)) if juego is not None else ("", ())
+        with self._connect() as conn:
+            netos = pd.read_sql_query(
+                f'SELECT d.version, s.fetched_at, d."{columna}" AS valor, SUM(d.signo) AS neto '
+                f'FROM deltas d JOIN snapshots s USING (version) {filtro} GROUP BY d.version, d."{columna}"',
+                conn,
+                params=params,
+            )
+        acumulado = (
+            netos.pivot_table(index=["version", "fetched_at"], columns="valor", values="neto",
+                              aggfunc="sum", fill_value=0)
+            .cumsum()
+            .stack()
+            .rename("Cantidad")
+            .reset_index()
+        )
+        acumulado.insert(1, "Fecha", pd.to_datetime(acumulado.pop("fetched_at"), unit="s"))
+        return acumulado.rename(columns={"valor": columna})
+
+    def changes(self, juego=None):
+        """
+        Altas, bajas y modificaciones de cada versión y el total resultante
+        (del juego o, con juego None, de todos)
+        """
+        filtro, params = ("WHERE s.juego = ?", (juego,)) if juego is not None else ("", ())
+        with self._connect() as conn:
+            resumen = pd.read_sql_query(
+                f"""
+                SELECT s.version, s.fetched_at,
+                       COALESCE(SUM(c.alta AND NOT c.baja), 0) AS Altas,
+                       COALESCE(SUM(c.baja AND NOT c.alta), 0) AS Bajas,
+                       COALESCE(SUM(c.alta AND c.baja), 0) AS Cambios
+                FROM snapshots s LEFT JOIN (
+                    SELECT version, clave, MAX(signo > 0) AS alta, MAX(signo < 0) AS baja
+                    FROM deltas GROUP BY version, clave
+                ) c USING (version)
+                {filtro}
+                GROUP BY s.version ORDER BY s.version
+                """,
+                conn,
+                params=params,
+            )
+        resumen.insert(1, "Fecha", pd.to_datetime(resumen.pop("fetched_at"), unit="s"))
+        resumen["Total"] = (resumen["Altas"] - resumen["Bajas"]).cumsum()
+        return resumen
+
+    # -------------------- REGISTRO DE SCRAPES --------------------
+    def log_scrape(self, inicio, segundos, resultado, version=None, etapas=None, error=None, juego=GENSHIN.game):
+        """
+        Anota el scrape de un juego de publish.py: resultado es "nueva",
+        "304" o "error" y etapas los segundos de cada etapa
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO scrapes (juego, inicio, segundos, resultado, version, etapas, error) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (juego, inicio, segundos, resultado, version, json.dumps(etapas or {}), error),
+            )
+
+    def scrapes(self, limite=20):
+        """
+        Los últimos scrapes anotados, del más reciente al más viejo
+        """
+        with self._connect() as conn:
+            return pd.read_sql_query(
+                f"{_SCRAPES} ORDER BY inicio DESC LIMIT ?",
+                conn,
+                params=(limite,),
+            )
+
+    def last_scrapes(self):
+        """
+        El último scrape anotado de cada juego
+        """
+        with self._connect() as conn:
+            return pd.read_sql_query(
+                f"{_SCRAPES} WHERE rowid IN (SELECT rowid FROM scrapes s WHERE inicio = "
+                "(SELECT MAX(inicio) FROM scrapes WHERE juego = s.juego)) ORDER BY juego",
+                conn,
+            )
+
+    def scrape_counts(self):
+        """
+        Cantidad de scrapes anotados por juego y resultado
+        """
+        with self._connect() as conn:
+            filas = conn.execute("SELECT juego, resultado, COUNT(*) FROM scrapes GROUP BY juego, resultado")
+            return {(juego, resultado): cantidad for juego, resultado, cantidad in filas}
+
+    # -------------------- PÁGINAS DE PERSONAJE --------------------
+    def cached_pages(self, urls):
+        """
+        Última descarga guardada de cada url (url -> fila de la tabla paginas)
+        """
+        with self._connect() as conn:
+            conn.execute("CREATE TEMP TABLE buscadas (url TEXT PRIMARY KEY)")
+            conn.executemany("INSERT OR IGNORE INTO buscadas VALUES (?)", ((url,) for url in urls))
+            filas = conn.execute(
+                "SELECT p.url, p.etag, p.last_modified, p.hash, p.datos, p.checked_at "
+                "FROM paginas p JOIN buscadas USING (url)"
+            ).fetchall()
+        campos = ("url", "etag", "last_modified", "hash", "datos", "checked_at")
+        return {fila[0]: dict(zip(campos, fila)) for fila in filas}
+
+    def save_pages(self, paginas):
+        """
+        Guarda (o reemplaza) varias páginas en una sola transacción
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO paginas (url, etag, last_modified, hash, datos, checked_at) "
+                "VALUES (:url, :etag, :last_modified, :hash, :datos, :checked_at)",
+                paginas,
+            )
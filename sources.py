@@ -0,0 +1,131 @@
+"""
+Fuentes de datos: una por juego.
+
+Cada fuente declara la página con la lista de personajes, cómo encontrar la
+tabla y qué celda de cada fila alimenta cada columna del roster (Nombre,
+Elemento, Arma, Región y el enlace a la página del personaje). Las columnas
+son las mismas para todos los juegos: cada uno mapea a ellas sus propios
+atributos (en Honkai: Star Rail el tipo de combate es el Elemento y la Senda
+el Arma). El parseo está en scraper.py; este módulo no importa nada pesado.
+"""
+from dataclasses import dataclass, field
+
+from roster import VOCABULARIO
+
+
+# -------------------- EXTRACTORES --------------------
+@dataclass(frozen=True)
+class Text:
+    """
+    Texto de la celda; con link=True, el de su primer enlace (si tiene)
+    """
+    cell: int
+    link: bool = False
+
+
+@dataclass(frozen=True)
+class Icon:
+    """
+    alt del primer icono de la celda sin "Icon" ni prefix; si no queda nada,
+    el texto de la celda
+    """
+    cell: int
+    prefix: str = ""
+
+
+@dataclass(frozen=True)
+class Href:
+    """
+    href del primer enlace de la celda
+    """
+    cell: int
+
+
+# -------------------- FUENTES --------------------
+@dataclass(frozen=True)
+class Source:
+    """
+    Adaptador de la lista de personajes de un juego. columns va de columna
+    del roster a extractor; las que falten quedan vacías (el centinela).
+    La tabla es la primera con la clase table_class y solo se leen las filas
+    con al menos min_cells celdas. details indica si la página de cada
+    personaje tiene el infobox que lee crawler.py.
+    """
+    game: str
+    name: str
+    url: str
+    columns: dict
+    table_class: str = "article-table"
+    min_cells: int = 6
+    vocabulary: dict = field(default_factory=dict)
+    details: bool = False
+
+
+GENSHIN = Source(
+    game="genshin",
+    name="Genshin Impact",
+    url="https://genshin-impact.fandom.com/wiki/Characters/List",
+    columns={
+        "Nombre": Text(1, link=True),
+        "Elemento": Icon(3, "Element "),
+        "Arma": Icon(4, "Weapon "),
+        "Región": Icon(5),
+        "Enlace": Href(1),
+    },
+    vocabulary=VOCABULARIO,
+    details=True,
+)
+
+STAR_RAIL = Source(
+    game="starrail",
+    name="Honkai: Star Rail",
+    url="https://honkai-star-rail.fandom.com/wiki/Character/List",
+    columns={
+        "Nombre": Text(1, link=True),
+        "Elemento": Icon(4, "Type "),
+        "Arma": Icon(3, "Path "),
+        "Región": Text(5),
+        "Enlace": Href(1),
+    },
+    vocabulary={
+        "Elemento": ["Fire", "Ice", "Imaginary", "Lightning", "Physical", "Quantum", "Wind"],
+        "Arma": ["Abundance", "Destruction", "Erudition", "Harmony", "Nihility", "Preservation",
+                 "Remembrance", "The Hunt"],
+    },
+)
+
+ZENLESS = Source(
+    game="zenless",
+    name="Zenless Zone Zero",
+    url="https://zenless-zone-zero.fandom.com/wiki/Agent/List",
+    columns={
+        "Nombre": Text(1, link=True),
+        "Elemento": Icon(3, "Attribute "),
+        "Arma": Icon(4, "Specialty "),
+        "Región": Text(5),
+        "Enlace": Href(1),
+    },
+    vocabulary={
+        "Elemento": ["Electric", "Ether", "Fire", "Ice", "Physical"],
+        "Arma": ["Anomaly", "Attack", "Defense", "Rupture", "Stun", "Support"],
+    },
+)
+
+# Juegos registrados, en el orden en que se muestran
+SOURCES = {fuente.game: fuente for fuente in (GENSHIN, STAR_RAIL, ZENLESS)}
+
+
+def game_name(juego):
+    """
+    Nombre para mostrar del juego (el identificador si no está registrado)
+    """
+    fuente = SOURCES.get(juego)
+    return fuente.name if fuente else juego
+
+
+def game_vocabulary(juego):
+    """
+    Vocabulario fijo del juego (vacío si no está registrado)
+    """
+    fuente = SOURCES.get(juego)
+    return fuente.vocabulary if fuente else {}
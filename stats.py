@@ -0,0 +1,174 @@
+import pandas as pd
+
+from roster import CENTINELA
+
+
+# -------------------- INFORMACIÓN DEL DATASET --------------------
+def _observados(cube, columna, filtros=None):
+    """
+    Categorías de la columna con al menos un personaje
+    """
+    serie = cube.serie(columna, filtros)
+    return serie[serie > 0]
+
+
+def resumen_dataset(cube):
+    """
+    Conteos que se muestran en la barra lateral y en Inicio
+    """
+    return {
+        "personajes": cube.total,
+        "elementos": len(_observados(cube, 'Elemento')),
+        "regiones": len(_observados(cube, 'Región')),
+        "armas": len(_observados(cube, 'Arma')),
+    }
+
+
+# -------------------- RESUMEN --------------------
+def _mas_comun(cube, columna):
+    serie = _observados(cube, columna).drop(CENTINELA[columna], errors='ignore')
+    if serie.empty:
+        return None
+    # idxmax devuelve el primero en orden alfabético si hay empate
+    valor = serie.idxmax()
+    return valor, int(serie[valor])
+
+
+def resumen_general(cube):
+    """
+    KPIs y estadísticas detalladas de la pestaña Resumen.
+    Los valores más comunes son tuplas (valor, cantidad) o None.
+    """
+    combinaciones = cube.tabla('Elemento', 'Arma')
+    combinaciones = combinaciones.drop(index=CENTINELA['Elemento'], columns=CENTINELA['Arma'], errors='ignore')
+    combo = None
+    if combinaciones.to_numpy().sum() > 0:
+        elemento, arma = combinaciones.stack().idxmax()
+        combo = (elemento, arma, int(combinaciones.loc[elemento, arma]))
+
+    return {
+        "personajes": cube.total,
+        "elementos": len(_observados(cube, 'Elemento').drop(CENTINELA['Elemento'], errors='ignore')),
+        "regiones": len(_observados(cube, 'Región').drop(CENTINELA['Región'], errors='ignore')),
+        "armas": len(_observados(cube, 'Arma')),
+        "elemento_comun": _mas_comun(cube, 'Elemento'),
+        "region_top": _mas_comun(cube, 'Región'),
+        "arma_comun": _mas_comun(cube, 'Arma'),
+        "combinacion": combo,
+    }
+
+
+# -------------------- ELEMENTOS / REGIONES --------------------
+def opciones_filtro(cube, columna):
+    """
+    Valores conocidos ordenados y el centinela ("Desconocido"/"Desconocida") al final
+    """
+    centinela = CENTINELA[columna]
+    return [valor for valor in _observados(cube, columna).index if valor != centinela] + [centinela]
+
+
+def filas_filtro(indice, columna, valor=None):
+    """
+    Posiciones de las filas cuyo valor en la columna coincide;
+    con valor None, todo el roster (None)
+    """
+    if valor is None:
+        return None
+    return indice.filas(indice.buscar({columna: [valor]}))
+
+
+def conteo(cube, columna, filtros=None):
+    """
+    Cantidad de personajes por valor de la columna, de mayor a menor.
+    filtros ({columna: [valores]}) restringe el conteo, p. ej. a una región.
+    """
+    df_count = _observados(cube, columna, filtros).sort_values(ascending=False, kind='stable')
+    df_count = df_count.reset_index()
+    df_count.columns = [columna, 'Cantidad']
+    return df_count
+
+
+def conteo_cruzado(cube, filas, columnas):
+    """
+    Cantidad de personajes por combinación de dos columnas en formato largo
+    (sin combinaciones vacías), para gráficos de barras apiladas
+    """
+    tabla = cube.tabla(filas, columnas).stack()
+    return tabla[tabla > 0].reset_index(name='Cantidad')
+
+
+# -------------------- COMBINACIONES --------------------
+def tabla_cruzada(cube):
+    """
+    Frecuencia de cada combinación Elemento-Arma (filas: Elemento, columnas: Arma)
+    """
+    cross_tab = cube.tabla('Elemento', 'Arma')
+    return cross_tab.loc[cross_tab.sum(axis=1) > 0, cross_tab.sum(axis=0) > 0]
+
+
+def top_combinaciones(cube, n=10):
+    """
+    Las n combinaciones Elemento-Arma más comunes
+    """
+    combinaciones = cube.tabla('Elemento', 'Arma').stack()
+    combinaciones = combinaciones[combinaciones > 0].reset_index(name='Cantidad')
+    return combinaciones.sort_values('Cantidad', ascending=False).head(n)
+
+
+# -------------------- MAPA --------------------
+def conteo_por_region(cube, regiones):
+    """
+    Cantidad de personajes de cada región pedida
+    """
+    serie = cube.serie('Región')
+    return {region: int(serie.get(region, 0)) for region in regiones}
+
+
+# -------------------- BUSCADOR --------------------
+def valores_observados(cube, columna):
+    """
+    Valores de la columna presentes en el roster, en orden alfabético
+    """
+    return list(_observados(cube, columna).index)
+
+
+def buscar(indice, elementos=None, armas=None, regiones=None):
+    """
+    Selección (bitset) de los filtros del Buscador; una lista vacía no filtra
+    """
+    return indice.buscar({'Elemento': elementos, 'Arma': armas, 'Región': regiones})
+
+
+def buscar_nombre(nombres, indice, seleccion, consulta, limite=50):
+    """
+    Filas de la selección cuyo nombre se parece a la consulta, de mejor a peor,
+    y el bitset con esas mismas filas
+    """
+    filas, _ = nombres.buscar(consulta, limite, seleccion)
+    return filas, indice.desde_filas(filas)
+
+
+def conteo_seleccion(indice, seleccion, columna):
+    """
+    Como conteo(), pero sobre las filas seleccionadas en el Buscador
+    """
+    serie = indice.conteo(seleccion, columna)
+    df_count = serie[serie > 0].sort_values(ascending=False, kind='stable').reset_index()
+    df_count.columns = [columna, 'Cantidad']
+    return df_count
+
+
+def mejores_equipos(equipos, k=10, incluir=(), excluir_regiones=(), pesos=None):
+    """
+    Los k mejores equipos del roster (ver teams.py) como tabla, junto con la
+    búsqueda (cuántos equipos cumplen las restricciones y cuántos se puntuaron)
+    """
+    busqueda = equipos.buscar(k, incluir, excluir_regiones, pesos)
+    tabla = pd.DataFrame({
+        "Equipo": [" · ".join(equipos.nombres[equipo]) for equipo in busqueda.equipos],
+        "Puntaje": busqueda.puntajes,
+        "Resonancia": [", ".join(equipos.resonancias(equipo)) or "-" for equipo in busqueda.equipos],
+        "Elementos": busqueda.elementos,
+        "Armas": busqueda.armas,
+    })
+    return tabla, busqueda
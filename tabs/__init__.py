@@ -0,0 +1,31 @@
+import importlib
+
+import streamlit as st
+
+from metrics import get_metrics
+
+# Módulo de cada pestaña del dashboard
+MODULOS = {
+    "Inicio": "tabs.inicio",
+    "Resumen": "tabs.resumen",
+    "Elementos": "tabs.elementos",
+    "Regiones": "tabs.regiones",
+    "Combinaciones": "tabs.combinaciones",
+    "Mapa": "tabs.mapa",
+    "Buscador": "tabs.buscador",
+    "Historial": "tabs.historial",
+    "Equipos": "tabs.equipos",
+}
+
+
+@st.fragment
+def render_tab(nombre, snapshot):
+    """
+    Dibuja la pestaña. Su módulo (y lo que importa, como plotly) se carga
+    la primera vez que se elige y queda en memoria para los siguientes reruns.
+
+    Es un fragmento: un widget de la pestaña vuelve a correr solo la pestaña
+    (con el mismo snapshot), no dash.py con la barra lateral y el pie.
+    """
+    with get_metrics().medir("tab", tab=nombre):
+        importlib.import_module(MODULOS[nombre]).render(snapshot)
@@ -0,0 +1,108 @@
+import plotly.express as px
+import streamlit as st
+
+from stats import buscar, buscar_nombre, conteo_seleccion, valores_observados
+from tabs.comun import boton_exportar, figura, tabla_paginada
+
+
+# ================== TAB 6 → Buscador ==================
+def render(snapshot):
+    """
+    Pestaña Buscador
+    """
+    cube = snapshot.cube
+
+    st.header("🔍 Buscador de Personajes")
+    st.write("Utiliza los filtros para encontrar personajes específicos:")
+
+    nombre_buscar = st.text_input(
+        "Nombre",
+        placeholder="Ej.: kazuha, raiden, hu tao...",
+        key="search_nombre"
+    )
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        elemento_buscar = st.multiselect(
+            "Elemento(s)", 
+            options=valores_observados(cube, 'Elemento'),
+            default=None,
+            key="search_elem"
+        )
+
+    with col2:
+        arma_buscar = st.multiselect(
+            "Tipo de Arma", 
+            options=valores_observados(cube, 'Arma'),
+            default=None,
+            key="search_arma"
+        )
+
+    with col3:
+        region_buscar = st.multiselect(
+            "Región(es)", 
+            options=valores_observados(cube, 'Región'),
+            default=None,
+            key="search_region"
+        )
+
+    # Aplicar filtros sobre el índice de bitsets del snapshot
+    indice = snapshot.index
+    seleccion = buscar(indice, elemento_buscar, arma_buscar, region_buscar)
+    filas = None
+    if nombre_buscar.strip():
+        # Los nombres se ordenan por parecido dentro de los filtros elegidos
+        filas, seleccion = buscar_nombre(snapshot.names, indice, seleccion, nombre_buscar)
+    total_resultados = indice.contar(seleccion)
+
+    # Mostrar resultados
+    st.subheader(f"🎯 Resultados de la búsqueda: {total_resultados} personajes encontrados")
+
+    if total_resultados > 0:
+        conteo_elementos = conteo_seleccion(indice, seleccion, 'Elemento')
+        conteo_armas = conteo_seleccion(indice, seleccion, 'Arma')
+        conteo_regiones = conteo_seleccion(indice, seleccion, 'Región')
+
+        # Estadísticas de los resultados
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Elementos en resultados", len(conteo_elementos))
+        with col2:
+            st.metric("Armas en resultados", len(conteo_armas))
+        with col3:
+            st.metric("Regiones en resultados", len(conteo_regiones))
+
+        # Mostrar datos: solo se materializa la página visible
+        if filas is None:
+            filas = indice.filas(seleccion)
+        tabla_paginada(snapshot, filas, total_resultados, key="tabla_buscador")
+        boton_exportar(snapshot, filas, "busqueda", key="tabla_buscador")
+
+        # Mostrar distribución de los resultados (una figura por combinación de filtros)
+        filtros_busqueda = (
+            tuple(sorted(elemento_buscar)), tuple(sorted(arma_buscar)),
+            tuple(sorted(region_buscar)), nombre_buscar.strip(),
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            if total_resultados > 1:
+                fig_dist_elem = figura(snapshot, "Buscador", "elementos", lambda: px.pie(
+                    conteo_elementos,
+                    values='Cantidad',
+                    names='Elemento',
+                    title='Distribución de Elementos en Resultados'
+                ), filtros_busqueda)
+                st.plotly_chart(fig_dist_elem, use_container_width=True)
+
+        with col2:
+            if total_resultados > 1:
+                fig_dist_arma = figura(snapshot, "Buscador", "armas", lambda: px.pie(
+                    conteo_armas,
+                    values='Cantidad',
+                    names='Arma',
+                    title='Distribución de Armas en Resultados'
+                ), filtros_busqueda)
+                st.plotly_chart(fig_dist_arma, use_container_width=True)
+    else:
+        st.warning("⚠️ No se encontraron personajes con los filtros seleccionados. Intenta con otros criterios.")
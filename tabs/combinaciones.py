@@ -0,0 +1,61 @@
+import plotly.express as px
+import streamlit as st
+
+from stats import conteo, tabla_cruzada, top_combinaciones
+from tabs.comun import figura
+
+
+# ================== TAB 4 → Combinaciones ==================
+def render(snapshot):
+    """
+    Pestaña Combinaciones
+    """
+    cube = snapshot.cube
+
+    st.header("⚔️ Combinaciones Elemento-Arma")
+
+    # Heatmap de combinaciones
+    st.subheader("🎨 Mapa de Calor - Combinaciones Elemento-Arma")
+
+    def grafico_heatmap():
+        fig_heatmap = px.imshow(
+            tabla_cruzada(cube),
+            title="Frecuencia de Combinaciones Elemento-Arma",
+            color_continuous_scale="purp",
+            aspect="auto"
+        )
+        fig_heatmap.update_xaxes(title="Arma")
+        fig_heatmap.update_yaxes(title="Elemento")
+        return fig_heatmap
+
+    st.plotly_chart(figura(snapshot, "Combinaciones", "heatmap", grafico_heatmap), use_container_width=True)
+
+    # Gráficos de distribución
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("🏹 Distribución de Armas")
+        fig_armas = figura(snapshot, "Combinaciones", "armas", lambda: px.pie(
+            conteo(cube, 'Arma'),
+            values='Cantidad',
+            names='Arma',
+            title='Distribución de Tipos de Armas',
+            color_discrete_sequence=px.colors.qualitative.Pastel
+        ))
+        st.plotly_chart(fig_armas, use_container_width=True)
+
+    with col2:
+        st.subheader("🌈 Distribución de Elementos")
+        fig_elementos = figura(snapshot, "Combinaciones", "elementos", lambda: px.pie(
+            conteo(cube, 'Elemento'),
+            values='Cantidad',
+            names='Elemento',
+            title='Distribución de Elementos',
+            color_discrete_sequence=px.colors.qualitative.Bold
+        ))
+        st.plotly_chart(fig_elementos, use_container_width=True)
+
+    # Tabla de combinaciones más comunes
+    st.subheader("📋 Top 10 Combinaciones Más Comunes")
+    combinaciones = top_combinaciones(cube, 10)
+    st.dataframe(combinaciones, use_container_width=True)
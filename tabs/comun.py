@@ -0,0 +1,137 @@
+import streamlit as st
+
+from assets import image_html, source_file
+from export import FORMATOS, export_bytes, file_name
+from figures import FigureCache
+from metrics import get_metrics
+from paging import TAMANOS_PAGINA, paginas
+from snapshot_store import SnapshotStore
+
+
+# -------------------- TABLAS PAGINADAS --------------------
+@st.fragment
+def tabla_paginada(snapshot, filas, total, key):
+    """
+    Muestra solo la página elegida de las filas (posiciones de df o None
+    para todo el roster). Orden y recorte se hacen en el servidor; cambiar
+    de página u orden vuelve a correr solo la tabla.
+    """
+    pager = snapshot.pager
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    with col1:
+        orden = st.selectbox(
+            "Ordenar por",
+            ["(sin orden)"] + pager.columnas,
+            key=f"{key}_orden"
+        )
+    with col2:
+        descendente = st.toggle("Descendente", key=f"{key}_desc")
+    with col3:
+        tamano = st.selectbox("Filas por página", TAMANOS_PAGINA, key=f"{key}_tamano")
+
+    # Si el resultado se achicó, volver a una página que exista
+    total_paginas = paginas(total, tamano)
+    if st.session_state.get(f"{key}_pagina", 1) > total_paginas:
+        st.session_state[f"{key}_pagina"] = total_paginas
+    with col4:
+        numero = st.number_input("Página", min_value=1, max_value=total_paginas, step=1, key=f"{key}_pagina")
+
+    metrics = get_metrics()
+    with metrics.medir("table.page", table=key):
+        pagina = pager.pagina(filas, numero, tamano, None if orden == "(sin orden)" else orden, descendente)
+    inicio = (numero - 1) * tamano
+    st.caption(f"Mostrando {inicio + 1 if total else 0}–{inicio + len(pagina)} de {total} personajes")
+    # st.dataframe serializa la página a Arrow antes de enviarla
+    with metrics.medir("table.render", table=key):
+        st.dataframe(pagina, use_container_width=True)
+
+
+# -------------------- EXPORTACIÓN --------------------
+@st.fragment
+def boton_exportar(snapshot, filas, nombre, key):
+    """
+    Botón para descargar las filas filtradas (posiciones de df o None para
+    todo el roster) en el formato elegido. El archivo se arma por bloques
+    (ver export.py) recién al apretar el botón y en otro hilo, sin rerun.
+    """
+    col1, col2 = st.columns([1, 3], vertical_alignment="bottom")
+    with col1:
+        formato = st.selectbox(
+            "Exportar como",
+            list(FORMATOS),
+            format_func=lambda formato: FORMATOS[formato].nombre,
+            key=f"{key}_formato"
+        )
+
+    def generar():
+        with get_metrics().medir("export", table=key, format=formato):
+            return export_bytes(snapshot.df, filas, formato)
+
+    with col2:
+        st.download_button(
+            "⬇️ Descargar",
+            data=generar,
+            file_name=file_name(snapshot, nombre, formato),
+            mime=FORMATOS[formato].mime,
+            on_click="ignore",
+            key=f"{key}_descargar"
+        )
+
+
+# -------------------- IMÁGENES --------------------
+def imagen(nombre, caption, sizes="100vw", alternativa=None):
+    """
+    Muestra una imagen local de static/img (ver assets.py) en el tamaño que
+    pida el navegador. Si todavía no se generó, muestra la original cuando es
+    un archivo del repo y, si no, alternativa (o el pie); nunca la URL de origen.
+    """
+    html = image_html(nombre, caption, sizes)
+    original = None if html is not None else source_file(nombre)
+    if html is not None:
+        st.markdown(html, unsafe_allow_html=True)
+    elif original:
+        st.image(original, caption=caption, use_container_width=True)
+    else:
+        st.info(alternativa or caption)
+
+
+# -------------------- ALMACÉN --------------------
+@st.cache_resource
+def get_store():
+    """
+    Almacén de snapshots (historial) compartido por todas las sesiones
+    """
+    return SnapshotStore()
+
+
+@st.cache_resource(max_entries=8)
+def get_past_snapshot(versiones, juego):
+    """
+    Snapshot de una fecha pasada (ver SnapshotStore.versions_at), compartido
+    por todas las sesiones: se reconstruye una vez por proceso y no en cada rerun
+    """
+    return get_store().by_versions(versiones, juego)
+
+
+# -------------------- FIGURAS --------------------
+@st.cache_resource
+def get_figure_cache():
+    """
+    Caché de figuras compartido por todas las sesiones del proceso
+    """
+    return FigureCache()
+
+
+def figura(snapshot, pestana, nombre, construir, filtros=()):
+    """
+    Figura memorizada por (versiones y juego del snapshot, pestaña, nombre,
+    filtros); construir() solo se llama cuando cambia alguno de ellos.
+    Cuenta la versión de cada juego: dos snapshots "Todos" pueden tener la
+    misma versión y juntar versiones distintas de los juegos.
+    """
+    def construir_medido():
+        with get_metrics().medir("figure.build", tab=pestana):
+            return construir()
+
+    versiones = snapshot.versiones or (snapshot.version,)
+    return get_figure_cache().obtener((versiones, snapshot.juego, pestana, nombre, filtros), construir_medido)
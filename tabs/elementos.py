@@ -0,0 +1,81 @@
+import plotly.express as px
+import streamlit as st
+
+from stats import conteo, conteo_cruzado, filas_filtro, opciones_filtro
+from tabs.comun import boton_exportar, figura, tabla_paginada
+
+
+# ================== TAB 2 → Elementos ==================
+@st.fragment
+def personajes_filtrados(snapshot):
+    """
+    Filtro por elemento y su tabla: cambiar el elemento vuelve a correr solo
+    este panel, no los gráficos de la pestaña
+    """
+    df = snapshot.df
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        opciones_elemento = ["Todos"] + opciones_filtro(snapshot.cube, 'Elemento')
+        elemento_seleccionado = st.selectbox(
+            "Filtrar por elemento", 
+            opciones_elemento,
+            key="elem_filter"
+        )
+
+    filas_elemento = filas_filtro(snapshot.index, 'Elemento', None if elemento_seleccionado == "Todos" else elemento_seleccionado)
+    total_elemento = len(df) if filas_elemento is None else len(filas_elemento)
+
+    st.subheader(f"Personajes filtrados ({total_elemento})")
+    tabla_paginada(snapshot, filas_elemento, total_elemento, key="tabla_elementos")
+    boton_exportar(snapshot, filas_elemento, "elementos", key="tabla_elementos")
+
+
+def render(snapshot):
+    """
+    Pestaña Elementos
+    """
+    cube = snapshot.cube
+
+    st.header("🔥 Personajes por Elemento")
+
+    personajes_filtrados(snapshot)
+
+    # Gráficos de elementos
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📊 Cantidad de personajes por elemento")
+
+        def grafico_elementos():
+            fig_elem = px.bar(
+                conteo(cube, 'Elemento'),
+                x='Elemento',
+                y='Cantidad',
+                text='Cantidad',
+                title="Cantidad de personajes por elemento",
+                color='Elemento',
+                color_discrete_sequence=px.colors.qualitative.Bold
+            )
+            fig_elem.update_traces(textposition='outside')
+            return fig_elem
+
+        st.plotly_chart(figura(snapshot, "Elementos", "conteo", grafico_elementos), use_container_width=True)
+
+    with col2:
+        st.subheader("🎯 Distribución de Armas por Elemento")
+
+        # Barras apiladas sobre los conteos del cubo, no sobre las filas
+        def grafico_armas_elemento():
+            return px.bar(
+                conteo_cruzado(cube, 'Elemento', 'Arma'),
+                x='Elemento',
+                y='Cantidad',
+                color='Arma',
+                barmode='stack',
+                title="Armas utilizadas por cada Elemento",
+                color_discrete_sequence=px.colors.qualitative.Set3
+            )
+
+        st.plotly_chart(figura(snapshot, "Elementos", "armas_por_elemento", grafico_armas_elemento), use_container_width=True)
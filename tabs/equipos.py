@@ -0,0 +1,81 @@
+import time
+
+import streamlit as st
+
+from stats import buscar_nombre, mejores_equipos, valores_observados
+from teams import PESOS
+
+# Personajes que ofrece "Incluir sí o sí": los que más se parecen a lo que se
+# escribe o, si el roster es chico, todos
+COINCIDENCIAS = 50
+ROSTER_COMPLETO = 200
+
+
+# ================== TAB 8 → Equipos ==================
+def render(snapshot):
+    """
+    Pestaña Equipos
+    """
+    st.header("👥 Armador de Equipos")
+
+    # Los personajes de juegos distintos no se combinan en un equipo
+    if len(snapshot.juegos) > 1:
+        st.info("Elige un juego en la barra lateral para armar equipos.")
+        return
+
+    st.write("Los mejores equipos de 4 personajes según resonancias, variedad de elementos y armas, y rareza:")
+
+    equipos = snapshot.teams
+    col1, col2, col3 = st.columns([2, 2, 1])
+
+    with col1:
+        consulta = st.text_input(
+            "Buscar personaje",
+            placeholder="Ej.: bennett, xiangling...",
+            key="equipos_buscar"
+        )
+        # Las opciones son posiciones de df: las ya elegidas siguen estando
+        # aunque cambie la búsqueda
+        elegidos = st.session_state.get("equipos_incluir", [])
+        if consulta.strip():
+            filas, _ = buscar_nombre(snapshot.names, snapshot.index, None, consulta, COINCIDENCIAS)
+            opciones = list(dict.fromkeys([*elegidos, *filas.tolist()]))
+        elif len(equipos.nombres) <= ROSTER_COMPLETO:
+            opciones = list(range(len(equipos.nombres)))
+        else:
+            opciones = list(elegidos)
+        incluir = st.multiselect(
+            "Incluir sí o sí",
+            options=opciones,
+            format_func=lambda fila: equipos.nombres[fila],
+            max_selections=4,
+            placeholder="Busca un personaje arriba" if not opciones else "Elige personajes",
+            key="equipos_incluir"
+        )
+
+    with col2:
+        excluir_regiones = st.multiselect(
+            "Excluir región(es)",
+            options=valores_observados(snapshot.cube, 'Región'),
+            default=None,
+            key="equipos_excluir"
+        )
+
+    with col3:
+        k = st.slider("Equipos", 5, 50, 10, key="equipos_k")
+
+    with st.expander("⚖️ Pesos del puntaje"):
+        pesos = {
+            parte: st.slider(parte.capitalize(), 0.0, 4.0, valor, 0.25, key=f"equipos_peso_{parte}")
+            for parte, valor in PESOS.items()
+        }
+
+    inicio = time.perf_counter()
+    tabla, busqueda = mejores_equipos(equipos, k, incluir, excluir_regiones, pesos)
+    milisegundos = (time.perf_counter() - inicio) * 1000
+
+    st.caption(f"Se puntuaron {busqueda.evaluados:,} de {busqueda.posibles:,} equipos posibles en {milisegundos:.0f} ms")
+    if tabla.empty:
+        st.warning("No hay equipos de 4 personajes con esas restricciones.")
+    else:
+        st.dataframe(tabla, hide_index=True, use_container_width=True)
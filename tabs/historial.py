@@ -0,0 +1,63 @@
+from datetime import datetime, time, timezone
+
+import plotly.express as px
+import streamlit as st
+
+from tabs.comun import figura, get_past_snapshot, get_store, tabla_paginada
+
+
+# ================== TAB 7 → Historial ==================
+def render(snapshot):
+    """
+    Pestaña Historial
+    """
+    store = get_store()
+    cambios = store.changes(snapshot.juego)
+
+    st.header("🕰️ Historial del Roster")
+
+    if len(cambios) < 2:
+        st.info("Por ahora hay un solo snapshot publicado; el historial aparece desde el segundo scrape con cambios.")
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Versiones guardadas", len(cambios))
+    with col2:
+        st.metric("Altas", int(cambios['Altas'].sum()))
+    with col3:
+        st.metric("Bajas", int(cambios['Bajas'].sum()))
+    with col4:
+        st.metric("Modificaciones", int(cambios['Cambios'].sum()))
+
+    # Crecimiento calculado desde el log de cambios (sin reconstruir snapshots)
+    col1, col2 = st.columns(2)
+
+    for columna, col in (("Elemento", col1), ("Región", col2)):
+        with col:
+            st.subheader(f"📈 Personajes por {columna.lower()}")
+
+            def grafico_crecimiento(columna=columna):
+                return px.area(
+                    store.growth(columna, snapshot.juego),
+                    x='Fecha',
+                    y='Cantidad',
+                    color=columna,
+                    line_shape='hv',
+                    title=f"Personajes por {columna.lower()} en cada scrape"
+                )
+
+            st.plotly_chart(figura(snapshot, "Historial", columna, grafico_crecimiento), use_container_width=True)
+
+    st.subheader("🧾 Cambios por versión")
+    st.dataframe(cambios, use_container_width=True, hide_index=True)
+
+    # Cualquier fecha pasada: checkpoint anterior más los cambios del log
+    st.subheader("⏪ El roster en una fecha")
+    primera, ultima = cambios['Fecha'].min().date(), cambios['Fecha'].max().date()
+    fecha = st.date_input("Fecha (UTC)", value=ultima, min_value=primera, max_value=ultima, key="historial_fecha")
+    versiones = store.versions_at(datetime.combine(fecha, time.max, tzinfo=timezone.utc).timestamp(), snapshot.juego)
+    # La fecha de hoy (la predeterminada) es el snapshot que ya está en memoria
+    pasado = snapshot if versiones == snapshot.versiones else get_past_snapshot(versiones, snapshot.juego)
+
+    st.caption(f"Snapshot v{pasado.version} ({datetime.fromtimestamp(pasado.fetched_at, timezone.utc):%Y-%m-%d %H:%M} UTC)")
+    tabla_paginada(pasado, None, len(pasado.df), key="tabla_historial")
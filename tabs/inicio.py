@@ -0,0 +1,130 @@
+import streamlit as st
+
+from stats import resumen_dataset
+from tabs.comun import imagen
+
+# Ancho en que se muestran las imágenes de cada columna (se apilan en pantallas angostas)
+ANCHO_COL1 = "(min-width: 640px) 66vw, 100vw"
+ANCHO_COL2 = "(min-width: 640px) 33vw, 100vw"
+
+
+# ================== TAB 0 → INICIO ==================
+def render(snapshot):
+    """
+    Pestaña Inicio
+    """
+    info = resumen_dataset(snapshot.cube)
+
+    st.title("🎮 Genshin Impact: Descubre el Mundo de Teyvat")
+    st.markdown("---")
+
+    # Estado para controlar el carrusel
+    if 'carrusel_index' not in st.session_state:
+        st.session_state.carrusel_index = 0
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown(f"""
+        ## 🌟 ¿Qué es Genshin Impact?
+        
+        **Imagina un mundo mágico** donde los elementos controlan el destino, los héroes poseen poderes increíbles 
+        y cada rincón esconde secretos por descubrir. ¡Bienvenido a Teyvat!
+        
+        ### 🎯 ¿Por qué millones de jugadores aman este juego?
+        
+        - **🌍 Mundo abierto inmenso**: Explora paisajes espectaculares desde montañas nevadas hasta desiertos ardientes""")
+                    #imagen
+        imagen("naciones", "Naciones en Teyvat", ANCHO_COL1)
+
+        st.markdown("""
+        - **⚡ Sistema de elementos único**: Combina fuego, agua, electricidad y más para crear reacciones devastadoras""")
+        imagen("reacciones", "Sistema de combate elemental - Combina poderes para efectos únicos", ANCHO_COL1,
+               alternativa="✨ Sistema de combate elemental - Combina poderes para efectos únicos")
+
+        st.markdown("""
+        - **🎭 Personajes memorables**: Más de 70 héroes únicos, cada uno con su propia historia y personalidad
+        """)
+        
+        # Solo una imagen representativa para personajes
+        imagen("heroes", "Algunos de los héroes que encontrarás en tu aventura", ANCHO_COL1,
+               alternativa="👥 Algunos de los héroes que encontrarás en tu aventura")
+
+        st.markdown("""
+        - **💰 Gratuito para jugar**: Una experiencia AAA completamente gratuita""")
+        
+        imagen("version_6", "Nueva version 6.0", ANCHO_COL1)
+
+        
+        st.markdown(f"""
+        ## 📊 ¿Qué descubrirás en este dashboard?
+        
+        - **{info['elementos']} elementos mágicos** - Algunos son más comunes que otros entre los héroes
+        - **{info['regiones']} regiones únicas** - Cada una tiene su propio estilo de personajes y habilidades
+        - **{info['armas']} tipos de armas** - Existen combinaciones secretas entre elementos y armas
+        - **Datos actualizados** - Información en tiempo real directamente de la wiki oficial
+        
+        ### 🚀 Tu aventura comienza aquí
+        
+        **Prepárate para:**
+        - **Revelar patrones ocultos** en el diseño de personajes
+        - **Armar equipos invencibles** basados en datos reales
+        - **Explorar la diversidad** de las naciones de Teyvat
+        - **Descubrir combinaciones únicas** que te darán ventaja en batalla
+        
+        *"Datos actualizados al momento"*
+        """)
+
+    with col2:
+        imagen("mapa_teyvat", "El mundo mágico de Teyvat - Un universo por explorar", ANCHO_COL2)
+        
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; color: white;">
+        <h3 style="color: white; margin-top: 0;">🎁 Datos en Tiempo Real</h3>
+        <p><strong>{info['personajes']}</strong> personajes únicos</p>
+        <p><strong>{info['elementos']}</strong> elementos mágicos</p>
+        <p><strong>{info['regiones']}</strong> regiones por explorar</p>
+        <p><strong>{info['armas']}</strong> tipos de armas diferentes</p>
+        <p style="font-size: 10px; margin: 5px 0 0 0;"></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        **💡 Perfecto para ti si:**
+        - Eres nuevo en Genshin Impact
+        - Quieres entender mejor el juego
+        - Te gustan los datos y estadísticas
+        - Buscas ventajas estratégicas
+        """)
+
+    # Tarjetas de resumen rápido
+    st.markdown("---")
+    st.subheader("🚀 Empieza tu Exploración")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("👥 Personajes", info['personajes'])
+        st.caption("Héroes únicos por descubrir")
+        
+    with col2:
+        st.metric("🌈 Elementos", info['elementos'])
+        st.caption("Poderes mágicos diferentes")
+        
+    with col3:
+        st.metric("🗺️ Regiones", info['regiones'])
+        st.caption("Naciones por explorar")
+        
+    with col4:
+        st.metric("⚔️ Armas", info['armas'])
+        st.caption("Estilos de combate únicos")
+
+    # Llamada a la acción
+    st.markdown("---")
+    st.success("""
+    **🎯 ¿Listo para comenzar?** 
+    Usa el menú lateral para explorar cada sección. Te recomendamos empezar por **📊 Resumen** 
+    para obtener una visión general del universo de Genshin Impact.
+    
+    **✨ Característica nueva:** Todos los datos se obtienen en tiempo real de la wiki oficial.
+    """)
@@ -0,0 +1,119 @@
+import streamlit as st
+
+from assets import tiles
+from stats import conteo_por_region, filas_filtro
+from tabs.comun import boton_exportar, imagen, tabla_paginada
+
+try:
+    from tabs.visor_mapa import visor_mapa
+except ImportError:
+    # Streamlit sin st.components.v2: se muestra el mapa como imagen fija
+    visor_mapa = None
+
+MAPA_HOYOLAB_URL = "https://act.hoyolab.com/ys/app/interactive-map/index.html?lang=es-es#/map/2?shown_types=&center=1886.00,-2221.00&zoom=-3.00"
+
+# Color de cada región y su contorno aproximado sobre teyvat_map.png, en
+# píxeles de la imagen original (2252 x 1331)
+COORDENADAS_TEYVAT = {
+    'Mondstadt': {'color': "#b45817", 'contorno': [
+        (1520, 300), (1650, 270), (1840, 290), (1880, 420), (1860, 510), (1760, 560), (1640, 540), (1540, 470)]},
+    'Liyue': {'color': "#ffbb4d", 'contorno': [
+        (1330, 520), (1540, 470), (1640, 540), (1640, 640), (1560, 700), (1500, 780), (1420, 860), (1330, 850),
+        (1300, 700)]},
+    'Inazuma': {'color': "#cc5de8", 'contorno': [
+        (1650, 1000), (1800, 950), (1950, 880), (2020, 820), (2140, 820), (2140, 1130), (2000, 1150), (1950, 1260),
+        (1850, 1250), (1650, 1060)]},
+    'Sumeru': {'color': "#45e321", 'contorno': [
+        (930, 520), (1020, 430), (1110, 440), (1240, 540), (1330, 520), (1300, 700), (1330, 850), (1280, 900),
+        (1160, 940), (1100, 1010), (970, 990), (960, 880), (900, 700)]},
+    'Fontaine': {'color': "#29baef", 'contorno': [
+        (1080, 90), (1200, 60), (1330, 100), (1380, 210), (1520, 290), (1540, 470), (1420, 500), (1330, 520),
+        (1240, 520), (1120, 450), (1090, 300)]},
+    'Natlan': {'color': "#fe6767", 'contorno': [
+        (600, 640), (780, 600), (880, 640), (960, 720), (900, 800), (820, 880), (700, 960), (540, 950), (510, 860),
+        (560, 760)]},
+    'Snezhnaya': {'color': "#f03e8e", 'contorno': [
+        (1330, 0), (1760, 0), (1770, 200), (1650, 260), (1520, 290), (1400, 200)]},
+    'Nod-Krai': {'color': "#1a1fa7", 'contorno': [
+        (890, 150), (930, 60), (950, 0), (1130, 0), (1110, 100), (1060, 220), (960, 220)]},
+    'Desconocida': {'color': '#868e96'},
+}
+
+
+# ================== TAB 5 → Mapa ==================
+def render(snapshot):
+    """
+    Pestaña Mapa
+    """
+    cube = snapshot.cube
+
+    st.header("🌍 Mapa Interactivo de Teyvat")
+    st.info("""
+    **🗺️ Mapa de Teyvat** - Acerca con la rueda del mouse o los botones y arrastra para moverte.
+    Pasa el mouse sobre una región para ver cuántos personajes tiene y haz clic para ver su lista
+    (otro clic en la misma región la deselecciona).
+    """)
+
+    mosaicos = tiles("mapa_teyvat")
+    if visor_mapa is None or mosaicos is None:
+        # Sin st.components.v2 o sin los mosaicos generados (python assets.py): imagen fija
+        imagen("mapa_teyvat", "El mundo de Teyvat")
+        region_elegida = None
+    else:
+        conteos_region = conteo_por_region(cube, COORDENADAS_TEYVAT.keys())
+        elementos_region = cube.tabla('Región', 'Elemento')
+        regiones = []
+        for region, datos in COORDENADAS_TEYVAT.items():
+            if 'contorno' not in datos:
+                continue
+            elementos = elementos_region.loc[region] if region in elementos_region.index else None
+            detalle = "" if elementos is None else ", ".join(
+                f"{elemento} {cantidad}" for elemento, cantidad in elementos[elementos > 0].nlargest(3).items()
+            )
+            regiones.append({
+                "nombre": region,
+                "color": datos['color'],
+                "puntos": datos['contorno'],
+                "personajes": conteos_region[region],
+                "detalle": detalle,
+            })
+        region_elegida = visor_mapa(mosaicos, regiones, key="mapa_visor")
+
+    st.caption(f"¿Buscas materiales o secretos? [Mapa interactivo oficial de Hoyolab]({MAPA_HOYOLAB_URL})")
+
+    if region_elegida:
+        # Las filas salen del índice de bitsets, sin recorrer el roster
+        filas_region = filas_filtro(snapshot.index, 'Región', region_elegida)
+        st.subheader(f"👥 Personajes de {region_elegida} ({len(filas_region)})")
+        tabla_paginada(snapshot, filas_region, len(filas_region), key="tabla_mapa")
+        boton_exportar(snapshot, filas_region, "region", key="tabla_mapa")
+
+    # Información adicional sobre las regiones
+    st.subheader("🏞️ Información de las Regiones")
+
+    region_info = {
+        'Mondstadt': "Ciudad de la Libertad y el viento",
+        'Liyue': "Puerto próspero gobernado por los Adeptus",
+        'Inazuma': "Nación del trueno y la eternidad",
+        'Sumeru': "Tierra de la sabiduría y los arcontes de la sabiduría",
+        'Fontaine': "Nación de la justicia y el agua",
+        'Natlan': "Tierra del fuego y la guerra (por venir)",
+        'Snezhnaya': "Nación del frío y los Fatui",
+        'Nod-Krai': "Región misteriosa por explorar",
+        'Desconocida': "Orígenes aún por descubrir"
+    }
+
+    # Mostrar información en tarjetas
+    conteos_region = conteo_por_region(cube, region_info.keys())
+    cols = st.columns(3)
+    for idx, (region, descripcion) in enumerate(region_info.items()):
+        with cols[idx % 3]:
+            count = conteos_region[region]
+            st.markdown(f"""
+            <div style="border-left: 4px solid {COORDENADAS_TEYVAT.get(region, {}).get('color', '#666')}; 
+                        padding: 10px; margin: 5px 0; background: white; border-radius: 5px;">
+                <h5 style="margin: 0; color: {COORDENADAS_TEYVAT.get(region, {}).get('color', '#666')};">{region}</h5>
+                <p style="margin: 5px 0; font-size: 12px;">{descripcion}</p>
+                <p style="margin: 0; font-weight: bold;">{count} personajes</p>
+            </div>
+            """, unsafe_allow_html=True)
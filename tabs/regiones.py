@@ -0,0 +1,71 @@
+import plotly.express as px
+import streamlit as st
+
+from stats import conteo, filas_filtro, opciones_filtro
+from tabs.comun import boton_exportar, figura, tabla_paginada
+
+
+# ================== TAB 3 → Regiones ==================
+def render(snapshot):
+    """
+    Pestaña Regiones
+    """
+    df = snapshot.df
+    cube = snapshot.cube
+
+    st.header("🗺️ Personajes por Región")
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        opciones_region = ["Todas"] + opciones_filtro(cube, 'Región')
+        region_seleccionada = st.selectbox(
+            "Filtrar por región", 
+            opciones_region,
+            key="region_filter"
+        )
+
+    filas_region = filas_filtro(snapshot.index, 'Región', None if region_seleccionada == "Todas" else region_seleccionada)
+    total_region = len(df) if filas_region is None else len(filas_region)
+
+    st.subheader(f"Personajes filtrados ({total_region})")
+    tabla_paginada(snapshot, filas_region, total_region, key="tabla_regiones")
+    boton_exportar(snapshot, filas_region, "regiones", key="tabla_regiones")
+
+    # Gráficos de regiones
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("🏔️ Cantidad de personajes por región")
+
+        def grafico_regiones():
+            fig_region = px.bar(
+                conteo(cube, 'Región'),
+                x='Región',
+                y='Cantidad',
+                text='Cantidad',
+                title="Cantidad de personajes por región",
+                color='Región'
+            )
+            fig_region.update_traces(textposition='outside')
+            fig_region.update_xaxes(tickangle=45)
+            return fig_region
+
+        st.plotly_chart(figura(snapshot, "Regiones", "conteo", grafico_regiones), use_container_width=True)
+
+    with col2:
+        st.subheader(f"🔥 Elementos en {region_seleccionada}")
+        filtro_region = None if region_seleccionada == "Todas" else {'Región': [region_seleccionada]}
+
+        def grafico_elemento_region():
+            return px.pie(
+                conteo(cube, 'Elemento', filtro_region),
+                values='Cantidad',
+                names='Elemento',
+                title=f"Distribución de elementos en {region_seleccionada}",
+                color='Elemento',
+                color_discrete_sequence=px.colors.qualitative.Bold
+            )
+
+        fig_elemento_region = figura(snapshot, "Regiones", "elementos", grafico_elemento_region, (region_seleccionada,))
+        st.plotly_chart(fig_elemento_region, use_container_width=True)
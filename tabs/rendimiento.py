@@ -0,0 +1,55 @@
+import pandas as pd
+import streamlit as st
+
+from metrics import get_metrics, rss_bytes
+from tabs.comun import get_figure_cache, get_store
+
+
+# ================== PANEL DE RENDIMIENTO ==================
+def render(snapshot):
+    """
+    Panel de rendimiento en la barra lateral: tiempos por etapa de todas las
+    sesiones del proceso, caché de figuras, memoria, últimos scrapes y exportación
+    """
+    metrics = get_metrics()
+    etapas = pd.DataFrame([
+        {
+            "Etapa": etapa["stage"],
+            "Detalle": ", ".join(map(str, etapa["labels"].values())),
+            "N": etapa["count"],
+            "p50 ms": etapa["seconds_p50"] * 1000,
+            "p95 ms": etapa["seconds_p95"] * 1000,
+            "Media ms": etapa["seconds_mean"] * 1000,
+        }
+        for etapa in metrics.etapas()
+    ])
+    cache = get_figure_cache()
+    scrapes = get_store().scrapes(limite=5)
+    scrapes['Inicio'] = pd.to_datetime(scrapes['Inicio'], unit="s").dt.strftime("%Y-%m-%d %H:%M")
+
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("### 🛠️ Rendimiento")
+        st.caption("Tiempos de todas las sesiones desde que arrancó el proceso (p50/p95 estimados por bucket)")
+        st.dataframe(etapas, hide_index=True, use_container_width=True,
+                     column_config={col: st.column_config.NumberColumn(format="%.1f")
+                                    for col in ("p50 ms", "p95 ms", "Media ms")})
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Figuras en caché", f"{cache.hits} / {cache.misses}", help="Aciertos / fallos")
+        with col2:
+            st.metric("Memoria (RSS)", f"{rss_bytes() / 2**20:.0f} MiB")
+
+        st.markdown("**Últimos scrapes**")
+        if scrapes.empty:
+            st.caption("Todavía no se registró ningún scrape (ver publish.py).")
+        else:
+            st.dataframe(scrapes[['Inicio', 'Juego', 'Segundos', 'Resultado', 'Versión']], hide_index=True,
+                         use_container_width=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("Prometheus", metrics.prometheus(), file_name="metrics.txt", mime="text/plain")
+        with col2:
+            st.download_button("JSON", metrics.json(), file_name="metrics.json", mime="application/json")
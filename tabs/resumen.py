@@ -0,0 +1,68 @@
+import streamlit as st
+
+from stats import resumen_general
+
+
+# ================== TAB 1 → Resumen Mejorado ==================
+def render(snapshot):
+    """
+    Pestaña Resumen
+    """
+    df = snapshot.df
+    cube = snapshot.cube
+
+    st.header("📊 Resumen General")
+
+    resumen = resumen_general(cube)
+
+    # KPIs en columnas
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total de personajes", resumen['personajes'])
+    with col2:
+        st.metric("Total de elementos", resumen['elementos'])
+    with col3:
+        st.metric("Total de regiones", resumen['regiones'])
+    with col4:
+        st.metric("Total de tipos de arma", resumen['armas'])
+
+     # Estadísticas adicionales
+    st.subheader("📈 Estadísticas Detalladas")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Elemento más común (excluyendo "Desconocido")
+        if resumen['elemento_comun']:
+            elemento_comun, count_elemento = resumen['elemento_comun']
+            st.metric("Elemento más común", f"{elemento_comun} ({count_elemento})")
+        else:
+            st.metric("Elemento más común", "No disponible")
+
+        # Región con más personajes (excluyendo "Desconocida")
+        if resumen['region_top']:
+            region_top, count_region = resumen['region_top']
+            st.metric("Región con más personajes", f"{region_top} ({count_region})")
+        else:
+            st.metric("Región con más personajes", "No disponible")
+
+    with col2:
+        # Arma más común (excluyendo "Desconocido")
+        if resumen['arma_comun']:
+            arma_comun, count_arma = resumen['arma_comun']
+            st.metric("Arma más común", f"{arma_comun} ({count_arma})")
+        else:
+            st.metric("Arma más común", "No disponible")
+
+        # Combinación más frecuente (excluyendo "Desconocido")
+        if resumen['combinacion']:
+            elemento_combo, arma_combo, count_combo = resumen['combinacion']
+            st.metric("Combinación más frecuente", f"{elemento_combo} + {arma_combo} ({count_combo})")
+        else:
+            st.metric("Combinación más frecuente", "No disponible")
+
+    
+    # Vista previa de datos
+    st.subheader("👥 Primeros 10 personajes del dataset")
+    st.dataframe(df.head(10), use_container_width=True)
@@ -0,0 +1,283 @@
+"""
+Visor del mapa con zoom sobre la pirámide de mosaicos de assets.py.
+
+Solo se piden los mosaicos que se ven en el nivel de zoom actual (y el del
+nivel 0 como fondo mientras cargan). Encima se dibujan los contornos de las
+regiones: al pasar el mouse muestran la cantidad de personajes y al hacer
+clic eligen la región, que vuelve a Python como estado del componente.
+"""
+from streamlit.components.v2 import component
+
+CSS = """
+.visor {
+    position: relative;
+    height: 560px;
+    overflow: hidden;
+    background: #1d4a5c;
+    border-radius: 10px;
+    cursor: grab;
+    touch-action: none;
+    user-select: none;
+}
+.visor.arrastrando { cursor: grabbing; }
+.mosaicos { position: absolute; inset: 0; z-index: 0; }
+.mosaicos img { position: absolute; max-width: none; pointer-events: none; }
+.regiones { position: absolute; overflow: visible; pointer-events: none; z-index: 1; }
+.regiones polygon {
+    fill: var(--color);
+    fill-opacity: 0.12;
+    stroke: var(--color);
+    stroke-width: 2;
+    vector-effect: non-scaling-stroke;
+    pointer-events: visiblePainted;
+    cursor: pointer;
+}
+.regiones polygon:hover { fill-opacity: 0.35; }
+.regiones polygon.elegida { fill-opacity: 0.45; stroke: white; stroke-width: 3; }
+.etiqueta {
+    position: absolute;
+    display: none;
+    z-index: 2;
+    padding: 4px 8px;
+    border-radius: 4px;
+    background: rgba(0, 0, 0, 0.75);
+    color: white;
+    font-size: 13px;
+    white-space: nowrap;
+    pointer-events: none;
+}
+.controles { position: absolute; top: 10px; right: 10px; z-index: 2; display: flex; flex-direction: column; gap: 4px; }
+.controles button {
+    width: 32px;
+    height: 32px;
+    border: none;
+    border-radius: 4px;
+    background: white;
+    font-size: 18px;
+    cursor: pointer;
+    box-shadow: 0 1px 4px rgba(0, 0, 0, 0.3);
+}
+"""
+
+JS = """
+// Zoom, desplazamiento y región elegida de cada visor (por key): sobreviven a los reruns
+const vistas = new Map();
+const SVG = "http://www.w3.org/2000/svg";
+const ZOOM_MAXIMO = 4;
+
+function vista(visor) {
+    const { key, mosaicos } = visor.estado;
+    let v = vistas.get(key);
+    if (!v || v.escala === null) {
+        // Todo el mapa a la vista, centrado
+        const escala = Math.min(visor.clientWidth / mosaicos.width, visor.clientHeight / mosaicos.height);
+        v = {
+            ...v,
+            escala,
+            minima: escala,
+            x: (visor.clientWidth - mosaicos.width * escala) / 2,
+            y: (visor.clientHeight - mosaicos.height * escala) / 2,
+        };
+        vistas.set(key, v);
+    }
+    return v;
+}
+
+function dibujar(visor) {
+    const { mosaicos } = visor.estado;
+    if (!visor.clientWidth) return;
+    const v = vista(visor);
+    const ultimo = mosaicos.levels - 1;
+    // Nivel con la resolución justa para la escala en pantalla (el último es la original)
+    const necesario = Math.ceil(Math.log2(v.escala * window.devicePixelRatio) - 1e-9);
+    const nivel = Math.max(0, Math.min(ultimo, ultimo + necesario));
+
+    const capa = visor.querySelector(".mosaicos");
+    const visibles = new Set();
+    for (const z of new Set([0, nivel])) {
+        // Lado de un mosaico del nivel en píxeles de la imagen original
+        const lado = mosaicos.tile_size * 2 ** (ultimo - z);
+        const x0 = Math.max(0, Math.floor(-v.x / v.escala / lado));
+        const x1 = Math.min(Math.ceil(mosaicos.width / lado), Math.ceil((visor.clientWidth - v.x) / v.escala / lado));
+        const y0 = Math.max(0, Math.floor(-v.y / v.escala / lado));
+        const y1 = Math.min(Math.ceil(mosaicos.height / lado), Math.ceil((visor.clientHeight - v.y) / v.escala / lado));
+        for (let x = x0; x < x1; x++) {
+            for (let y = y0; y < y1; y++) {
+                const id = `${z}/${x}-${y}`;
+                visibles.add(id);
+                let img = visor.imagenes.get(id);
+                if (!img) {
+                    img = document.createElement("img");
+                    img.src = `${mosaicos.url}/${id}.webp`;
+                    img.alt = "";
+                    img.draggable = false;
+                    img.style.zIndex = z;
+                    visor.imagenes.set(id, img);
+                    capa.appendChild(img);
+                }
+                const izquierda = Math.floor(v.x + x * lado * v.escala);
+                const arriba = Math.floor(v.y + y * lado * v.escala);
+                img.style.left = `${izquierda}px`;
+                img.style.top = `${arriba}px`;
+                img.style.width = `${Math.ceil(v.x + Math.min(mosaicos.width, (x + 1) * lado) * v.escala) - izquierda}px`;
+                img.style.height = `${Math.ceil(v.y + Math.min(mosaicos.height, (y + 1) * lado) * v.escala) - arriba}px`;
+            }
+        }
+    }
+    for (const [id, img] of visor.imagenes) {
+        if (!visibles.has(id)) {
+            img.remove();
+            visor.imagenes.delete(id);
+        }
+    }
+
+    const svg = visor.querySelector(".regiones");
+    svg.style.left = `${v.x}px`;
+    svg.style.top = `${v.y}px`;
+    svg.style.width = `${mosaicos.width * v.escala}px`;
+    svg.style.height = `${mosaicos.height * v.escala}px`;
+}
+
+function limitar(visor, v) {
+    // Siempre queda a la vista al menos una parte del mapa
+    const { mosaicos } = visor.estado;
+    const margen = 80;
+    v.x = Math.min(visor.clientWidth - margen, Math.max(margen - mosaicos.width * v.escala, v.x));
+    v.y = Math.min(visor.clientHeight - margen, Math.max(margen - mosaicos.height * v.escala, v.y));
+}
+
+function zoom(visor, factor, px, py) {
+    const v = vista(visor);
+    const escala = Math.min(ZOOM_MAXIMO, Math.max(v.minima, v.escala * factor));
+    v.x = px - (px - v.x) * (escala / v.escala);
+    v.y = py - (py - v.y) * (escala / v.escala);
+    v.escala = escala;
+    limitar(visor, v);
+    dibujar(visor);
+}
+
+function elegir(visor, region) {
+    const v = vista(visor);
+    v.region = v.region === region ? null : region;
+    visor.estado.setStateValue("region", v.region);
+    dibujarRegiones(visor);
+}
+
+function dibujarRegiones(visor) {
+    const { mosaicos, regiones } = visor.estado;
+    const v = vista(visor);
+    const svg = visor.querySelector(".regiones");
+    const etiqueta = visor.querySelector(".etiqueta");
+    svg.setAttribute("viewBox", `0 0 ${mosaicos.width} ${mosaicos.height}`);
+    svg.setAttribute("preserveAspectRatio", "none");
+    svg.replaceChildren();
+    for (const region of regiones) {
+        const poligono = document.createElementNS(SVG, "polygon");
+        poligono.setAttribute("points", region.puntos.map((p) => p.join(",")).join(" "));
+        poligono.style.setProperty("--color", region.color);
+        poligono.classList.toggle("elegida", region.nombre === v.region);
+        poligono.addEventListener("pointerenter", () => {
+            etiqueta.textContent = `${region.nombre}: ${region.personajes} personajes${region.detalle ? " · " + region.detalle : ""}`;
+            etiqueta.style.display = "block";
+        });
+        poligono.addEventListener("pointermove", (e) => {
+            const caja = visor.getBoundingClientRect();
+            etiqueta.style.left = `${e.clientX - caja.left + 12}px`;
+            etiqueta.style.top = `${e.clientY - caja.top + 12}px`;
+        });
+        poligono.addEventListener("pointerleave", () => { etiqueta.style.display = "none"; });
+        poligono.addEventListener("click", () => {
+            if (visor.movido < 4) elegir(visor, region.nombre);
+        });
+        svg.appendChild(poligono);
+    }
+}
+
+function iniciar(visor) {
+    visor.imagenes = new Map();
+    visor.movido = 0;
+
+    visor.addEventListener("wheel", (e) => {
+        e.preventDefault();
+        const caja = visor.getBoundingClientRect();
+        zoom(visor, Math.exp(-e.deltaY * 0.0015), e.clientX - caja.left, e.clientY - caja.top);
+    }, { passive: false });
+
+    visor.addEventListener("pointerdown", (e) => {
+        if (e.target.closest("button")) return;
+        let anterior = { x: e.clientX, y: e.clientY };
+        visor.movido = 0;
+        const mover = (e) => {
+            const v = vista(visor);
+            v.x += e.clientX - anterior.x;
+            v.y += e.clientY - anterior.y;
+            visor.movido += Math.abs(e.clientX - anterior.x) + Math.abs(e.clientY - anterior.y);
+            anterior = { x: e.clientX, y: e.clientY };
+            if (visor.movido >= 4) visor.classList.add("arrastrando");
+            limitar(visor, v);
+            dibujar(visor);
+        };
+        const soltar = () => {
+            visor.classList.remove("arrastrando");
+            window.removeEventListener("pointermove", mover);
+            window.removeEventListener("pointerup", soltar);
+        };
+        window.addEventListener("pointermove", mover);
+        window.addEventListener("pointerup", soltar);
+    });
+
+    visor.querySelector(".controles").addEventListener("click", (e) => {
+        const boton = e.target.closest("button");
+        if (!boton) return;
+        const paso = Number(boton.dataset.zoom);
+        if (paso === 0) {
+            vista(visor).escala = null;
+            dibujar(visor);
+        } else {
+            zoom(visor, paso > 0 ? 2 : 0.5, visor.clientWidth / 2, visor.clientHeight / 2);
+        }
+    });
+
+    new ResizeObserver(() => dibujar(visor)).observe(visor);
+}
+
+export default function ({ data, key, parentElement, setStateValue }) {
+    let visor = parentElement.querySelector(".visor");
+    if (!visor) {
+        visor = document.createElement("div");
+        visor.className = "visor";
+        visor.innerHTML = `
+            <div class="mosaicos"></div>
+            <svg class="regiones" xmlns="${SVG}"></svg>
+            <div class="etiqueta"></div>
+            <div class="controles">
+                <button data-zoom="1" title="Acercar">+</button>
+                <button data-zoom="-1" title="Alejar">−</button>
+                <button data-zoom="0" title="Ver todo">⟲</button>
+            </div>`;
+        parentElement.appendChild(visor);
+        visor.estado = { ...data, key, setStateValue };
+        iniciar(visor);
+    }
+    visor.estado = { ...data, key, setStateValue };
+    dibujarRegiones(visor);
+    dibujar(visor);
+}
+"""
+
+_visor = component("visor_mapa", css=CSS, js=JS)
+
+
+def visor_mapa(mosaicos, regiones, key):
+    """
+    Muestra el visor. mosaicos es la pirámide de assets.tiles() y regiones
+    una lista de {nombre, color, puntos (en píxeles de la original),
+    personajes, detalle}. Devuelve la región elegida con un clic o None.
+    """
+    resultado = _visor(
+        data={"mosaicos": mosaicos, "regiones": regiones},
+        key=key,
+        default={"region": None},
+        on_region_change=lambda: None,
+    )
+    return resultado.region
@@ -0,0 +1,273 @@
+"""
+Armador de equipos: los mejores equipos de 4 personajes del roster.
+
+El puntaje de un equipo sale de los elementos y armas de sus integrantes
+(resonancias elementales, variedad de elementos y de armas) y de su rareza.
+Con el roster real hay millones de equipos (C(104, 4) ≈ 4,6 millones): se
+recorren todos por bloques en orden lexicográfico y cada bloque se puntúa
+con NumPy sobre los códigos enteros de las columnas, en varios hilos.
+
+Dos podas no cambian el resultado:
+- Personajes del mismo elemento y arma son intercambiables: de cada tipo
+  basta con los k + r - 1 de mayor rareza (r = lugares libres del equipo);
+  un equipo con otro de ese tipo tiene al menos k equipos mejores.
+- El puntaje máximo posible sale de las composiciones (multiconjuntos de
+  tipos), que son pocas: cuando ya hay k equipos con ese puntaje, los
+  bloques que faltan solo pueden empatar y pierden el desempate por orden.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from math import comb
+
+import numpy as np
+
+from roster import CENTINELA
+
+TAMANO_EQUIPO = 4
+
+# Peso de cada parte del puntaje
+PESOS = {
+    "resonancia": 2.0,  # por resonancia elemental (dos del mismo elemento, o cuatro distintos)
+    "elementos": 1.0,   # por elemento distinto
+    "armas": 0.5,       # por tipo de arma distinto
+    "rareza": 0.25,     # por personaje de 5 estrellas
+}
+
+# Equipos que se puntúan por vez en cada hilo
+FILAS_POR_BLOQUE = 65_536
+
+
+@dataclass(frozen=True)
+class TeamSearch:
+    """
+    Resultado de una búsqueda: los equipos (posiciones de df, de mejor a
+    peor) con su puntaje y desglose, cuántos equipos cumplen las
+    restricciones y cuántos se llegaron a puntuar
+    """
+    equipos: np.ndarray
+    puntajes: np.ndarray
+    resonancias: np.ndarray
+    elementos: np.ndarray
+    armas: np.ndarray
+    posibles: int
+    evaluados: int
+
+
+def _pares_desde(n):
+    """
+    Pares (i < j) de range(n) en orden lexicográfico y, para cada x, dónde
+    empiezan los pares con i >= x
+    """
+    i, j = np.triu_indices(n, 1)
+    pares = np.column_stack([i, j]).astype(np.int32)
+    desde = np.concatenate([[0], np.cumsum(n - 1 - np.arange(n))])
+    return pares, desde
+
+
+def combinaciones(n, r, filas_por_bloque=FILAS_POR_BLOQUE):
+    """
+    Todas las combinaciones de r elementos de range(n) (r <= 4), en orden
+    lexicográfico, por bloques de a lo sumo unas filas_por_bloque filas
+    """
+    if r == 0:
+        yield np.empty((1, 0), dtype=np.int32)
+        return
+    if r == 1:
+        for inicio in range(0, n, filas_por_bloque):
+            yield np.arange(inicio, min(n, inicio + filas_por_bloque), dtype=np.int32)[:, None]
+        return
+    pares, desde = _pares_desde(n)
+    if r == 2:
+        for inicio in range(0, len(pares), filas_por_bloque):
+            yield pares[inicio:inicio + filas_por_bloque]
+        return
+
+    # r = 3: (j, par después de j); r = 4: (i, j, par después de j) para cada i
+    for prefijo in (range(n) if r == 4 else [None]):
+        primero = 0 if prefijo is None else prefijo + 1
+        medios = np.arange(primero, n - 2)
+        cuantos = len(pares) - desde[medios + 1]
+        grupo = np.cumsum(cuantos) // filas_por_bloque
+        for g in np.unique(grupo):
+            js, cs = medios[grupo == g], cuantos[grupo == g]
+            total = int(cs.sum())
+            comienzo = np.repeat(desde[js + 1] - (np.cumsum(cs) - cs), cs)
+            bloque = np.empty((total, r), dtype=np.int32)
+            if prefijo is not None:
+                bloque[:, 0] = prefijo
+            bloque[:, r - 3] = np.repeat(js, cs)
+            bloque[:, r - 2:] = pares[np.arange(total) + comienzo]
+            yield bloque
+
+
+def _primeros(codigos):
+    """
+    Para cada integrante (filas de codigos, uno por columna de equipos), si
+    su valor es conocido (>= 0) y no aparece antes en el equipo
+    """
+    primeros = codigos >= 0
+    for i in range(1, len(codigos)):
+        for j in range(i):
+            primeros[i] &= codigos[i] != codigos[j]
+    return primeros
+
+
+class TeamIndex:
+    """
+    Columnas del roster codificadas como enteros para puntuar equipos:
+    elemento y arma (-1 si se desconocen), región, y 1 para los personajes
+    de 5 estrellas (si el snapshot tiene la columna Rareza).
+    """
+
+    def __init__(self, df):
+        self.nombres = df['Nombre'].to_numpy(dtype=object)
+        self.categorias = {}
+        codigos = {}
+        for col in ("Elemento", "Arma", "Región"):
+            self.categorias[col] = list(df[col].cat.categories)
+            codigos[col] = df[col].cat.codes.to_numpy(np.int16)
+            if col != "Región" and CENTINELA[col] in self.categorias[col]:
+                desconocido = self.categorias[col].index(CENTINELA[col])
+                codigos[col] = np.where(codigos[col] == desconocido, -1, codigos[col]).astype(np.int16)
+        self.elemento = codigos["Elemento"]
+        self.arma = codigos["Arma"]
+        self.region = codigos["Región"]
+        if 'Rareza' in df:
+            self.cinco_estrellas = (df['Rareza'].fillna(0).to_numpy(np.int8) == 5).astype(np.int8)
+        else:
+            self.cinco_estrellas = np.zeros(len(df), dtype=np.int8)
+        # Tipo de cada personaje: (elemento, arma)
+        self.tipo = (self.elemento.astype(np.int32) + 1) * (len(self.categorias["Arma"]) + 1) + self.arma + 1
+
+    def puntuar(self, equipos, pesos=PESOS):
+        """
+        Puntaje de cada fila de equipos (posiciones de df) y su desglose:
+        (puntajes, resonancias, elementos distintos, armas distintas)
+        """
+        # Un integrante por fila: cada comparación es entre dos arrays contiguos
+        elementos = self.elemento[equipos.T]
+        primeros = _primeros(elementos)
+        distintos = primeros.sum(axis=0)
+
+        # Una resonancia por cada elemento conocido repetido; con cuatro
+        # elementos distintos, la de protección
+        repetidos = np.zeros_like(primeros)
+        for i in range(len(elementos)):
+            for j in range(i + 1, len(elementos)):
+                repetidos[i] |= elementos[i] == elementos[j]
+        resonancias = np.where(distintos == TAMANO_EQUIPO, 1, (primeros & repetidos).sum(axis=0))
+
+        variedad_armas = _primeros(self.arma[equipos.T]).sum(axis=0)
+        puntajes = (
+            pesos["resonancia"] * resonancias
+            + pesos["elementos"] * distintos
+            + pesos["armas"] * variedad_armas
+            + pesos["rareza"] * self.cinco_estrellas[equipos.T].sum(axis=0)
+        )
+        return puntajes, resonancias, distintos, variedad_armas
+
+    def _candidatos(self, fijos, excluir_regiones, libres, k):
+        """
+        Personajes que pueden completar el equipo, en orden del roster: sin
+        los fijos ni las regiones excluidas y, de cada tipo, solo los
+        k + libres - 1 primeros por rareza
+        """
+        validos = np.ones(len(self.nombres), dtype=bool)
+        validos[fijos] = False
+        excluidas = [self.categorias["Región"].index(r) for r in excluir_regiones if r in self.categorias["Región"]]
+        if excluidas:
+            validos &= ~np.isin(self.region, excluidas)
+        posibles = np.flatnonzero(validos)
+
+        orden = np.lexsort((posibles, -self.cinco_estrellas[posibles], self.tipo[posibles]))
+        tipos = self.tipo[posibles[orden]]
+        inicio_tipo = np.flatnonzero(np.r_[True, tipos[1:] != tipos[:-1]])
+        rango = np.arange(len(tipos)) - np.repeat(inicio_tipo, np.diff(np.r_[inicio_tipo, len(tipos)]))
+        return np.sort(posibles[orden][rango < k + libres - 1]), len(posibles)
+
+    def _maximo(self, candidatos, fijos, libres, pesos):
+        """
+        Mejor puntaje alcanzable: el del mejor equipo de cada composición
+        (multiconjunto de tipos entre los candidatos)
+        """
+        orden = np.lexsort((candidatos, -self.cinco_estrellas[candidatos], self.tipo[candidatos]))
+        por_tipo = candidatos[orden]
+        tipos, inicio, cantidad = np.unique(self.tipo[por_tipo], return_index=True, return_counts=True)
+
+        # Multiconjuntos de `libres` tipos: combinaciones de range(tipos + libres - 1)
+        # menos su posición. Son pocos (C(tipos + 3, 4) a lo sumo): se puntúan juntos
+        composicion = np.vstack(list(combinaciones(len(tipos) + libres - 1, libres)))
+        composicion -= np.arange(libres, dtype=np.int32)
+        repetido = np.zeros(composicion.shape, dtype=np.int32)
+        for c in range(1, libres):
+            repetido[:, c] = np.where(composicion[:, c] == composicion[:, c - 1], repetido[:, c - 1] + 1, 0)
+        posible = (repetido < cantidad[composicion]).all(axis=1)
+        equipos = por_tipo[inicio[composicion[posible]] + repetido[posible]]
+        equipos = np.hstack([equipos, np.broadcast_to(fijos, (len(equipos), len(fijos)))])
+        return float(self.puntuar(equipos, pesos)[0].max())
+
+    def buscar(self, k=10, incluir=(), excluir_regiones=(), pesos=None, hilos=None):
+        """
+        Los k mejores equipos con los personajes de incluir (posiciones de
+        df) y sin personajes de las regiones excluidas. Los empates se
+        resuelven por orden del roster.
+        """
+        pesos = {**PESOS, **(pesos or {})}
+        fijos = np.unique(np.asarray(incluir, dtype=np.int64))
+        if len(fijos) > TAMANO_EQUIPO:
+            raise ValueError(f"Un equipo tiene {TAMANO_EQUIPO} personajes; se pidieron {len(fijos)} fijos")
+        libres = TAMANO_EQUIPO - len(fijos)
+        candidatos, disponibles = self._candidatos(fijos, excluir_regiones, libres, k)
+        posibles = comb(disponibles, libres)
+        vacio = np.empty(0)
+        if len(candidatos) < libres or k <= 0:
+            return TeamSearch(np.empty((0, TAMANO_EQUIPO), dtype=np.int64), vacio, vacio, vacio, vacio, posibles, 0)
+        maximo = self._maximo(candidatos, fijos, libres, pesos)
+
+        def puntuar_bloque(numero, bloque):
+            equipos = np.hstack([candidatos[bloque], np.broadcast_to(fijos, (len(bloque), len(fijos)))])
+            puntajes = self.puntuar(equipos, pesos)[0]
+            # Los k mejores del bloque; entre empatados, los primeros del bloque
+            if len(puntajes) > k:
+                corte = np.partition(puntajes, len(puntajes) - k)[len(puntajes) - k]
+                mejores = np.flatnonzero(puntajes > corte)
+                mejores = np.sort(np.r_[mejores, np.flatnonzero(puntajes == corte)[:k - len(mejores)]])
+            else:
+                mejores = np.arange(len(puntajes))
+            return puntajes[mejores], np.full(len(mejores), numero), mejores, equipos[mejores]
+
+        bloques = enumerate(combinaciones(len(candidatos), libres))
+        puntajes, numeros, filas = vacio, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        equipos = np.empty((0, TAMANO_EQUIPO), dtype=np.int64)
+        evaluados = 0
+        hilos = hilos or os.cpu_count() or 1
+        with ThreadPoolExecutor(hilos) as pool:
+            while True:
+                tanda = [b for _, b in zip(range(hilos), bloques)]
+                if not tanda:
+                    break
+                for parcial in pool.map(lambda b: puntuar_bloque(*b), tanda):
+                    puntajes = np.r_[puntajes, parcial[0]]
+                    numeros, filas = np.r_[numeros, parcial[1]], np.r_[filas, parcial[2]]
+                    equipos = np.vstack([equipos, parcial[3]])
+                evaluados += sum(len(b) for _, b in tanda)
+                orden = np.lexsort((filas, numeros, -puntajes))[:k]
+                puntajes, numeros, filas, equipos = puntajes[orden], numeros[orden], filas[orden], equipos[orden]
+                # Lo que falta viene después en el orden: a lo sumo empata
+                if len(puntajes) == k and puntajes[-1] >= maximo:
+                    break
+
+        _, resonancias, elementos, armas = self.puntuar(equipos, pesos)
+        return TeamSearch(equipos, puntajes, resonancias, elementos, armas, posibles, evaluados)
+
+    def resonancias(self, equipo):
+        """
+        Elementos con resonancia en el equipo (posiciones de df)
+        """
+        elementos, cantidades = np.unique(self.elemento[equipo], return_counts=True)
+        repetidos = [self.categorias["Elemento"][e] for e, c in zip(elementos, cantidades) if e >= 0 and c > 1]
+        if not repetidos and len(equipo) == TAMANO_EQUIPO and len(elementos) == TAMANO_EQUIPO and elementos.min() >= 0:
+            return ["4 elementos"]
+        return repetidos
+
@@ -0,0 +1,68 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+import api
+from benchmarks.synthetic import synthetic_roster
+from refresh import SnapshotReader
+from snapshot_store import SnapshotStore
+
+
+@pytest.fixture
+def servidor(tmp_path):
+    store = SnapshotStore(str(tmp_path / "roster.sqlite"))
+    store.save(synthetic_roster(500), etag=None, last_modified=None)
+    httpd = api.make_server(SnapshotReader(store), port=0)
+    hilo = threading.Thread(target=httpd.serve_forever, daemon=True)
+    hilo.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get(puerto, ruta):
+    conexion = http.client.HTTPConnection("127.0.0.1", puerto, timeout=10)
+    conexion.request("GET", ruta)
+    respuesta = conexion.getresponse()
+    return respuesta, respuesta.read()
+
+
+def test_responde(servidor):
+    respuesta, cuerpo = get(servidor, "/search?elemento=Pyro&limit=5")
+    assert respuesta.status == 200
+    assert len(json.loads(cuerpo)["rows"]) == 5
+
+
+def test_error_de_la_api(servidor):
+    respuesta, cuerpo = get(servidor, "/nada")
+    assert respuesta.status == 404
+    assert "Ruta desconocida" in json.loads(cuerpo)["error"]
+
+
+def test_excepcion_inesperada_responde_500(servidor, monkeypatch, capsys):
+    def romper(snapshot, params):
+        raise KeyError("columna")
+
+    monkeypatch.setitem(api.CONSULTAS, "/roster", romper)
+    respuesta, cuerpo = get(servidor, "/roster")
+    assert respuesta.status == 500
+    assert respuesta.getheader("Content-Type").startswith("application/json")
+    assert json.loads(cuerpo) == {"error": "Error interno del servidor"}
+    assert "KeyError" in capsys.readouterr().err
+
+    # El servidor sigue respondiendo
+    monkeypatch.undo()
+    assert get(servidor, "/roster?limit=1")[0].status == 200
+
+
+def test_error_durante_la_exportacion_corta_la_respuesta(servidor, monkeypatch, capsys):
+    def bloques(*args, **kwargs):
+        yield b"Nombre\n"
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(api, "export_chunks", bloques)
+    with pytest.raises(http.client.IncompleteRead):
+        get(servidor, "/export?format=csv")
+    assert "disco lleno" in capsys.readouterr().err
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+from PIL import Image
+
+import assets
+
+
+@pytest.fixture
+def static(tmp_path, monkeypatch):
+    """
+    static/img vacío en una carpeta temporal, con un asset del repo y uno remoto
+    """
+    Image.new("RGB", (200, 100), "teal").save(tmp_path / "local.png")
+    destino = tmp_path / "img"
+    monkeypatch.setattr(assets, "RAIZ", str(tmp_path))
+    monkeypatch.setattr(assets, "ASSETS_DIR", str(destino))
+    monkeypatch.setattr(assets, "MANIFEST", str(destino / "manifest.json"))
+    monkeypatch.setattr(assets, "ASSETS", {
+        "local": assets.Asset("local.png", (50, 100), "Local"),
+        "remoto": assets.Asset("https://example.invalid/remoto.jpg", (640,), "Remoto"),
+    })
+    return destino
+
+
+def test_sin_generar_no_enlaza_el_origen(static, capsys):
+    assert assets.missing() == ["local", "remoto"]
+    assert assets.image_html("remoto", "Pie") is None
+    assert assets.image_html("remoto", "Pie") is None
+    assert assets.image_html("local") is None
+    # Se avisa una vez por asset qué hay que correr
+    aviso = capsys.readouterr().err
+    assert aviso.count("remoto no está generado") == 1 and "python assets.py" in aviso
+    assert assets.source_file("local") == os.path.join(assets.RAIZ, "local.png")
+    assert assets.source_file("remoto") is None
+
+
+def test_generado_usa_las_variantes(static):
+    _, errores = assets.build_assets(["local"])
+    assert not errores
+    assert assets.missing() == ["remoto"]
+    html = assets.image_html("local", "Pie")
+    assert "srcset=" in html and "local-50." in html and "local-100." in html
+
+    # Si se borra una variante vuelve a faltar y se muestra la original
+    variante = assets.manifest()["local"]["variants"][0]["file"]
+    os.remove(static / variante)
+    assert "local" in assets.missing()
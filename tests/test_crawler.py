@@ -0,0 +1,84 @@
+import re
+
+import pytest
+
+import crawler
+from benchmarks.fixture_server import FixtureServer
+from crawler import crawl_details
+from http_client import HttpClient
+from snapshot_store import SnapshotStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path / "roster.sqlite"))
+
+
+@pytest.fixture
+def parseos(monkeypatch):
+    """
+    Cuenta las páginas que se parsean
+    """
+    llamadas = []
+    original = crawler.parse_character_page
+
+    def contar(html):
+        llamadas.append(html)
+        return original(html)
+
+    monkeypatch.setattr(crawler, "parse_character_page", contar)
+    return llamadas
+
+
+def cliente(**kwargs):
+    return HttpClient(**{"backoff": 0.01, "jitter": 0, **kwargs})
+
+
+def test_tope_de_concurrencia_por_host(store):
+    with FixtureServer(latencia=0.02) as servidor:
+        enlaces = list(servidor.paginas)
+        detalles = crawl_details(enlaces, servidor.base_url, store, client=cliente(por_host=3), concurrencia=8)
+        assert detalles.attrs["paginas"] == {"nueva": len(enlaces)}
+        assert servidor.max_en_curso == 3
+
+
+def test_304_reutiliza_la_pagina_guardada(store, parseos):
+    with FixtureServer() as servidor:
+        enlaces = list(servidor.paginas)
+        primera = crawl_details(enlaces, servidor.base_url, store, client=cliente())
+        assert len(parseos) == len(enlaces)
+
+        segunda = crawl_details(enlaces, servidor.base_url, store, client=cliente())
+        assert segunda.attrs["paginas"] == {"304": len(enlaces)}
+        assert len(parseos) == len(enlaces)
+        assert segunda.equals(primera)
+        assert segunda["Rareza"].notna().all()
+
+
+def test_mismo_hash_no_vuelve_a_parsear(store, parseos):
+    # Sin ETag ni Last-Modified la página llega entera cada vez
+    with FixtureServer(validadores=False) as servidor:
+        enlaces = list(servidor.paginas)
+        primera = crawl_details(enlaces, servidor.base_url, store, client=cliente())
+
+        cambiada = enlaces[0]
+        servidor.paginas[cambiada] = re.sub(rb'alt="\d Stars"', b'alt="3 Stars"', servidor.paginas[cambiada])
+        segunda = crawl_details(enlaces, servidor.base_url, store, client=cliente())
+
+        assert segunda.attrs["paginas"] == {"igual": len(enlaces) - 1, "nueva": 1}
+        assert len(parseos) == len(enlaces) + 1
+        assert segunda.loc[0, "Rareza"] == 3
+        assert segunda.loc[1:].equals(primera.loc[1:])
+
+
+def test_una_pagina_que_falla_no_corta_el_recorrido(store):
+    with FixtureServer() as servidor:
+        enlaces = list(servidor.paginas)
+        servidor.paginas[enlaces[1]] = ""  # no se puede parsear
+        enlaces = [enlaces[0], enlaces[1], "/wiki/No_existe", None, *enlaces[2:]]
+        detalles = crawl_details(enlaces, servidor.base_url, store, client=cliente())
+
+        assert detalles.attrs["paginas"] == {"nueva": len(enlaces) - 3, "error": 2}
+        assert len(detalles) == len(enlaces)
+        assert detalles.loc[[1, 2, 3]].isna().all().all()
+        assert detalles.drop(index=[1, 2, 3])["Rareza"].notna().all()
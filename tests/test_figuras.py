@@ -0,0 +1,32 @@
+import pandas as pd
+
+from snapshot_store import Snapshot
+from tabs.comun import figura
+
+
+class Figura(dict):
+    """
+    Lo único que FigureCache usa de una figura de Plotly
+    """
+    def to_json(self):
+        return "{}"
+
+
+def snapshot(version, versiones):
+    return Snapshot(version=version, df=pd.DataFrame(), etag=None, last_modified=None,
+                    fetched_at=0.0, checked_at=0.0, versiones=versiones)
+
+
+def test_la_clave_incluye_la_version_de_cada_juego():
+    construidas = []
+
+    def construir():
+        construidas.append(Figura(n=len(construidas) + 1))
+        return construidas[-1]
+
+    # Dos snapshots "Todos" con la misma versión pero otras versiones por juego
+    a, b = snapshot(7, (3, 4)), snapshot(7, (3, 5))
+    assert figura(a, "Test", "clave", construir)["n"] == 1
+    assert figura(b, "Test", "clave", construir)["n"] == 2
+    assert figura(a, "Test", "clave", construir)["n"] == 1
+    assert len(construidas) == 2
@@ -0,0 +1,75 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from benchmarks.fixture_server import FixtureServer
+from http_client import HttpClient
+
+
+def cliente(**kwargs):
+    """
+    Cliente con esperas cortas y sin jitter para que los tiempos sean predecibles
+    """
+    return HttpClient(**{"backoff": 0.01, "jitter": 0, **kwargs})
+
+
+def test_reintenta_5xx_hasta_que_responde():
+    with FixtureServer(fallas=[503, 502, 500]) as servidor:
+        respuesta = cliente().get(servidor.url())
+        assert respuesta.status_code == 200
+        assert "article-table" in respuesta.text
+        assert servidor.peticiones == 4
+
+
+def test_agotados_los_reintentos_devuelve_la_ultima_respuesta():
+    with FixtureServer(fallas=[503] * 3) as servidor:
+        respuesta = cliente(reintentos=2).get(servidor.url())
+        assert respuesta.status_code == 503
+        assert servidor.peticiones == 3
+
+
+def test_respeta_retry_after():
+    # El servidor pide Retry-After: 1 en cada 429
+    with FixtureServer(fallas=[429]) as servidor:
+        inicio = time.perf_counter()
+        respuesta = cliente().get(servidor.url())
+        assert respuesta.status_code == 200
+        assert time.perf_counter() - inicio >= 1
+        assert servidor.peticiones == 2
+
+
+def test_retry_after_acotado_por_backoff_max():
+    with FixtureServer(fallas=[429]) as servidor:
+        inicio = time.perf_counter()
+        assert cliente(backoff_max=0.1).get(servidor.url()).status_code == 200
+        assert time.perf_counter() - inicio < 0.9
+
+
+def test_timeout_de_lectura():
+    with FixtureServer(latencia=2) as servidor:
+        inicio = time.perf_counter()
+        # Sin reintentos, requests envuelve el ReadTimeoutError de urllib3
+        with pytest.raises(requests.exceptions.ConnectionError, match="timed out"):
+            cliente(timeout=(1, 0.2), reintentos=0).get(servidor.url())
+        assert time.perf_counter() - inicio < 1.5
+
+
+def test_reusa_la_conexion_entre_peticiones():
+    with FixtureServer() as servidor:
+        http = cliente()
+        for _ in range(5):
+            assert http.get(servidor.url()).status_code == 200
+        assert servidor.peticiones == 5
+        assert servidor.conexiones == 1
+
+
+def test_tope_de_peticiones_por_host():
+    with FixtureServer(latencia=0.05) as servidor:
+        http = cliente(por_host=3)
+        with ThreadPoolExecutor(max_workers=12) as pool:
+            estados = list(pool.map(lambda _: http.get(servidor.url()).status_code, range(24)))
+        assert estados == [200] * 24
+        assert servidor.max_en_curso == 3
+        assert servidor.conexiones <= 3
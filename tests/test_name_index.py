@@ -0,0 +1,30 @@
+import time
+
+from benchmarks.run import ESCALA_MAXIMA_NOMBRES, _consultas_nombre
+from benchmarks.synthetic import synthetic_roster
+from name_index import NameIndex
+
+
+def tiempo_consultas(tamano, repeticiones=20):
+    """
+    Mejor tiempo de la mezcla de consultas del benchmark sobre un roster sintético
+    """
+    df = synthetic_roster(tamano)
+    indice = NameIndex(df['Nombre'])
+    consultas = _consultas_nombre(df)
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultados = [indice.buscar(consulta) for consulta in consultas]
+        tiempos.append(time.perf_counter() - inicio)
+
+    # El nombre exacto y el mismo con un error encuentran la fila
+    exacto = df['Nombre'].iloc[len(df) // 2]
+    for consulta, (filas, _) in zip(consultas[-2:], resultados[-2:]):
+        assert exacto in df['Nombre'].iloc[filas].tolist(), consulta
+    return min(tiempos)
+
+
+def test_latencia_no_crece_con_el_roster():
+    razon = tiempo_consultas(100_000) / tiempo_consultas(1_000)
+    assert razon < ESCALA_MAXIMA_NOMBRES, f"x{razon:.1f} con 100 veces más filas"
@@ -0,0 +1,99 @@
+import os
+
+import pandas as pd
+import pytest
+
+from benchmarks.fixture_server import FIXTURES
+from scraper import parse_characters_html, parse_characters_html_lxml
+
+ENCABEZADO = "<tr>" + "".join(f"<th>{c}</th>" for c in
+                              ["Icon", "Name", "Quality", "Element", "Weapon", "Region", "Model Type"]) + "</tr>"
+
+
+def pagina(*filas):
+    """
+    Página con una tabla de personajes con el formato de la wiki y las filas dadas
+    """
+    return (
+        "<html><body><table class='otra'><tr><td>a</td></tr></table>"
+        "<table class='article-table sortable'><tbody>"
+        + ENCABEZADO + "".join(filas)
+        + "</tbody></table></body></html>"
+    )
+
+
+def fila(nombre, elemento, arma, region, extra=("Medium",)):
+    return "<tr><td></td>" + "".join(f"<td>{c}</td>" for c in (nombre, "", elemento, arma, region, *extra)) + "</tr>"
+
+
+def icono(alt, texto=""):
+    return f'<a href="/wiki/x"><img alt="{alt}" src="x.png"></a> {texto}'
+
+
+def comparar(html):
+    referencia = parse_characters_html(html)
+    pd.testing.assert_frame_equal(parse_characters_html_lxml(html), referencia)
+    return referencia
+
+
+def test_fixture_de_la_wiki():
+    with open(os.path.join(FIXTURES, "characters_list.html"), encoding="utf-8") as f:
+        html = f.read()
+    df = comparar(html)
+    assert len(df) > 100
+    assert (df["Nombre"] != "").all()
+
+
+@pytest.mark.parametrize("celdas, esperado", [
+    # Iconos normales
+    ((icono("Element Pyro"), icono("Weapon Sword"), icono("Liyue Icon")), ("Pyro", "Sword", "Liyue")),
+    # Sin icono: el texto de la celda
+    (("Hydro", "Catalyst", "Fontaine"), ("Hydro", "Catalyst", "Fontaine")),
+    # alt vacío o solo "Icon": el texto que acompaña al icono
+    ((icono("", "Cryo"), icono("Icon", "Bow"), icono("", "Snezhnaya")), ("Cryo", "Bow", "Snezhnaya")),
+    # Sin icono ni texto
+    (("", "", ""), ("", "", "")),
+])
+def test_celdas_con_y_sin_icono(celdas, esperado):
+    df = comparar(pagina(fila('<a href="/wiki/Kaeya">Kaeya</a>', *celdas)))
+    assert tuple(df.loc[0, ["Elemento", "Arma", "Región"]]) == esperado
+    assert df.loc[0, "Enlace"] == "/wiki/Kaeya"
+
+
+def test_marcado_anidado():
+    nombre = '<span class="n"><a href="/wiki/Hu_Tao"><b>Hu</b> <i>Tao</i></a></span><sup>[1]</sup>'
+    region = '<span><span><a><img alt="Liyue Icon"></a></span></span> <small>Liyue</small>'
+    df = comparar(pagina(fila(nombre, "<div><p>Pyro</p></div>", icono("Weapon Polearm"), region)))
+    assert df.loc[0, "Nombre"] == "Hu Tao"
+    assert tuple(df.loc[0, ["Elemento", "Arma", "Región"]]) == ("Pyro", "Polearm", "Liyue")
+
+
+def test_nombre_sin_enlace():
+    df = comparar(pagina(fila("<b>Viajero</b>", "Anemo", "Sword", "Ninguna")))
+    assert df.loc[0, ["Nombre", "Enlace"]].tolist() == ["Viajero", ""]
+
+
+def test_columnas_de_mas_y_de_menos():
+    html = pagina(
+        fila("Diluc", "Pyro", "Claymore", "Mondstadt", extra=("Tall", "2020-09-28", "x")),
+        # Falta la celda de la región: la fila se descarta
+        "<tr><td></td><td>Sin región</td><td></td><td>Pyro</td><td>Claymore</td></tr>",
+        "<tr><td colspan='7'>Fila de sección</td></tr>",
+        fila("Amber", "Pyro", "Bow", "Mondstadt", extra=()),
+    )
+    df = comparar(html)
+    assert df["Nombre"].tolist() == ["Diluc", "Amber"]
+
+
+def test_sin_tabla():
+    html = "<html><body><table class='otra'><tr><td>x</td></tr></table></body></html>"
+    with pytest.raises(ValueError):
+        parse_characters_html(html)
+    with pytest.raises(ValueError):
+        parse_characters_html_lxml(html)
+
+
+def test_tabla_vacia():
+    df = comparar(pagina())
+    assert df.empty
+    assert list(df.columns) == ["Nombre", "Elemento", "Arma", "Región", "Enlace"]
@@ -0,0 +1,105 @@
+import itertools
+import sqlite3
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+import snapshot_store
+from snapshot_store import COLUMNAS, SnapshotStore
+
+FILAS = {
+    "Amber": ("Pyro", "Bow", "Mondstadt"),
+    "Bennett": ("Pyro", "Sword", "Mondstadt"),
+    "Chongyun": ("Cryo", "Claymore", "Liyue"),
+    "Diluc": ("Pyro", "Claymore", "Mondstadt"),
+    "Eula": ("Cryo", "Claymore", "Mondstadt"),
+}
+
+
+def roster(*nombres, **cambios):
+    """
+    Roster con esas filas de FILAS; cambios reemplaza el elemento de alguna
+    """
+    return pd.DataFrame(
+        [(nombre, cambios.get(nombre, FILAS[nombre][0]), *FILAS[nombre][1:]) for nombre in nombres],
+        columns=COLUMNAS,
+    )
+
+
+def normalizado(df):
+    return df[COLUMNAS].astype(str).sort_values("Nombre").reset_index(drop=True)
+
+
+# Cada versión con sus altas, bajas y cambios esperados
+VERSIONES = [
+    (roster("Amber", "Bennett", "Chongyun", "Diluc"), (4, 0, 0)),
+    # Baja
+    (roster("Amber", "Chongyun", "Diluc"), (0, 1, 0)),
+    # Vuelve la misma clave y cambia una fila
+    (roster("Amber", "Bennett", "Chongyun", "Diluc", Chongyun="Hydro"), (1, 0, 1)),
+    # Sin cambios: con checkpoint_every=3 esta versión es un checkpoint
+    (roster("Amber", "Bennett", "Chongyun", "Diluc", Chongyun="Hydro"), (0, 0, 0)),
+    # Después del checkpoint: un alta y una baja
+    (roster("Amber", "Bennett", "Chongyun", "Diluc", "Eula", Chongyun="Hydro"), (1, 0, 0)),
+    (roster("Bennett", "Chongyun", "Diluc", "Eula", Chongyun="Hydro"), (0, 1, 0)),
+]
+
+
+@pytest.fixture
+def guardado(tmp_path, monkeypatch):
+    """
+    Almacén con las VERSIONES guardadas, un segundo aparte cada una
+    """
+    reloj = itertools.count(1000)
+    monkeypatch.setattr(snapshot_store, "time", SimpleNamespace(time=lambda: next(reloj)))
+    store = SnapshotStore(str(tmp_path / "roster.sqlite"), checkpoint_every=3)
+    snapshots = [store.save(df) for df, _ in VERSIONES]
+    return store, snapshots
+
+
+def test_cada_version_se_reconstruye(guardado):
+    store, snapshots = guardado
+    with sqlite3.connect(store.path) as conn:
+        checkpoints = [fila[0] for fila in conn.execute("SELECT DISTINCT version FROM roster ORDER BY version")]
+    assert checkpoints == [snapshots[0].version, snapshots[3].version]
+
+    assert store.at(snapshots[0].fetched_at - 1) is None
+    for (df, _), snap in zip(VERSIONES, snapshots):
+        esperado = normalizado(df)
+        pd.testing.assert_frame_equal(normalizado(store.at(snap.fetched_at).df), esperado)
+        pd.testing.assert_frame_equal(normalizado(store.by_versions((snap.version,)).df), esperado)
+    pd.testing.assert_frame_equal(normalizado(store.latest().df), normalizado(VERSIONES[-1][0]))
+
+
+@pytest.mark.parametrize("columna", ["Elemento", "Región"])
+def test_crecimiento_igual_a_contar_cada_version(guardado, columna):
+    store, snapshots = guardado
+    crecimiento = store.growth(columna)
+    # La versión sin cambios no tiene filas en el log
+    assert sorted(crecimiento["version"].unique()) == [s.version for i, s in enumerate(snapshots) if i != 3]
+    for version, filas in crecimiento.groupby("version"):
+        cuentas = filas[filas["Cantidad"] > 0].set_index(columna)["Cantidad"]
+        esperado = store.by_versions((version,)).df[columna].astype(str).value_counts()
+        assert cuentas.sort_index().to_dict() == esperado.sort_index().to_dict()
+
+
+def test_cambios_de_cada_version(guardado):
+    store, snapshots = guardado
+    cambios = store.changes()
+    assert cambios["version"].tolist() == [s.version for s in snapshots]
+    assert list(cambios[["Altas", "Bajas", "Cambios"]].itertuples(index=False, name=None)) == \
+        [esperado for _, esperado in VERSIONES]
+    assert cambios["Total"].tolist() == [len(df) for df, _ in VERSIONES]
+
+    # Y las filas del log son exactamente esas
+    with sqlite3.connect(store.path) as conn:
+        log = conn.execute("SELECT version, signo, clave FROM deltas ORDER BY version, signo, clave").fetchall()
+    v = [s.version for s in snapshots]
+    assert log == [
+        (v[0], 1, "Amber"), (v[0], 1, "Bennett"), (v[0], 1, "Chongyun"), (v[0], 1, "Diluc"),
+        (v[1], -1, "Bennett"),
+        (v[2], -1, "Chongyun"), (v[2], 1, "Bennett"), (v[2], 1, "Chongyun"),
+        (v[4], 1, "Eula"),
+        (v[5], -1, "Amber"),
+    ]